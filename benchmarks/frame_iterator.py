@@ -0,0 +1,75 @@
+'''
+Date: 2026.10.18 16:12:05
+Description: Peak memory and throughput of reading decoded frames, run `python -m benchmarks.frame_iterator`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 16:12:05
+'''
+import resource
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from timeit import default_timer
+
+from ffmpeg import input_source, settings
+from ffmpeg.tools import vtools
+
+settings.CUDA_ENABLE = False
+
+RATE = 25
+
+# width, height, seconds, readers; the whole 4K clip would not fit in memory
+CLIPS = [
+    (640, 360, 30, ('read_whole', 'read_frames', 'read_batches', 'read_pooled')),
+    (3840, 2160, 4, ('read_frames', 'read_pooled')),
+]
+
+
+def read_whole(src, width, height):
+    return len(vtools.convert_video_to_np_array(src))
+
+
+def read_frames(src, width, height):
+    return sum(1 for _ in vtools.iter_video_frames(src, width=width, height=height))
+
+
+def read_batches(src, width, height):
+    return sum(len(batch) for batch in vtools.iter_video_frames(src, width=width, height=height, batch_size=32))
+
+
+def read_pooled(src, width, height):
+    pool = vtools.FramePool(2, (height, width, 3))
+    frames = 0
+    for frame in vtools.iter_video_frames(src, width=width, height=height, pool=pool):
+        frames += 1
+        pool.release(frame)
+    return frames
+
+
+def measure(name: str, src: str, width: str, height: str):
+    '''Run in a fresh interpreter, peak memory is per process.'''
+    start = default_timer()
+    frames = globals()[name](src, int(width), int(height))
+    elapsed = default_timer() - start
+    usage = resource.getrusage(resource.RUSAGE_SELF)  # the reader only, ffmpeg is a child
+    cpu = (usage.ru_utime + usage.ru_stime) / frames * 1e3
+    peak = usage.ru_maxrss / 1024  # KiB on Linux
+    print(f'{name:>12}: {frames} frames, {frames / elapsed:.0f} frames/s, '
+          f'reader CPU {cpu:.2f} ms/frame, peak RSS {peak:.0f} MiB')
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 5:
+        measure(*sys.argv[1:])
+        sys.exit()
+
+    with tempfile.TemporaryDirectory() as folder:
+        for width, height, seconds, names in CLIPS:
+            src = str(Path(folder) / f'clip_{height}p.mp4')
+            input_source('testsrc2', size=f'{width}x{height}', rate=RATE, duration=seconds). \
+                output(src, vcodec='libx264', preset='ultrafast').run(print_cmd=False, capture_stderr=True)
+
+            print(f'{width}x{height}, {seconds * RATE} frames')
+            for name in names:
+                subprocess.run([sys.executable, '-m', 'benchmarks.frame_iterator',
+                                name, src, str(width), str(height)], check=True)
@@ -0,0 +1,56 @@
+'''
+Date: 2026.10.18 16:52:40
+Description: Throughput of encoding numpy frames, run `python -m benchmarks.frame_writer`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 16:52:40
+'''
+import tempfile
+from pathlib import Path
+from timeit import default_timer
+
+import numpy as np
+
+from ffmpeg import constants, input, settings
+from ffmpeg.tools import vtools
+
+settings.CUDA_ENABLE = False
+
+WIDTH, HEIGHT, FRAMES = 1280, 720, 250
+
+
+def make_frame(index: int) -> np.ndarray:
+    # some numpy work per frame, as a producer would do
+    ramp = np.arange(WIDTH, dtype=np.float32) * (255 / WIDTH)
+    frame = np.empty((HEIGHT, WIDTH, 3), np.float32)
+    frame[...] = ramp[None, :, None]
+    frame[:, :, 1] = (index * 4) % 256
+    return frame.astype(np.uint8)
+
+
+def write_inline(dst: Path):
+    '''The README pattern: produce and write one frame at a time on the same thread.'''
+    process = input(constants.PIPE, format='rawvideo', pixel_format='rgb24', width=WIDTH, height=HEIGHT). \
+        output(dst, vcodec='libx264', preset='ultrafast').run_async(print_cmd=False, pipe_stdin=True, quiet=True)
+
+    for index in range(FRAMES):
+        process.stdin.write(make_frame(index).tobytes())
+
+    process.stdin.close()
+    process.wait()
+
+
+def write_queued(dst: Path):
+    with vtools.FrameWriter.open(dst, WIDTH, HEIGHT, vcodec='libx264', preset='ultrafast') as writer:
+        for index in range(FRAMES):
+            writer.write(make_frame(index))
+    return writer.speed
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        for writer in (write_inline, write_queued):
+            start = default_timer()
+            speed = writer(Path(folder) / f'{writer.__name__}.mp4')
+            elapsed = default_timer() - start
+            reported = f', ffmpeg speed {speed}x' if speed else ''
+            print(f'{writer.__name__:>12}: {FRAMES / elapsed:.0f} frames/s{reported}')
@@ -0,0 +1,37 @@
+'''
+Date: 2026.10.18 14:26:10
+Description: Time taken by `import ffmpeg` in a fresh interpreter, run `python -m benchmarks.import_time`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 14:26:10
+'''
+import statistics
+import subprocess
+import sys
+
+_script = '''
+import sys
+from timeit import default_timer
+start = default_timer()
+import ffmpeg
+end = default_timer()
+heavy = [name for name in ('numpy', 'psutil', 'tqdm', 'graphviz') if name in sys.modules]
+print(end - start, ','.join(heavy))
+'''
+
+
+def measure(runs: int):
+    timings, heavy = [], ''
+
+    for _ in range(runs):
+        stdout = subprocess.run([sys.executable, '-c', _script], capture_output=True,
+                                text=True, check=True).stdout
+        elapsed, heavy = stdout.split(' ')
+        timings.append(float(elapsed))
+
+    return statistics.median(timings), heavy.strip()
+
+
+if __name__ == '__main__':
+    median, heavy = measure(20)
+    print(f'import ffmpeg: {median * 1000:.1f}ms median of 20 runs, '
+          f'heavy modules loaded: {heavy or "none"}')
@@ -0,0 +1,55 @@
+'''
+Date: 2026.10.18 15:07:42
+Description: Throughput of transcoding a synthetic corpus, run `python -m benchmarks.job_runner`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 15:07:42
+'''
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from timeit import default_timer
+
+from ffmpeg import JobRunner, input, input_source, settings
+from ffmpeg._runner import available_cpus
+
+settings.CUDA_ENABLE = False
+
+
+def make_corpus(folder: Path, clips: int):
+    with JobRunner() as runner:
+        for future in [runner.submit(input_source('testsrc2', size='640x360', rate=25, duration=4).
+                                     output(folder / f'clip{i}.mp4', vcodec='libx264', preset='ultrafast'))
+                       for i in range(clips)]:
+            future.result()
+
+
+def transcode(src: Path):
+    return input(src).scale(w=480, h=270).output(src.with_suffix('.out.mp4'), vcodec='libx264')
+
+
+def run_serially(clips):
+    for src in clips:
+        transcode(src).run_async(print_cmd=False).communicate()
+
+
+def run_oversubscribed(clips):
+    # one unrestricted ffmpeg per thread, each starting a thread per CPU
+    with ThreadPoolExecutor(available_cpus() * 2) as executor:
+        list(executor.map(lambda src: transcode(src).run_async(print_cmd=False).communicate(), clips))
+
+
+def run_job_runner(clips):
+    with JobRunner() as runner:
+        list(runner.map(transcode(src) for src in clips))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        make_corpus(Path(folder), 16)
+        clips = sorted(Path(folder).glob('clip*[0-9].mp4'))
+
+        for run in (run_serially, run_oversubscribed, run_job_runner):
+            start = default_timer()
+            run(clips)
+            elapsed = default_timer() - start
+            print(f'{run.__name__:>18}: {len(clips) / elapsed:.2f} files/s on {available_cpus()} CPUs')
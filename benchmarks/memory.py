@@ -0,0 +1,55 @@
+'''
+Date: 2026.10.18 11:40:27
+Description: Memory held by graph nodes and streams, run `python -m benchmarks.memory`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 11:40:27
+'''
+import gc
+import tracemalloc
+
+from ffmpeg import avfilters, input, settings
+
+settings.CUDA_ENABLE = False
+
+
+def build_timeline(clips: int):
+    '''Keep every node and stream alive like a timeline builder does.'''
+    streams = []
+
+    for i in range(clips):
+        stream = input(f'clip{i}.mp4').trim(start=i, duration=1)
+        streams.append(stream)
+        stream = stream.setpts('PTS-STARTPTS')
+        streams.append(stream)
+        stream = stream.scale(1280, 720)
+        streams.append(stream)
+
+    output = avfilters.concat(*streams[2::3], n=clips).output('timeline.mp4')
+    return streams, output
+
+
+def measure(clips: int, touch: bool):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+
+    streams, output = build_timeline(clips)
+    if touch:  # fill the lazy fields, as compiling does
+        for stream in streams:
+            stream.Node.detail
+            stream.Node.incoming_edges
+
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # an input node, three filter nodes and three streams per clip
+    nodes = clips * 4 + 1
+    return used / nodes, used / (nodes + len(streams))
+
+
+if __name__ == '__main__':
+    for touch in (False, True):
+        per_node, per_object = measure(50000, touch)
+        state = 'lazy fields filled' if touch else 'just built'
+        print(f'{state:>18}: {per_node:.0f} bytes per node, {per_object:.0f} bytes per node or stream')
@@ -0,0 +1,34 @@
+'''
+Date: 2026.10.18 21:05:12
+Description: Compile time with and without the rewriting passes, run `python -m benchmarks.optimizer`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 21:05:12
+'''
+from timeit import default_timer
+
+from ffmpeg import input, settings
+
+settings.CUDA_ENABLE = False
+settings.COMPILE_CACHE_SIZE = 0
+
+
+def padded_chain(filters: int):
+    '''A chain of filters with a no-op after each.'''
+    stream = input('chain.mp4')
+    for _ in range(filters):
+        stream = stream.hflip().null()
+    return stream.output('chain_out.mp4')
+
+
+if __name__ == '__main__':
+    for size in (1000, 10000):
+        output = padded_chain(size)
+        for optimize in (False, True):
+            settings.ELIMINATE_NO_OPS = optimize
+
+            start = default_timer()
+            args = output.get_output_args(filter_script=False)
+            elapsed = default_timer() - start
+
+            print(f'{size:>6} filters, no-op elimination {"on" if optimize else "off":>3}: '
+                  f'compile {elapsed:.3f}s, {len(args[args.index("-filter_complex") + 1])} bytes of filters')
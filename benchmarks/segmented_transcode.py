@@ -0,0 +1,34 @@
+'''
+Date: 2026.10.18 20:31:47
+Description: Segmented against single-process transcoding, run `python -m benchmarks.segmented_transcode`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 20:31:47
+'''
+import tempfile
+from pathlib import Path
+
+from ffmpeg import input, input_source, settings
+from ffmpeg._runner import available_cpus
+from ffmpeg.tools.avtools import transcode_in_segments
+
+settings.CUDA_ENABLE = False
+
+
+def make_source(dst: Path, duration: int):
+    # 2 second GOPs, as streaming encoders commonly write them
+    video = input_source('testsrc2', size='1920x1080', rate=25, duration=duration)
+    audio = input(f'sine=duration={duration}', format='lavfi', enable_cuda=False)
+    video.output(audio, dst, vcodec='libx264', acodec='aac', preset='ultrafast', g=50).run(print_cmd=False)
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as folder:
+        src = Path(folder) / 'source.mp4'
+        make_source(src, 60)
+
+        stream = input(src).output(Path(folder) / 'output.mp4', vcodec='libx264', acodec='aac', preset='medium')
+        result = transcode_in_segments(stream, workdir=folder, baseline=True)
+
+        print(f'{"single process":>16}: {result.BaselineElapsed:.2f}s')
+        print(f'{"segmented":>16}: {result.Elapsed:.2f}s in {len(result.Segments)} segments, '
+              f'{result.speedup:.2f}x faster on {available_cpus()} CPUs')
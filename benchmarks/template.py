@@ -0,0 +1,43 @@
+'''
+Date: 2026.10.18 13:31:48
+Description: Per-job cost of binding a template against building and compiling, run `python -m benchmarks.template`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 13:31:48
+'''
+from timeit import default_timer
+
+from ffmpeg import Placeholder, input, settings
+
+settings.CUDA_ENABLE = False
+
+
+def build(src, dst, width, height):
+    return input(src).scale(w=width, h=height).setpts('PTS-STARTPTS'). \
+        output(dst, vcodec='libx264', preset='fast')
+
+
+def build_and_compile(jobs: int) -> float:
+    start = default_timer()
+
+    for i in range(jobs):
+        build(f'in/{i}.mp4', f'out/{i}.mp4', 640, 360).get_output_args()
+
+    return default_timer() - start
+
+
+def bind_template(jobs: int) -> float:
+    start = default_timer()
+
+    template = build(Placeholder('src'), Placeholder('dst'), 640, 360).template()
+    for i in range(jobs):
+        template.bind(src=f'in/{i}.mp4', dst=f'out/{i}.mp4')
+
+    return default_timer() - start
+
+
+if __name__ == '__main__':
+    jobs = 100000
+
+    for name, run in (('build and compile', build_and_compile), ('bind template', bind_template)):
+        elapsed = run(jobs)
+        print(f'{name:>17}: {elapsed:.2f}s for {jobs} jobs, {elapsed / jobs * 1e6:.1f}us per job')
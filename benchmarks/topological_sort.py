@@ -0,0 +1,51 @@
+'''
+Date: 2026.10.18 11:02:15
+Description: Sort and compile time of very large graphs, run `python -m benchmarks.topological_sort`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 11:02:15
+'''
+from timeit import default_timer
+
+from ffmpeg import avfilters, input, settings, vfilters
+from ffmpeg._dag import topological_sort
+from ffmpeg._node import get_stream_spec_nodes
+
+settings.CUDA_ENABLE = False
+settings.COMPILE_CACHE_SIZE = 0
+settings.PAUSE_GC_WHILE_COMPILING = True
+
+
+def concat_timeline(filters: int):
+    clips = [input(f'clip{i}.mp4').trim(start=1, end=2).setpts('PTS-STARTPTS')
+             for i in range(filters // 2)]
+    return avfilters.concat(*clips, n=len(clips)).output('timeline.mp4')
+
+
+def xstack_mosaic(filters: int):
+    tiles = [input(f'tile{i}.mp4').scale(64, 36) for i in range(filters - 1)]
+    return vfilters.xstack(*tiles, inputs=len(tiles)).output('mosaic.mp4')
+
+
+def shared_ladder(filters: int):
+    '''Every filter output feeds two overlays.'''
+    a = b = input('base.mp4')
+    for _ in range(filters):
+        a, b = b, a.overlay(b)
+    return b.output('ladder.mp4')
+
+
+if __name__ == '__main__':
+    for size in (1000, 10000, 100000):
+        for build in (concat_timeline, xstack_mosaic, shared_ladder):
+            output = build(size)
+
+            start = default_timer()
+            sorted_nodes, _ = topological_sort(get_stream_spec_nodes(output))
+            middle = default_timer()
+            first = output.get_output_args(filter_script=False)
+            end = default_timer()
+
+            assert first == build(size).get_output_args(filter_script=False), 'compiling is not deterministic'
+
+            print(f'{build.__name__:>16} {size:>6} filters, {len(sorted_nodes):>6} nodes: '
+                  f'sort {middle - start:.3f}s, compile {end - middle:.3f}s')
@@ -4,29 +4,71 @@ Description: Omit
 LastEditors: Rustle Karl
 LastEditTime: 2021.06.25 09:25:13
 '''
+import importlib
 import subprocess
+from typing import TYPE_CHECKING
 
 from pkgs import color
 
+from ._capabilities import (Capabilities, FilterError, capability_cache_clear, get_capabilities,
+                            get_filter_options)
 from ._ffmpeg import input, input_source, merge_outputs, output
-from ._ffplay import ffplay_audio, ffplay_video, run_ffplay
-from ._ffprobe import FFprobe, metadata, run_ffprobe
+from ._ffplay import arun_ffplay, ffplay_audio, ffplay_video, run_ffplay
+from ._ffprobe import FFprobe, ametadata, arun_ffprobe, metadata, run_ffprobe
+from ._instrument import (ConsoleSink, LoggingSink, MetricsSink, NullSink, Sink, TeeSink, get_sink,
+                          set_sink)
+from ._progress import ProgressEvent, ProgressMonitor
+from ._runner import JobRunner
+from ._stderr import StderrCapture
+from ._template import CommandTemplate, Placeholder
+from ._usage import ResourceUsage
 from ._utils import convert_kwargs_to_cmd_line_args
-from .filters import afilters, avfilters, vfilters
-from .nodes import FFmpegError
-from .tools import atools, avtools, vtools
+from ._watchdog import FFmpegTimeoutError, Watchdog, WatchdogEvent
+from .nodes import FFmpegError, RunResult, compile_cache_clear, compile_cache_info
+
+if TYPE_CHECKING:
+    from .filters import afilters, avfilters, vfilters
+    from .tools import atools, avtools, vtools
 
 __all__ = [
+    'Capabilities',
+    'CommandTemplate',
+    'ConsoleSink',
     'FFmpeg',
     'FFmpegError',
+    'FFmpegTimeoutError',
     'FFprobe',
+    'FilterError',
+    'JobRunner',
+    'LoggingSink',
+    'MetricsSink',
+    'NullSink',
+    'Placeholder',
+    'ProgressEvent',
+    'ProgressMonitor',
+    'ResourceUsage',
+    'RunResult',
+    'Sink',
+    'StderrCapture',
+    'TeeSink',
+    'Watchdog',
+    'WatchdogEvent',
     'afilters',
+    'ametadata',
+    'arun_ffplay',
+    'arun_ffprobe',
     'atools',
     'avfilters',
     'avtools',
+    'capability_cache_clear',
+    'compile_cache_clear',
+    'compile_cache_info',
     'constants',
     'ffplay_audio',
     'ffplay_video',
+    'get_capabilities',
+    'get_filter_options',
+    'get_sink',
     'input',
     'input_source',
     'merge_outputs',
@@ -35,10 +77,27 @@ __all__ = [
     'run_ffmpeg',
     'run_ffplay',
     'run_ffprobe',
+    'set_sink',
     'vfilters',
     'vtools',
 ]
 
+# Imported on first use to keep `import ffmpeg` fast
+_lazy_modules = {
+    'afilters': '.filters.afilters',
+    'avfilters': '.filters.avfilters',
+    'vfilters': '.filters.vfilters',
+    'atools': '.tools.atools',
+    'avtools': '.tools.avtools',
+    'vtools': '.tools.vtools',
+}
+
+
+def __getattr__(name: str):
+    if name in _lazy_modules:
+        return importlib.import_module(_lazy_modules[name], __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
 
 def run_ffmpeg(option: str = None, stdout=None, check=True, **kwargs) -> subprocess.CompletedProcess:
     '''Run raw ffmpeg command.'''
@@ -74,6 +133,11 @@ class FFmpeg(object):
         color.cyanln('Cuda Decoders:')
         FFmpeg.codecs(findstr='_cuvid')
 
+    @staticmethod
+    def capabilities(executable="ffmpeg") -> Capabilities:
+        '''What ffmpeg supports, as data rather than printed, see `get_capabilities`.'''
+        return get_capabilities(executable)
+
     @staticmethod
     def version():
         run_ffmpeg('version')
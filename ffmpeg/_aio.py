@@ -0,0 +1,189 @@
+'''
+Date: 2026.10.18 15:32:19
+Description: asyncio counterparts of the blocking subprocess calls
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 15:32:19
+'''
+from __future__ import annotations
+
+import asyncio
+import re
+from asyncio import subprocess
+from typing import AsyncIterator, List, Optional, Tuple
+
+from ._instrument import get_sink
+from ._progress import ProgressEvent, ProgressParser
+from ._stderr import StderrCapture
+from .nodes import remove_filter_scripts
+
+__all__ = [
+    'AsyncProcess',
+    'create_process',
+]
+
+# ffmpeg ends progress lines with '\r' to redraw them in place
+_line_break = re.compile(rb'\r\n|\r|\n')
+
+
+class AsyncProcess(object):
+    """An ffmpeg, ffprobe or ffplay child process driven by asyncio.
+
+    Cancelling a coroutine waiting on the process terminates the process,
+    first with SIGTERM so that ffmpeg finishes its outputs, then SIGKILL."""
+
+    def __init__(self, args: List[str], process: subprocess.Process):
+        self._args = args
+        self._process = process
+
+    @property
+    def args(self) -> List[str]:
+        return self._args
+
+    @property
+    def pid(self) -> int:
+        return self._process.pid
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._process.returncode
+
+    @property
+    def stdin(self) -> Optional[asyncio.StreamWriter]:
+        return self._process.stdin
+
+    @property
+    def stdout(self) -> Optional[asyncio.StreamReader]:
+        return self._process.stdout
+
+    @property
+    def stderr(self) -> Optional[asyncio.StreamReader]:
+        return self._process.stderr
+
+    async def wait(self) -> int:
+        try:
+            returncode = await self._process.wait()
+        except asyncio.CancelledError:
+            await self.terminate()
+            raise
+
+        remove_filter_scripts(self._args)
+        return returncode
+
+    async def communicate(self, input: bytes = None) -> Tuple[bytes, bytes]:
+        try:
+            stdout, stderr = await self._process.communicate(input)
+        except asyncio.CancelledError:
+            await self.terminate()
+            raise
+
+        remove_filter_scripts(self._args)
+        return stdout, stderr
+
+    async def collect(self, input: bytes = None, stderr: StderrCapture = None) -> Tuple[Optional[bytes], Optional[bytes]]:
+        '''Like `communicate`, but stderr goes through `stderr` as it is written,
+        the second item is its tail instead of all of it.'''
+        if stderr is None or self._process.stderr is None:
+            return await self.communicate(input)
+
+        async def write():
+            try:
+                if input:
+                    self._process.stdin.write(input)
+                    await self._process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # ffmpeg exited early, its return code tells why
+            self._process.stdin.close()
+
+        async def read():
+            return await self._process.stdout.read()
+
+        async def drain():
+            while True:
+                chunk = await self._process.stderr.read(1 << 12)
+                if not chunk:
+                    break
+                stderr.feed(chunk)
+            stderr.close()
+
+        async def skip():
+            return None
+
+        try:
+            _, stdout, _ = await asyncio.gather(
+                    write() if self._process.stdin is not None else skip(),
+                    read() if self._process.stdout is not None else skip(),
+                    drain(),
+            )
+            await self._process.wait()
+        except asyncio.CancelledError:
+            await self.terminate()
+            raise
+
+        remove_filter_scripts(self._args)
+        return stdout, stderr.tail
+
+    async def iter_stdout(self, chunk_size=1 << 16) -> AsyncIterator[bytes]:
+        '''Yield stdout in chunks of at most `chunk_size` bytes as ffmpeg writes it.'''
+        try:
+            while True:
+                chunk = await self._process.stdout.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except asyncio.CancelledError:
+            await self.terminate()
+            raise
+
+    async def iter_stderr(self, encoding='utf-8') -> AsyncIterator[str]:
+        '''Yield stderr line by line, progress lines ended by '\\r' included.'''
+        pending = b''
+
+        try:
+            while True:
+                chunk = await self._process.stderr.read(1 << 12)
+                if not chunk:
+                    break
+
+                *lines, pending = _line_break.split(pending + chunk)
+                for line in lines:
+                    if line:
+                        yield line.decode(encoding, errors='replace')
+        except asyncio.CancelledError:
+            await self.terminate()
+            raise
+
+        if pending:
+            yield pending.decode(encoding, errors='replace')
+
+    async def iter_progress(self, duration: float = None) -> AsyncIterator[ProgressEvent]:
+        '''Yield the progress ffmpeg writes to stdout, start it with ``progress='pipe:1'``.'''
+        parser = ProgressParser(duration)
+
+        async for chunk in self.iter_stdout():
+            sink = get_sink()
+            for event in parser.feed(chunk):
+                sink.on_progress(event)
+                yield event
+
+    async def terminate(self, timeout: float = 5):
+        '''Ask the process to exit, kill it if it is still running after `timeout` seconds.'''
+        if self._process.returncode is None:
+            try:
+                self._process.terminate()
+                await asyncio.wait_for(asyncio.shield(self._process.wait()), timeout)
+            except ProcessLookupError:
+                pass
+            except asyncio.TimeoutError:
+                self._process.kill()
+                await self._process.wait()
+
+        remove_filter_scripts(self._args)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} pid={self.pid} returncode={self.returncode}>'
+
+
+async def create_process(args: List[str], stdin=None, stdout=None, stderr=None) -> AsyncProcess:
+    '''Start a child process, `stdin`, `stdout` and `stderr` take the `subprocess` constants.'''
+    process = await asyncio.create_subprocess_exec(*map(str, args), stdin=stdin, stdout=stdout, stderr=stderr)
+    return AsyncProcess(list(args), process)
@@ -0,0 +1,335 @@
+'''
+Date: 2026.10.18 18:52:47
+Description: What the installed ffmpeg supports, parsed once and cached on disk
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 18:52:47
+'''
+from __future__ import annotations
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+from difflib import get_close_matches
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import settings
+from ._dag import topological_sort
+from ._node import NodeTypes, get_stream_spec_nodes
+
+__all__ = [
+    'Capabilities',
+    'FilterError',
+    'capability_cache_clear',
+    'get_capabilities',
+    'get_filter_options',
+    'validate_filters',
+]
+
+# Codec lines follow the legend, e.g. ' V....D libx264   libx264 H.264 / AVC ...'
+_codec_line = re.compile(r'^\s*([VAS][.F][.S][.X][.B][.D])\s+(\S+)\s+(.*)$')
+# ' TSC overlay   VV->V   Overlay a video source on top of the input.'
+_filter_line = re.compile(r'^\s*([.T][.S][.C]?)\s+(\S+)\s+(\S+)->(\S+)\s+(.*)$')
+# 'IO... yuv420p   3   12   8-8-8'
+_pix_fmt_line = re.compile(r'^([.I][.O][.H][.P][.B])\s+(\S+)\s+(\d+)\s+(\d+)')
+# '   eof_action        <int>        ..FV....... Action to take ...', named values are indented deeper,
+# options of classes the filter passes on, like scale's swscale ones, are listed as '  -sws_dither ...'
+_filter_option_line = re.compile(r'^  [ -](\w+)\s+<(\w+)>')
+# Options every filter has, from the AVFilter class ``ffmpeg -h filter=name`` leaves out
+_generic_filter_options = {'threads': 'int', 'thread_type': 'flags', 'extra_hw_frames': 'int'}
+# Bumped when parsing changes, invalidating what the disk cache holds
+_CACHE_VERSION = 2
+
+# Hardware codecs are listed by builds supporting them, but only work with the device
+_hw_codec_suffixes = {
+    '_cuvid': 'cuda',
+    '_nvenc': 'cuda',
+    '_qsv': 'qsv',
+    '_vaapi': 'vaapi',
+    '_videotoolbox': 'videotoolbox',
+}
+
+
+def _run(executable: str, *args: str) -> str:
+    return subprocess.run([executable, '-hide_banner', *args], stdout=subprocess.PIPE,
+                          stderr=subprocess.DEVNULL, encoding='utf-8', errors='replace', check=True).stdout
+
+
+def _parse_codecs(text: str) -> Dict[str, List[str]]:
+    codecs = {}
+    for line in text.split('------', 1)[-1].splitlines():
+        match = _codec_line.match(line)
+        if match:
+            flags, name, description = match.groups()
+            codecs[name] = [flags, description]
+    return codecs
+
+
+def _parse_filters(text: str) -> Dict[str, List[str]]:
+    filters = {}
+    for line in text.splitlines():
+        match = _filter_line.match(line)
+        if match:
+            flags, name, inputs, outputs, description = match.groups()
+            filters[name] = [flags, inputs, outputs, description]
+    return filters
+
+
+def _parse_pix_fmts(text: str) -> Dict[str, List[Any]]:
+    pix_fmts = {}
+    for line in text.split('-----', 1)[-1].splitlines():
+        match = _pix_fmt_line.match(line)
+        if match:
+            flags, name, components, bits_per_pixel = match.groups()
+            pix_fmts[name] = [flags, int(components), int(bits_per_pixel)]
+    return pix_fmts
+
+
+def _parse_hwaccels(text: str) -> List[str]:
+    return [line.strip() for line in text.splitlines()[1:] if line.strip()]
+
+
+def _parse_filter_options(text: str) -> Dict[str, str]:
+    # Options of the filter and of the classes it embeds, like framesync
+    options = {}
+    for line in text.splitlines():
+        match = _filter_option_line.match(line)
+        if match:
+            options.setdefault(*match.groups())
+
+    for name, kind in _generic_filter_options.items():
+        options.setdefault(name, kind)
+
+    if "support for timeline through the 'enable' option" in text:
+        options['enable'] = 'string'
+
+    return options
+
+
+def _hw_device_works(executable: str, device: str) -> bool:
+    # Fails within milliseconds on hosts without the hardware or its driver
+    args = [executable, '-hide_banner', '-loglevel', 'error', '-init_hw_device', device,
+            '-f', 'lavfi', '-i', 'nullsrc', '-frames:v', '1', '-f', 'null', '-']
+    try:
+        return subprocess.run(args, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL, timeout=10).returncode == 0
+    except subprocess.TimeoutExpired:
+        return False
+
+
+class Capabilities(object):
+    """Encoders, decoders, filters, hardware acceleration methods and pixel
+    formats of one ffmpeg binary.
+
+    Codecs map their names to `[flags, description]`, filters to
+    `[flags, inputs, outputs, description]` and pixel formats to
+    `[flags, components, bits_per_pixel]`, as ffmpeg lists them.
+    `hw_devices` are the acceleration methods whose device could be opened
+    on this host when the index was built. `filter_options` maps the filters
+    looked up with `get_filter_options` so far to their options and types."""
+    __slots__ = ('version', 'encoders', 'decoders', 'filters', 'hwaccels', 'hw_devices', 'pix_fmts',
+                 'filter_options')
+
+    def __init__(self, version: str, encoders: Dict[str, List[str]], decoders: Dict[str, List[str]],
+                 filters: Dict[str, List[str]], hwaccels: List[str], hw_devices: List[str],
+                 pix_fmts: Dict[str, List[Any]], filter_options: Dict[str, Dict[str, str]] = None):
+        self.version = version
+        self.encoders = encoders
+        self.decoders = decoders
+        self.filters = filters
+        self.hwaccels = hwaccels
+        self.hw_devices = hw_devices
+        self.pix_fmts = pix_fmts
+        self.filter_options = filter_options or {}
+
+    @classmethod
+    def from_executable(cls, executable="ffmpeg") -> Capabilities:
+        '''Build the index by asking ffmpeg, which takes a few runs of it.'''
+        hwaccels = _parse_hwaccels(_run(executable, '-hwaccels'))
+        return cls(
+                version=_run(executable, '-version').partition('\n')[0],
+                encoders=_parse_codecs(_run(executable, '-encoders')),
+                decoders=_parse_codecs(_run(executable, '-decoders')),
+                filters=_parse_filters(_run(executable, '-filters')),
+                hwaccels=hwaccels,
+                hw_devices=[device for device in hwaccels if _hw_device_works(executable, device)],
+                pix_fmts=_parse_pix_fmts(_run(executable, '-pix_fmts')),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def _usable(self, codecs: Dict[str, List[str]], name: str) -> bool:
+        if name not in codecs:
+            return False
+        for suffix, device in _hw_codec_suffixes.items():
+            if name.endswith(suffix):
+                return device in self.hw_devices
+        return True
+
+    def has_encoder(self, name: str) -> bool:
+        '''Whether `name` is built in and, for a hardware encoder, its device is present.'''
+        return self._usable(self.encoders, name)
+
+    def has_decoder(self, name: str) -> bool:
+        return self._usable(self.decoders, name)
+
+    def has_filter(self, name: str) -> bool:
+        return name in self.filters
+
+    def has_hwaccel(self, name: str) -> bool:
+        return name in self.hw_devices
+
+    def choose_encoder(self, *names: str) -> Optional[str]:
+        '''The first usable encoder of `names`, fastest first.'''
+        return next((name for name in names if self.has_encoder(name)), None)
+
+    def choose_decoder(self, *names: str) -> Optional[str]:
+        return next((name for name in names if self.has_decoder(name)), None)
+
+    def __repr__(self):
+        return (f'<{type(self).__name__} {self.version!r} encoders={len(self.encoders)} '
+                f'decoders={len(self.decoders)} filters={len(self.filters)} hw_devices={self.hw_devices}>')
+
+
+def _get_stamp(path: str) -> List[int]:
+    stat = os.stat(path)
+    return [stat.st_mtime_ns, stat.st_size, _CACHE_VERSION]
+
+
+def _load_cache(cache_file: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(cache_file, encoding='utf-8') as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_file: str, cache: Dict[str, Dict[str, Any]]):
+    # Replace atomically, processes building the index at once keep one of their writes
+    folder = os.path.dirname(cache_file)
+    try:
+        os.makedirs(folder, exist_ok=True)
+        fd, temporary = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+            json.dump(cache, fp)
+        os.replace(temporary, cache_file)
+    except OSError:
+        pass  # a read-only home only costs rebuilding the index next time
+
+
+_capabilities: Dict[str, Capabilities] = {}
+_sources: Dict[str, Tuple[str, List[int]]] = {}  # executable -> binary path and stamp
+_capabilities_lock = threading.RLock()
+
+
+def _store(path: str, stamp: List[int], capabilities: Capabilities):
+    cache_file = settings.CAPABILITY_CACHE_FILE
+    if cache_file:
+        cache = _load_cache(cache_file)
+        cache[path] = {'stamp': stamp, **capabilities.to_dict()}
+        _save_cache(cache_file, cache)
+
+
+def get_capabilities(executable="ffmpeg") -> Capabilities:
+    '''The index of the ffmpeg `executable` resolves to, kept in memory and in
+    `settings.CAPABILITY_CACHE_FILE` by the binary's path along with its mtime
+    and size, so it is only rebuilt when the binary changes. Raises `FileNotFoundError`
+    if there is no such executable.'''
+    with _capabilities_lock:
+        if executable in _capabilities:
+            return _capabilities[executable]
+
+        path = shutil.which(executable)
+        if path is None:
+            raise FileNotFoundError(f"Can't find {executable} to read its capabilities")
+
+        path = os.path.realpath(path)
+        stamp = _get_stamp(path)
+        cache_file = settings.CAPABILITY_CACHE_FILE
+
+        capabilities = None
+        entry = _load_cache(cache_file).get(path) if cache_file else None
+        if entry is not None and entry.pop('stamp', None) == stamp:
+            try:
+                capabilities = Capabilities(**entry)
+            except TypeError:
+                pass  # written by another version of this package
+
+        if capabilities is None:
+            capabilities = Capabilities.from_executable(path)
+            _store(path, stamp, capabilities)
+
+        _capabilities[executable] = capabilities
+        _sources[executable] = path, stamp
+        return capabilities
+
+
+def get_filter_options(name: str, executable="ffmpeg") -> Optional[Dict[str, str]]:
+    '''Options of the filter `name` mapped to their types, parsed from
+    ``ffmpeg -h filter=name`` once and cached with the index. None if
+    ffmpeg has no such filter.'''
+    with _capabilities_lock:
+        capabilities = get_capabilities(executable)
+        if name not in capabilities.filters:
+            return None
+
+        options = capabilities.filter_options.get(name)
+        if options is None:
+            path, stamp = _sources[executable]
+            options = _parse_filter_options(_run(path, '-h', f'filter={name}'))
+            capabilities.filter_options[name] = options
+            _store(path, stamp, capabilities)
+
+        return options
+
+
+def capability_cache_clear():
+    '''Forget the indexes held in memory, the next use reads the disk cache again.'''
+    with _capabilities_lock:
+        _capabilities.clear()
+        _sources.clear()
+
+
+class FilterError(ValueError):
+    """Filters or options the ffmpeg that would run the graph does not have."""
+
+
+def _did_you_mean(name: str, names) -> str:
+    matches = get_close_matches(name, list(names), n=1)
+    return f", did you mean {matches[0]!r}?" if matches else ''
+
+
+def validate_filters(stream_spec, executable="ffmpeg"):
+    '''Check the name and option names of every filter in the graph against
+    the filters of `executable`, raising `FilterError` listing all mistakes,
+    before any ffmpeg is spawned to find them.'''
+    sorted_nodes, _ = topological_sort(get_stream_spec_nodes(stream_spec))
+    capabilities = get_capabilities(executable)
+
+    errors = []
+    checked = set()
+    for node in sorted_nodes:
+        if node.Type != NodeTypes.Filter:
+            continue
+
+        name = node.Label.partition('@')[0]  # an instance name may follow '@'
+        keys = tuple(sorted(node._kwargs or ()))
+        if (name, keys) in checked:
+            continue
+        checked.add((name, keys))
+
+        options = get_filter_options(name, executable)
+        if options is None:
+            errors.append(f"Unknown filter {name!r}{_did_you_mean(name, capabilities.filters)}")
+            continue
+
+        for key in keys:
+            if key not in options:
+                errors.append(f"Filter {name!r} has no option {key!r}{_did_you_mean(key, options)}")
+
+    if errors:
+        raise FilterError('; '.join(errors))
@@ -1,156 +1,295 @@
-'''
-Date: 2021.02.26 21:39:59
-Description: Omit
-LastEditors: Rustle Karl
-LastEditTime: 2021.04.29 15:42:51
-'''
-from __future__ import annotations
-
-from collections import defaultdict
-from functools import cached_property
-from typing import Dict, List, NamedTuple, Tuple
-
-__all__ = [
-    "DagEdge",
-    "DagNode",
-    "Edge",
-    "get_incoming_edges",
-    "get_outgoing_edges",
-    "topological_sort"
-]
-
-
-class Edge(NamedTuple):
-    Node: DagNode
-    Label: str
-    Selector: str
-
-
-class DagEdge(NamedTuple):
-    '''DagNodes are connected by edges. An edge
-    connects two nodes with a label for each side.'''
-
-    DownstreamNode: DagNode  # downstream/child node
-    DownstreamLabel: str  # label on the incoming side of the downstream node
-    UpstreamNode: DagNode  # upstream/parent node
-    UpstreamLabel: str  # label on the outgoing side of the upstream node
-    Selector: str
-
-
-class DagNode(object):
-    '''Node in a directed-acyclic graph (DAG).'''
-
-    def __init__(self, label: str, incoming_edge_graph: Dict[str, Edge],
-                 node_type: str, args: List, kwargs: Dict):
-        self._label = label
-        self._args = list(map(str, args)) if args else []
-        self._kwargs = kwargs or {}
-        self._node_type = node_type
-        self._incoming_edge_graph = incoming_edge_graph
-
-    def __repr__(self):
-        return f"<class 'DagNode:{self.Type}'> {self.detail}"
-
-    @cached_property
-    def detail(self) -> str:
-        """Return a full string representation of the node."""
-        props = self._args + [f'{k}={self._kwargs[k]}' for k in sorted(self._kwargs)]
-        if props:
-            return f'{self.brief}:{",".join(props)}'
-        else:
-            return self.brief
-
-    @property
-    def brief(self) -> str:
-        """Return a partial/concise representation of the node."""
-        return self._label
-
-    @property
-    def Label(self) -> str:
-        return self._label
-
-    @property
-    def Type(self) -> str:
-        return self._node_type
-
-    @property
-    def incoming_edge_graph(self) -> Dict[str, Edge]:
-        return self._incoming_edge_graph
-
-    @cached_property
-    def incoming_edges(self) -> Tuple[DagEdge]:
-        """Provides information about all incoming edges that connect to this node."""
-        return get_incoming_edges(self, self.incoming_edge_graph)
-
-    def stream(self, label: str = None, selector: str = None) -> DagEdge:
-        raise NotImplementedError
-
-    # TODO cause recursion, maybe it's not a good idea. It doesn't seem necessary.
-    # def __eq__(self, other: DagNode):
-    #     return (self.Type, self.detail, self.incoming_edges) == (other.Type, other.detail, other.incoming_edges)
-    #
-    # def __hash__(self):
-    #     return hash((self.Type, self.detail))
-
-
-def get_incoming_edges(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> Tuple[DagEdge]:
-    incoming_edges = []
-    for label, edge in incoming_edge_graph.items():
-        incoming_edges.append(DagEdge(node, label, edge.Node, edge.Label, edge.Selector))
-    return tuple(incoming_edges)
-
-
-def get_outgoing_edges(node: DagNode, outgoing_edge_graph: Dict[str, List[Edge]]) -> Tuple[DagEdge]:
-    outgoing_edges = []
-    for label, edges in outgoing_edge_graph.items():
-        for edge in edges:
-            outgoing_edges.append(DagEdge(edge.Node, edge.Label, node, label, edge.Selector))
-    return tuple(outgoing_edges)
-
-
-def topological_sort(nodes: List[DagNode]) -> Tuple[Tuple[DagNode], Dict[DagNode, Dict[str, List[Edge]]]]:
-    '''NOTE nodes can be part of the nodes, but not all.
-
-    DagNodes may have any number of incoming edges and any number of
-    outgoing edges.  DagNodes keep track only of their incoming edges, but
-    the entire graph structure can be inferred by looking at the furthest
-    downstream nodes and working backwards.
-    '''
-    outgoing_edge_graphs = defaultdict(lambda: defaultdict(list))
-    dependent_count = defaultdict(lambda: 0)
-    outgoing_graph = defaultdict(list)
-    visited_nodes = set()
-    sorted_nodes = []
-
-    # Convert to a friendly representation
-    while nodes:
-        node = nodes.pop()
-        if node not in visited_nodes:
-            for edge in node.incoming_edges:
-                outgoing_graph[edge.UpstreamNode].append(node)  # node == edge.DownstreamNode
-                outgoing_edge_graphs[edge.UpstreamNode][edge.UpstreamLabel]. \
-                    append(Edge(node, edge.DownstreamLabel, edge.Selector))
-                nodes.append(edge.UpstreamNode)
-            visited_nodes.add(node)
-
-    # Calculate the number of dependents
-    for val in outgoing_graph.values():
-        for v in val:
-            dependent_count[v] += 1
-
-    # Zero dependent nodes
-    stack = [node for node in visited_nodes if dependent_count[node] == 0]
-
-    while stack:
-        node = stack.pop()
-        sorted_nodes.append(node)
-
-        for n in outgoing_graph[node]:
-            dependent_count[n] -= 1
-            if dependent_count[n] == 0:
-                stack.append(n)
-
-    if len(sorted_nodes) != len(visited_nodes):
-        raise RuntimeError('This graph is not a DAG')
-
-    return tuple(sorted_nodes), outgoing_edge_graphs
+'''
+Date: 2021.02.26 21:39:59
+Description: Omit
+LastEditors: Rustle Karl
+LastEditTime: 2021.04.29 15:42:51
+'''
+from __future__ import annotations
+
+import contextlib
+import copy
+import gc
+import hashlib
+import threading
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, NamedTuple, Tuple
+
+from . import settings
+
+__all__ = [
+    "DagEdge",
+    "DagNode",
+    "Edge",
+    "cached_slot",
+    "get_incoming_edges",
+    "gc_paused",
+    "get_fingerprint",
+    "get_outgoing_edges",
+    "topological_sort"
+]
+
+
+class Edge(NamedTuple):
+    Node: DagNode
+    Label: str
+    Selector: str
+
+
+class DagEdge(NamedTuple):
+    '''DagNodes are connected by edges. An edge
+    connects two nodes with a label for each side.'''
+
+    DownstreamNode: DagNode  # downstream/child node
+    DownstreamLabel: str  # label on the incoming side of the downstream node
+    UpstreamNode: DagNode  # upstream/parent node
+    UpstreamLabel: str  # label on the outgoing side of the upstream node
+    Selector: str
+
+
+class cached_slot(object):
+    """Like `functools.cached_property`, but for classes with `__slots__`.
+
+    The value is computed on first access and kept in the slot named
+    after the property with a leading underscore, which the class must declare.
+    """
+
+    def __init__(self, func: Callable[[Any], Any]):
+        self.func = func
+        self.slot = '_' + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name: str):
+        self.slot = '_' + name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+
+class DagNode(object):
+    '''Node in a directed-acyclic graph (DAG).'''
+
+    # Graphs of long edit lists keep hundreds of thousands of nodes alive
+    __slots__ = ('_label', '_args', '_kwargs', '_node_type', '_incoming_edge_graph',
+                 '_detail', '_signature', '_fingerprint')
+
+    _cached_slots = ('_detail', '_signature', '_fingerprint')
+
+    def __init__(self, label: str, incoming_edge_graph: Dict[str, Edge],
+                 node_type: str, args: List, kwargs: Dict):
+        self._label = label
+        self._args = tuple(map(str, args)) if args else ()
+        self._kwargs = kwargs or {}
+        self._node_type = node_type
+        self._incoming_edge_graph = incoming_edge_graph
+
+    def __repr__(self):
+        return f"<class 'DagNode:{self.Type}'> {self.detail}"
+
+    @cached_slot
+    def detail(self) -> str:
+        """Return a full string representation of the node."""
+        props = list(self._args) + [f'{k}={self._kwargs[k]}' for k in sorted(self._kwargs)]
+        if props:
+            return f'{self.brief}:{",".join(props)}'
+        else:
+            return self.brief
+
+    @property
+    def brief(self) -> str:
+        """Return a partial/concise representation of the node."""
+        return self._label
+
+    @property
+    def Label(self) -> str:
+        return self._label
+
+    @property
+    def Type(self) -> str:
+        return self._node_type
+
+    @property
+    def incoming_edge_graph(self) -> Dict[str, Edge]:
+        return self._incoming_edge_graph
+
+    @property
+    def incoming_edges(self) -> Tuple[DagEdge]:
+        """Provides information about all incoming edges that connect to this node."""
+        return get_incoming_edges(self, self.incoming_edge_graph)
+
+    @cached_slot
+    def signature(self) -> str:
+        """Describe the node itself, without its upstream nodes."""
+        kwargs = [f'{k}={self._kwargs[k]}' for k in sorted(self._kwargs)]
+        return repr((type(self).__qualname__, str(self._node_type), self._label, self._args, kwargs))
+
+    @cached_slot
+    def fingerprint(self) -> str:
+        """Structural digest of the graph ending at this node.
+
+        Two nodes have the same fingerprint if and only if their upstream graphs
+        have the same shape, including which nodes are shared.
+        """
+        return get_fingerprint(self)
+
+    def clone(self, incoming_edge_graph: Dict[str, Edge] = None, kwargs: Dict = None) -> DagNode:
+        """Copy the node with other incoming edges or keyword arguments, used by graph rewriting."""
+        node = copy.copy(self)
+
+        for slot in self._cached_slots:
+            if hasattr(node, slot):
+                delattr(node, slot)
+
+        if incoming_edge_graph is not None:
+            node._incoming_edge_graph = incoming_edge_graph
+
+        if kwargs is not None:
+            node._kwargs = kwargs
+
+        return node
+
+    def stream(self, label: str = None, selector: str = None) -> DagEdge:
+        raise NotImplementedError
+
+    # NOTE `__eq__` and `__hash__` stay identity based, two equal-looking input nodes
+    # are still two `-i` arguments. Compare `fingerprint` to detect identical graphs.
+
+
+def get_incoming_edges(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> Tuple[DagEdge]:
+    incoming_edges = []
+    for label, edge in incoming_edge_graph.items():
+        incoming_edges.append(DagEdge(node, label, edge.Node, edge.Label, edge.Selector))
+    return tuple(incoming_edges)
+
+
+def get_outgoing_edges(node: DagNode, outgoing_edge_graph: Dict[str, List[Edge]]) -> Tuple[DagEdge]:
+    outgoing_edges = []
+    for label, edges in outgoing_edge_graph.items():
+        for edge in edges:
+            outgoing_edges.append(DagEdge(edge.Node, edge.Label, node, label, edge.Selector))
+    return tuple(outgoing_edges)
+
+
+def get_fingerprint(node: DagNode) -> str:
+    """Serialize the upstream graph of the node in a canonical order and digest it.
+
+    Nodes are numbered in depth-first post-order, following the incoming edges
+    in label order, so the serialization also records which nodes are shared.
+    Walks the graph with an explicit stack, deep graphs do not hit the recursion limit.
+    """
+    indexes = {}
+    lines = []
+    stack = [(node, False)]
+
+    while stack:
+        current, expanded = stack.pop()
+        if current in indexes:
+            continue
+
+        if expanded:
+            edges = [f'{label!r}<{indexes[edge.Node]}:{edge.Label!r}:{edge.Selector!r}'
+                     for label, edge in current.incoming_edge_graph.items()]
+            indexes[current] = len(lines)
+            lines.append(f'{current.signature}|{",".join(edges)}')
+        else:
+            stack.append((current, True))
+            for edge in reversed(list(current.incoming_edge_graph.values())):
+                if edge.Node not in indexes:
+                    stack.append((edge.Node, False))
+
+    return hashlib.blake2b('\n'.join(lines).encode('utf-8'), digest_size=16).hexdigest()
+
+
+_gc_pauses = 0
+_gc_enabled = False
+_gc_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """The cyclic garbage collector keeps rescanning the containers allocated
+    while walking a big graph, although none of them is garbage yet.
+
+    Only pauses it with `settings.PAUSE_GC_WHILE_COMPILING`, as it is paused
+    for the whole process. Overlapping pauses of several threads end together,
+    it is enabled again only if it was before the first of them."""
+    global _gc_pauses, _gc_enabled
+
+    if not settings.PAUSE_GC_WHILE_COMPILING:
+        yield
+        return
+
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_enabled:
+                gc.enable()
+
+
+def topological_sort(nodes: List[DagNode]) -> Tuple[Tuple[DagNode], Dict[DagNode, Dict[str, List[Edge]]]]:
+    '''NOTE nodes can be part of the nodes, but not all.
+
+    DagNodes may have any number of incoming edges and any number of
+    outgoing edges.  DagNodes keep track only of their incoming edges, but
+    the entire graph structure can be inferred by looking at the furthest
+    downstream nodes and working backwards.
+
+    Iterative depth-first post-order, every node and edge is visited once.
+    The order only depends on the order of the given nodes and of the incoming
+    edges, so identical graphs always get the same stream tags.
+    '''
+    outgoing_edge_graphs = defaultdict(lambda: defaultdict(list))
+    sorted_nodes = []
+    visiting = set()
+    visited = set()
+
+    with gc_paused():
+        _depth_first_sort(nodes, sorted_nodes, outgoing_edge_graphs, visiting, visited)
+
+    return tuple(sorted_nodes), outgoing_edge_graphs
+
+
+def _depth_first_sort(nodes, sorted_nodes, outgoing_edge_graphs, visiting, visited):
+    for root in nodes:
+        if root in visited:
+            continue
+
+        visiting.add(root)
+        stack = [(root, iter(root.incoming_edge_graph.values()))]
+
+        while stack:
+            node, edges = stack[-1]
+
+            for edge in edges:
+                upstream = edge.Node
+                if upstream in visited:
+                    continue
+                if upstream in visiting:
+                    raise RuntimeError('This graph is not a DAG')
+
+                visiting.add(upstream)
+                stack.append((upstream, iter(upstream.incoming_edge_graph.values())))
+                break
+            else:
+                stack.pop()
+                visiting.remove(node)
+                visited.add(node)
+                sorted_nodes.append(node)
+
+                for label, edge in node.incoming_edge_graph.items():
+                    outgoing_edge_graphs[edge.Node][edge.Label].append(Edge(node, label, edge.Selector))
+
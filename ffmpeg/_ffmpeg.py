@@ -4,9 +4,12 @@ Description: Omit
 LastEditors: Rustle Karl
 LastEditTime: 2021.05.10 12:33:20
 '''
+import subprocess
 from pathlib import Path
+from typing import Optional
 
 from . import constants, settings
+from ._capabilities import Capabilities, get_capabilities
 from ._node import Stream
 from ._utils import (convert_kwargs_string, drop_empty_dict_values,
                      drop_empty_list_values)
@@ -17,6 +20,14 @@ from .nodes import (FilterableStream, InputNode, MergeOutputsNode, OutputNode,
 # http://ffmpeg.org/ffmpeg-all.html
 
 
+def _get_capabilities() -> Optional[Capabilities]:
+    # Without an ffmpeg to ask, build the graph as told and let running it tell
+    try:
+        return get_capabilities()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
 def input(source, video_device: str = None, audio_device: str = None, format: str = None,
           pixel_format=None, fps: int = None, start_position: float = None, duration: float = None,
           to_position: float = None, start_position_eof: float = None, stream_loop: int = None,
@@ -35,9 +46,17 @@ def input(source, video_device: str = None, audio_device: str = None, format: st
 
     if settings.CUDA_ENABLE and enable_cuda and \
             Path(source).suffix not in constants.IMAGE_FORMATS:
-        hwaccel = "cuda"
-        if vcodec not in constants.CUDA_ENCODERS:
-            vcodec = settings.DEFAULT_DECODER
+        capabilities = _get_capabilities()
+        if capabilities is None:
+            hwaccel = "cuda"
+            if vcodec not in constants.CUDA_ENCODERS:
+                vcodec = settings.DEFAULT_DECODER
+        else:
+            # Fall back to decoding on the CPU where CUDA can't be used
+            if capabilities.has_hwaccel("cuda"):
+                hwaccel = "cuda"
+            if vcodec not in constants.CUDA_ENCODERS:
+                vcodec = capabilities.choose_decoder(settings.DEFAULT_DECODER, *filter(None, [vcodec]))
 
     kwargs = drop_empty_dict_values(kwargs, hwaccel=hwaccel, vcodec=vcodec,
                                     f=format, pix_fmt=pixel_format, ss=start_position,
@@ -96,8 +115,15 @@ def output(*streams_or_source, vn=False, an=False, ar=None, ab=None, ac=None,
 
     if settings.CUDA_ENABLE and enable_cuda and not preview and \
             Path(kwargs['source']).suffix not in constants.IMAGE_FORMATS:
-        if vcodec not in constants.CUDA_ENCODERS:
-            vcodec = settings.DEFAULT_ENCODER
+        preferred = vcodec if vcodec in constants.CUDA_ENCODERS else settings.DEFAULT_ENCODER
+        capabilities = _get_capabilities()
+        if capabilities is None:
+            vcodec = preferred
+        else:
+            # CUDA first, then the codec asked for or else the fallbacks of the CUDA encoder
+            fallbacks = (vcodec,) if vcodec and vcodec != preferred else \
+                settings.ENCODER_FALLBACKS.get(preferred, ())
+            vcodec = capabilities.choose_encoder(preferred, *fallbacks) or vcodec
 
     # codec over acodec/vcodec
     if codec is not None:
@@ -5,20 +5,23 @@ LastEditTime: 2021.06.25 09:45:47
 '''
 import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING, List
 
-from pkgs import color
+from ._instrument import get_sink
+from ._utils import convert_kwargs_to_cmd_line_args
 
-from ._utils import convert_kwargs_to_cmd_line_args, join_cmd_args_seq
+if TYPE_CHECKING:
+    from ._aio import AsyncProcess
 
 __all__ = [
+    "arun_ffplay",
     "ffplay_audio",
     "ffplay_video",
     "run_ffplay",
 ]
 
 
-def run_ffplay(source: str = None, print_cmd=True, **kwargs):
-    """Run raw ffplay command."""
+def _get_ffplay_args(source: str = None, print_cmd=True, **kwargs) -> List[str]:
     args = ["ffplay", "-hide_banner"]
 
     _kwargs = {}
@@ -34,9 +37,22 @@ def run_ffplay(source: str = None, print_cmd=True, **kwargs):
         args.append(Path(source).as_posix())
 
     if print_cmd:
-        color.greenln(join_cmd_args_seq(args))
+        get_sink().on_command(args)
+
+    return args
+
+
+def run_ffplay(source: str = None, print_cmd=True, **kwargs):
+    """Run raw ffplay command."""
+    return subprocess.Popen(_get_ffplay_args(source, print_cmd, **kwargs))
+
+
+async def arun_ffplay(source: str = None, print_cmd=True, **kwargs) -> 'AsyncProcess':
+    """Start raw ffplay command as an asyncio subprocess, `await process.wait()`
+    for the player to be closed, cancelling the wait closes it."""
+    from ._aio import create_process
 
-    return subprocess.Popen(args)
+    return await create_process(_get_ffplay_args(source, print_cmd, **kwargs))
 
 
 def ffplay_audio(source: str, f: str = None, channels: int = None, ar: int = None,
@@ -6,7 +6,7 @@ LastEditTime: 2021.06.18 17:21:29
 import json
 import subprocess
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Tuple, Union
 
 from ._utils import convert_kwargs_to_cmd_line_args, drop_empty_list_values
 from .constants import JSON_FORMAT
@@ -14,18 +14,19 @@ from .nodes import FFmpegError
 
 __all__ = [
     'FFprobe',
+    'ametadata',
+    'arun_ffprobe',
     'metadata',
     'run_ffprobe',
 ]
 
 
-def run_ffprobe(source, *args: List, **kwargs: Dict):
-    '''https://ffmpeg.org/ffprobe-all.html'''
-    args = ['ffprobe', '-hide_banner'] + list(args) + convert_kwargs_to_cmd_line_args(kwargs) + [source]
+def _get_ffprobe_args(source, args: List, kwargs: Dict) -> List[str]:
+    return ['ffprobe', '-hide_banner'] + list(args) + convert_kwargs_to_cmd_line_args(kwargs) + [source]
 
-    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-    stdout, stderr = proc.communicate()
-    if proc.returncode != 0:
+
+def _get_ffprobe_result(returncode: int, stdout: bytes, stderr: bytes, kwargs: Dict):
+    if returncode != 0:
         raise FFmpegError('ffprobe', stdout, stderr)
 
     if kwargs.get('print_format') == JSON_FORMAT:
@@ -34,9 +35,27 @@ def run_ffprobe(source, *args: List, **kwargs: Dict):
     return stderr
 
 
-def metadata(filepath, show_format=False, show_streams=False, show_frames=False,
-             show_packets=False, show_programs=False, print_format=None,
-             timeout: float = None, **kwargs) -> Union[dict, str]:
+def run_ffprobe(source, *args: List, **kwargs: Dict):
+    '''https://ffmpeg.org/ffprobe-all.html'''
+    proc = subprocess.Popen(_get_ffprobe_args(source, args, kwargs),
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = proc.communicate()
+    return _get_ffprobe_result(proc.returncode, stdout, stderr, kwargs)
+
+
+async def arun_ffprobe(source, *args: List, **kwargs: Dict):
+    '''Same as `run_ffprobe` without blocking the event loop, cancelling terminates ffprobe.'''
+    from ._aio import create_process
+
+    proc = await create_process(_get_ffprobe_args(source, args, kwargs),
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stdout, stderr = await proc.communicate()
+    return _get_ffprobe_result(proc.returncode, stdout, stderr, kwargs)
+
+
+def _get_metadata_args(show_format=False, show_streams=False, show_frames=False,
+                       show_packets=False, show_programs=False, print_format=None,
+                       timeout: float = None, **kwargs) -> Tuple[List, Dict]:
     if timeout:
         kwargs['timeout'] = timeout * 1000 * 1000  # s
 
@@ -48,19 +67,51 @@ def metadata(filepath, show_format=False, show_streams=False, show_frames=False,
                                   show_streams=show_streams, show_frames=show_frames,
                                   show_packets=show_packets, show_programs=show_programs)
 
+    return args, kwargs
+
+
+def metadata(filepath, show_format=False, show_streams=False, show_frames=False,
+             show_packets=False, show_programs=False, print_format=None,
+             timeout: float = None, **kwargs) -> Union[dict, str]:
+    args, kwargs = _get_metadata_args(show_format, show_streams, show_frames, show_packets,
+                                      show_programs, print_format, timeout, **kwargs)
     return run_ffprobe(filepath, *args, **kwargs)
 
 
+async def ametadata(filepath, show_format=False, show_streams=False, show_frames=False,
+                    show_packets=False, show_programs=False, print_format=None,
+                    timeout: float = None, **kwargs) -> Union[dict, str]:
+    args, kwargs = _get_metadata_args(show_format, show_streams, show_frames, show_packets,
+                                      show_programs, print_format, timeout, **kwargs)
+    return await arun_ffprobe(filepath, *args, **kwargs)
+
+
 class FFprobe(object):
 
     def __init__(self, source: Union[str, Path], show_format=False,
                  show_streams=True, show_frames=False, show_packets=False,
                  show_programs=False, print_format='json', timeout: float = None, **kwargs):
+        self._load(source, metadata(source, show_format=show_format,
+                                    show_streams=show_streams, show_frames=show_frames,
+                                    show_packets=show_packets, show_programs=show_programs,
+                                    print_format=print_format, timeout=timeout, **kwargs))
+
+    @classmethod
+    async def aprobe(cls, source: Union[str, Path], show_format=False,
+                     show_streams=True, show_frames=False, show_packets=False,
+                     show_programs=False, print_format='json', timeout: float = None,
+                     **kwargs) -> 'FFprobe':
+        '''Probe without blocking the event loop, e.g. ``await FFprobe.aprobe(path)``.'''
+        probe = cls.__new__(cls)
+        probe._load(source, await ametadata(source, show_format=show_format,
+                                            show_streams=show_streams, show_frames=show_frames,
+                                            show_packets=show_packets, show_programs=show_programs,
+                                            print_format=print_format, timeout=timeout, **kwargs))
+        return probe
+
+    def _load(self, source: Union[str, Path], metadata: dict):
         self._source = source
-        self._metadata = metadata(source, show_format=show_format,
-                                  show_streams=show_streams, show_frames=show_frames,
-                                  show_packets=show_packets, show_programs=show_programs,
-                                  print_format=print_format, timeout=timeout, **kwargs)
+        self._metadata = metadata
         self._streams = self._metadata.get('streams', [])
 
         if len(self._streams) == 0:
@@ -0,0 +1,223 @@
+'''
+Date: 2026.10.18 19:58:26
+Description: Where commands, timings, progress and errors are reported to
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 19:58:26
+'''
+from __future__ import annotations
+
+import logging
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from pkgs import color
+
+from ._utils import join_cmd_args_seq
+
+if TYPE_CHECKING:
+    from ._progress import ProgressEvent
+    from .nodes import FFmpegError, RunResult
+
+__all__ = [
+    'ConsoleSink',
+    'LoggingSink',
+    'MetricsSink',
+    'NullSink',
+    'Sink',
+    'TeeSink',
+    'get_sink',
+    'set_sink',
+]
+
+
+class Sink(object):
+    """Receives what running ffmpeg reports, each method ignores it by default.
+
+    `on_command` gets the command lines compiled with `print_cmd`, `on_result`
+    and `on_error` every job run by `run`, `arun` or a `JobRunner`, and
+    `on_progress` the progress read by a `ProgressMonitor` or `iter_progress`.
+    Methods may be called from several threads at once."""
+
+    def on_command(self, args: List[str]):
+        pass
+
+    def on_result(self, result: RunResult):
+        pass
+
+    def on_error(self, error: FFmpegError, elapsed: float):
+        pass
+
+    def on_progress(self, event: ProgressEvent):
+        pass
+
+
+class NullSink(Sink):
+    """Reports nothing, for when even the console output shows in profiles."""
+
+
+class ConsoleSink(Sink):
+    """Prints commands in green and timings in red, as this package always did."""
+
+    def on_command(self, args: List[str]):
+        color.greenln(join_cmd_args_seq(args))
+
+    def on_result(self, result: RunResult):
+        # Quiet runs, like a `JobRunner`'s jobs, print nothing. A timing would
+        # land in the middle of a progress bar
+        if result.print_cmd and result.elapsed is not None and '-progress' not in result.args:
+            color.redln("[%2.4fs]\n" % result.elapsed)
+
+
+class LoggingSink(Sink):
+    """Reports to the `ffmpeg` logger, or `logger`: commands and progress
+    at DEBUG, results at INFO and errors at ERROR."""
+
+    def __init__(self, logger: logging.Logger = None):
+        self.logger = logger or logging.getLogger('ffmpeg')
+
+    def on_command(self, args: List[str]):
+        self.logger.debug('%s', join_cmd_args_seq(args))
+
+    def on_result(self, result: RunResult):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        usage = result.usage
+        if usage is None:
+            self.logger.info('ffmpeg finished in %.3fs', result.elapsed or 0.0)
+        else:
+            self.logger.info('ffmpeg finished in %.3fs, cpu %.3fs, max rss %.1f MiB', result.elapsed or 0.0,
+                             usage.cpu_time, usage.max_rss / (1 << 20))
+
+    def on_error(self, error: FFmpegError, elapsed: float):
+        self.logger.error('ffmpeg failed after %.3fs: %s', elapsed, error)
+
+    def on_progress(self, event: ProgressEvent):
+        self.logger.debug('%r', event)
+
+
+class TeeSink(Sink):
+    """Reports to every one of `sinks`."""
+
+    def __init__(self, *sinks: Sink):
+        self.sinks = sinks
+
+    def on_command(self, args: List[str]):
+        for sink in self.sinks:
+            sink.on_command(args)
+
+    def on_result(self, result: RunResult):
+        for sink in self.sinks:
+            sink.on_result(result)
+
+    def on_error(self, error: FFmpegError, elapsed: float):
+        for sink in self.sinks:
+            sink.on_error(error, elapsed)
+
+    def on_progress(self, event: ProgressEvent):
+        for sink in self.sinks:
+            sink.on_progress(event)
+
+
+# name -> (type, help), in the order they are exported
+_metrics = {
+    'ffmpeg_jobs': ('counter', 'ffmpeg jobs finished, by result.'),
+    'ffmpeg_job_duration_seconds': ('summary', 'Wall-clock time of ffmpeg jobs.'),
+    'ffmpeg_job_cpu_seconds': ('counter', 'CPU time used by ffmpeg jobs, by mode.'),
+    'ffmpeg_job_io_blocks': ('counter', 'Disk blocks read and written by ffmpeg jobs.'),
+    'ffmpeg_job_max_rss_bytes': ('gauge', 'Peak resident memory of a single ffmpeg job.'),
+    'ffmpeg_progress_updates': ('counter', 'Progress updates received.'),
+    'ffmpeg_progress_speed': ('gauge', 'Last speed reported, as a multiple of real time.'),
+}
+
+
+class MetricsSink(Sink):
+    """Counts jobs, their time, CPU, memory and I/O, and exports them with
+    `render` in the OpenMetrics text format, e.g. for a Prometheus textfile
+    collector or an HTTP handler. `labels` are added to every sample."""
+
+    def __init__(self, labels: Dict[str, str] = None):
+        self._labels = dict(labels or {})
+        # (family, suffix, labels) -> value
+        self._samples: Dict[Tuple[str, str, Tuple[Tuple[str, str], ...]], float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def _add(self, family: str, suffix: str, value: float, **labels: str):
+        self._samples[family, suffix, tuple(sorted(labels.items()))] += value
+
+    def _set(self, family: str, value: float, peak=False):
+        key = (family, '', ())
+        self._samples[key] = max(self._samples[key], value) if peak else value
+
+    def on_result(self, result: RunResult):
+        with self._lock:
+            self._add('ffmpeg_jobs', '_total', 1, result='ok')
+            if result.elapsed is not None:
+                self._add('ffmpeg_job_duration_seconds', '_count', 1)
+                self._add('ffmpeg_job_duration_seconds', '_sum', result.elapsed)
+
+            usage = result.usage
+            if usage is not None:
+                self._add('ffmpeg_job_cpu_seconds', '_total', usage.user_time, mode='user')
+                self._add('ffmpeg_job_cpu_seconds', '_total', usage.system_time, mode='system')
+                self._add('ffmpeg_job_io_blocks', '_total', usage.read_blocks, direction='read')
+                self._add('ffmpeg_job_io_blocks', '_total', usage.write_blocks, direction='write')
+                self._set('ffmpeg_job_max_rss_bytes', usage.max_rss, peak=True)
+
+    def on_error(self, error: FFmpegError, elapsed: float):
+        with self._lock:
+            self._add('ffmpeg_jobs', '_total', 1, result='error')
+            self._add('ffmpeg_job_duration_seconds', '_count', 1)
+            self._add('ffmpeg_job_duration_seconds', '_sum', elapsed)
+
+    def on_progress(self, event: ProgressEvent):
+        with self._lock:
+            self._add('ffmpeg_progress_updates', '_total', 1)
+            if event.speed is not None:
+                self._set('ffmpeg_progress_speed', event.speed)
+
+    def _format_labels(self, labels: Tuple[Tuple[str, str], ...]) -> str:
+        labels = {**self._labels, **dict(labels)}
+        if not labels:
+            return ''
+        return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + '}'
+
+    def render(self) -> str:
+        '''The metrics in the OpenMetrics text format, ending with `# EOF`.'''
+        with self._lock:
+            samples = sorted(self._samples.items())
+
+        lines = []
+        for family, (type_, help_) in _metrics.items():
+            lines.append(f'# TYPE {family} {type_}')
+            lines.append(f'# HELP {family} {help_}')
+            for (name, suffix, labels), value in samples:
+                if name == family:
+                    lines.append(f'{name}{suffix}{self._format_labels(labels)} {value!r}')
+
+        lines.append('# EOF')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+
+def _escape_label(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+_sink: Sink = ConsoleSink()
+
+
+def get_sink() -> Sink:
+    return _sink
+
+
+def set_sink(sink: Sink = None) -> Sink:
+    '''Report to `sink` from now on, None for `NullSink`. Returns the sink reported to so far.'''
+    global _sink
+
+    previous, _sink = _sink, sink or NullSink()
+    return previous
@@ -12,6 +12,7 @@ from typing import Any, Dict, List, Tuple, Type, Union
 from ._dag import DagEdge, DagNode, Edge, get_outgoing_edges
 
 __all__ = [
+    'CompileReport',
     'Node',
     'NodeTypes',
     'Stream',
@@ -22,6 +23,22 @@ __all__ = [
 ]
 
 
+class CompileReport(object):
+    """What the optimizing passes changed while compiling a graph."""
+    __slots__ = ('merged_nodes', 'pushed_seeks', 'removed_nodes', 'inserted_splits', 'fused_pads')
+
+    def __init__(self):
+        self.merged_nodes = 0  # nodes merged into a structurally identical one
+        self.pushed_seeks = 0  # trim/select filters turned into input seeking options
+        self.removed_nodes = []  # details of the no-op filters removed
+        self.inserted_splits = 0  # `split`/`asplit` filters added for shared outputs
+        self.fused_pads = 0  # pad labels saved by chaining filters with commas
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+
 def get_stream_graph(stream_spec: Union[Stream, Dict[Any, Stream],
                                         List[Stream], Tuple[Stream]]) -> Dict[str, Stream]:
     stream_graph = dict()
@@ -63,6 +80,8 @@ class Stream(object):
     """Represents the outgoing edge of an upstream node;
     may be used to create more downstream nodes."""
 
+    __slots__ = ('_node', '_label', '_selector')
+
     def __init__(self, upstream_node: DagNode, upstream_label: str, node_types=None, selector=None):
         if node_types and not isinstance(upstream_node, node_types):
             raise TypeError('Expected upstream node to be of one of the following type(s): '
@@ -99,7 +118,10 @@ class Stream(object):
         return self['v']
 
     def view(self, save_path=None, detail=False, show_labels=True, pipe=False, **kwargs):
-        raise NotImplementedError
+        # Replaced by `etools.view` once `etools` is imported
+        from .tools import etools
+        return etools.view(self, save_path=save_path, detail=detail,
+                           show_labels=show_labels, pipe=pipe, **kwargs)
 
     def __repr__(self):
         node = self._node.__repr__()
@@ -129,6 +151,7 @@ class NodeTypes(str, Enum):
 
 
 class Node(DagNode):
+    __slots__ = ('_outgoing_stream_type', '_incoming_stream_types')
 
     def __init__(self, label: str, stream_spec, incoming_stream_types: Tuple[Type[Stream]],
                  outgoing_stream_type: Type[Stream], min_inputs=0, max_inputs=0,
@@ -248,12 +271,57 @@ def get_filter_spec(node: Node, outgoing_edge_graph: Dict[str, List[Edge]],
     return f"{''.join(inputs)}{node.get_filter_spec(outgoing_edges)}{''.join(outputs)}"
 
 
+def get_chain_spec(chain: List[Node], outgoing_edge_graphs: Dict[DagNode, Dict[str, List[Edge]]],
+                   stream_tag_graph: Dict[Tuple[DagNode, str], str]) -> str:
+    if len(chain) == 1:
+        return get_filter_spec(chain[0], outgoing_edge_graphs[chain[0]], stream_tag_graph)
+
+    head, tail = chain[0], chain[-1]
+    outgoing_edges = get_outgoing_edges(tail, outgoing_edge_graphs[tail])
+
+    inputs = [format_input_stream_tag(stream_tag_graph, edge) for edge in head.incoming_edges]
+    outputs = [format_output_stream_tag(stream_tag_graph, edge) for edge in outgoing_edges]
+    specs = [node.get_filter_spec(get_outgoing_edges(node, outgoing_edge_graphs[node])) for node in chain]
+
+    return f"{''.join(inputs)}{','.join(specs)}{''.join(outputs)}"
+
+
+def get_fused_successors(filter_nodes: List[Node],
+                         outgoing_edge_graphs: Dict[DagNode, Dict[str, List[Edge]]]) -> Dict[Node, Node]:
+    """Map every filter to the filter it can be chained to with a comma,
+    i.e. its only output is the only input of the next filter."""
+    successors = {}
+
+    for node in filter_nodes:
+        outgoing_edge_graph = outgoing_edge_graphs[node]
+        if node.Label == NodeTypes.Movie or len(outgoing_edge_graph) != 1:
+            continue
+
+        (edges,) = outgoing_edge_graph.values()
+        if len(edges) != 1:
+            continue
+
+        downstream_node, downstream_label, selector = edges[0]
+        if (downstream_node.Type != NodeTypes.Filter or downstream_node.Label == NodeTypes.Movie
+                or selector or len(downstream_node.incoming_edge_graph) != 1):
+            continue
+
+        successors[node] = downstream_node
+
+    return successors
+
+
 def allocate_filter_stream_tags(filter_nodes: List[Node],
                                 stream_tag_graph: Dict[Tuple[DagNode, str], str],
-                                outgoing_edge_graphs: Dict[DagNode, Dict[str, List[Edge]]]):
+                                outgoing_edge_graphs: Dict[DagNode, Dict[str, List[Edge]]],
+                                fused_nodes: Dict[Node, Node] = None):
     current_serial_number = 0
+    fused_nodes = fused_nodes or {}
 
     for upstream_node in filter_nodes:
+        if upstream_node in fused_nodes:
+            continue  # chained with a comma, no pad label needed
+
         outgoing_edge_graph = outgoing_edge_graphs[upstream_node]
         for upstream_label, downstreams in outgoing_edge_graph.items():
             if len(downstreams) > 1:
@@ -266,9 +334,25 @@ def allocate_filter_stream_tags(filter_nodes: List[Node],
 
 def get_filters_spec(filter_nodes: List[Node],
                      stream_tag_graph: Dict[Tuple[DagNode, str], str],
-                     outgoing_edge_graphs: Dict[DagNode, Dict[str, List[Edge]]]) -> str:
-    allocate_filter_stream_tags(filter_nodes, stream_tag_graph, outgoing_edge_graphs)
-    return ';'.join(
-            get_filter_spec(node, outgoing_edge_graphs[node], stream_tag_graph)
-            for node in filter_nodes
-    )
+                     outgoing_edge_graphs: Dict[DagNode, Dict[str, List[Edge]]],
+                     fuse_chains=False, report: CompileReport = None) -> str:
+    successors = get_fused_successors(filter_nodes, outgoing_edge_graphs) if fuse_chains else {}
+    allocate_filter_stream_tags(filter_nodes, stream_tag_graph, outgoing_edge_graphs, successors)
+
+    if report is not None:
+        report.fused_pads += len(successors)
+
+    chained = set(successors.values())
+    chains = []
+
+    for node in filter_nodes:
+        if node in chained:
+            continue
+
+        chain = [node]
+        while chain[-1] in successors:
+            chain.append(successors[chain[-1]])
+
+        chains.append(get_chain_spec(chain, outgoing_edge_graphs, stream_tag_graph))
+
+    return ';'.join(chains)
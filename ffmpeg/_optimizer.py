@@ -0,0 +1,430 @@
+'''
+Date: 2026.10.18 10:12:40
+Description: Graph rewriting passes applied before compiling
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 10:12:40
+'''
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from . import settings
+from ._dag import DagNode, Edge, topological_sort
+from ._node import CompileReport, NodeTypes
+from .nodes import FilterNode
+
+__all__ = [
+    'eliminate_no_ops',
+    'get_audio_filters',
+    'get_probe_key',
+    'insert_split_filters',
+    'is_audio_stream',
+    'merge_common_subgraphs',
+    'optimize',
+    'push_down_seeks',
+    'rewrite_graph',
+]
+
+# Audio filters defined outside `afilters`
+_AUDIO_FILTERS = {
+    'afifo', 'ainterleave', 'ametadata', 'amovie', 'aperms', 'arealtime', 'aselect',
+    'asendcmd', 'asetpts', 'asettb', 'asidedata', 'asplit', 'astreamselect', 'azmq',
+}
+
+_SPLIT_FILTERS = {'split', 'asplit'}
+
+_PASS_FILTERS = {'null', 'anull', 'copy', 'acopy'}
+_TRIM_FILTERS = {'trim', 'atrim'}
+_SELECT_FILTERS = {'select', 'aselect'}
+_RESET_FILTERS = {'setpts', 'asetpts'}
+
+# Input options which already seek, loop or shift the timeline
+_SEEK_OPTIONS = {'ss', 't', 'to', 'sseof', 'stream_loop', 'itsoffset', 'noaccurate_seek'}
+
+_select_between = re.compile(r'^\s*between\(\s*t\s*,\s*([^,()]+?)\s*,\s*([^,()]+?)\s*\)\s*$')
+
+
+@lru_cache(maxsize=None)
+def get_audio_filters() -> FrozenSet[str]:
+    from .filters import afilters
+
+    names = {name for name, value in vars(afilters).items()
+             if callable(value) and getattr(value, '__module__', None) == afilters.__name__}
+
+    return frozenset(names | _AUDIO_FILTERS)
+
+
+def is_audio_stream(node: DagNode, label: str, known: Dict[Tuple[DagNode, str], bool] = None) -> bool:
+    '''Guess whether an outgoing stream of the node carries audio.
+
+    Walks upstream through single-input filters until a known audio or
+    video filter, or an input stream with a selector, decides it. Pass the
+    same `known` dict to repeated calls to remember the streams walked over.'''
+    audio_filters = get_audio_filters()
+    known = {} if known is None else known
+    walked = []
+
+    while True:
+        if (node, label) in known:
+            audio = known[node, label]
+            break
+
+        walked.append((node, label))
+
+        if node.Type == NodeTypes.Input:
+            audio = False
+            break
+
+        if node.Label in audio_filters:
+            audio = True
+            break
+
+        if node.Label == 'concat':
+            v, a = int(node._kwargs.get('v', 1)), int(node._kwargs.get('a', 0))
+            audio = isinstance(label, int) and label % (v + a) >= v
+            break
+
+        edges = list(node.incoming_edge_graph.values())
+        if len(edges) == 0:
+            audio = False
+            break
+
+        edge = edges[0]
+        if edge.Node.Type == NodeTypes.Input:
+            audio = str(edge.Selector or '').startswith('a')
+            break
+
+        node, label = edge.Node, edge.Label
+
+    for stream in walked:
+        known[stream] = audio
+
+    return audio
+
+
+def _copy_if_changed(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> DagNode:
+    if incoming_edge_graph == node.incoming_edge_graph:
+        return node
+    return node.clone(incoming_edge_graph)
+
+
+def _reconnect(incoming_edge_graph: Dict[str, Edge], bypass: Dict[DagNode, Edge]):
+    for label, edge in incoming_edge_graph.items():
+        if edge.Node in bypass:
+            incoming_edge_graph[label] = bypass[edge.Node]
+
+
+def rewrite_graph(nodes: List[DagNode],
+                  rewrite: Callable[[DagNode, Dict[str, Edge]], DagNode]) -> List[DagNode]:
+    '''Rebuild the graph from upstream to downstream.
+
+    The `rewrite` callback receives every node with its incoming edges already
+    pointing at rewritten upstream nodes, and returns the node to use instead.
+    Nodes of the original graph are never modified.'''
+    sorted_nodes, _ = topological_sort(list(nodes))
+    mapping = {}
+
+    for node in sorted_nodes:
+        incoming_edge_graph = {label: Edge(mapping[edge.Node], edge.Label, edge.Selector)
+                               for label, edge in node.incoming_edge_graph.items()}
+        mapping[node] = rewrite(node, incoming_edge_graph)
+
+    return [mapping[node] for node in nodes]
+
+
+def merge_common_subgraphs(nodes: List[DagNode], report: CompileReport = None) -> List[DagNode]:
+    '''Merge structurally identical input and filter nodes, so that
+    duplicate inputs are opened once and duplicate chains run once.'''
+    seen = {}
+
+    def rewrite(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> DagNode:
+        node = _copy_if_changed(node, incoming_edge_graph)
+
+        if node.Type not in {NodeTypes.Input, NodeTypes.Filter} or node.Label in _SPLIT_FILTERS:
+            return node
+
+        key = (node.signature, tuple(incoming_edge_graph.items()))
+        merged = seen.setdefault(key, node)
+        if merged is not node and report is not None:
+            report.merged_nodes += 1
+
+        return merged
+
+    return rewrite_graph(nodes, rewrite)
+
+
+def insert_split_filters(nodes: List[DagNode], report: CompileReport = None) -> List[DagNode]:
+    '''Insert `split`/`asplit` behind every filter output consumed more than once.
+
+    Input streams may be referenced several times and are left alone.'''
+    _, outgoing_edge_graphs = topological_sort(list(nodes))
+
+    shared = {(node, label) for node, outgoing_edge_graph in outgoing_edge_graphs.items()
+              if node.Type == NodeTypes.Filter
+              for label, edges in outgoing_edge_graph.items() if len(edges) > 1}
+
+    if not shared:
+        return nodes
+
+    mapping = {}  # rewritten upstream node -> original upstream node
+    splits: Dict[Tuple[DagNode, str], FilterNode] = {}
+    consumed = defaultdict(int)
+    known = {}
+
+    def rewrite(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> DagNode:
+        for label, edge in incoming_edge_graph.items():
+            upstream = mapping[edge.Node], edge.Label
+            if upstream not in shared:
+                continue
+
+            split = splits.get(upstream)
+            if split is None:
+                name = 'asplit' if is_audio_stream(*upstream, known) else 'split'
+                split = splits[upstream] = FilterNode([edge.Node.stream(edge.Label)], name)
+                if report is not None:
+                    report.inserted_splits += 1
+
+            incoming_edge_graph[label] = Edge(split, consumed[upstream], edge.Selector)
+            consumed[upstream] += 1
+
+        new_node = _copy_if_changed(node, incoming_edge_graph)
+        mapping[new_node] = node
+        return new_node
+
+    return rewrite_graph(nodes, rewrite)
+
+
+def get_seek_window(node: DagNode) -> Optional[Tuple[Tuple[str, str], ...]]:
+    '''Input options `ss`, `t` and `to` equivalent to a trim or select-by-time
+    filter, or None if the filter does anything else.'''
+    if node.Label in _TRIM_FILTERS and not node._args:
+        window = {'start': 'ss', 'duration': 't', 'end': 'to'}
+        if not node._kwargs or not set(node._kwargs) <= set(window) or \
+                {'duration', 'end'} <= set(node._kwargs):
+            return None
+        return tuple(sorted((window[key], str(value)) for key, value in node._kwargs.items()))
+
+    if node.Label in _SELECT_FILTERS:
+        expr = node._args + tuple(str(v) for k, v in node._kwargs.items() if k in {'expr', 'e'})
+        if len(expr) != 1 or len(node._args) + len(node._kwargs) != 1:
+            return None
+        match = _select_between.match(expr[0])
+        if match is None:
+            return None
+        return ('ss', match.group(1)), ('to', match.group(2))
+
+    return None
+
+
+def _is_pts_reset(node: DagNode) -> bool:
+    expr = node._args + tuple(str(v) for k, v in node._kwargs.items() if k == 'expr')
+    return node.Label in _RESET_FILTERS and len(expr) == 1 and \
+           len(node._args) + len(node._kwargs) == 1 and expr[0].replace(' ', '') == 'PTS-STARTPTS'
+
+
+def _can_seek(node: DagNode) -> bool:
+    source = node._kwargs['source']
+    return not (source == '-' or source.startswith('pipe:') or
+                node._kwargs.get('f') == 'lavfi' or _SEEK_OPTIONS & set(node._kwargs))
+
+
+def push_down_seeks(nodes: List[DagNode], report: CompileReport = None) -> List[DagNode]:
+    '''Turn trim/atrim or select-by-time filters read straight from an input
+    into input options, so that ffmpeg seeks instead of decoding from the start.
+
+    Every consumer of the input must cut the same window and reset timestamps
+    with `setpts=PTS-STARTPTS` right after, since input seeking also rebases
+    them. ffmpeg seeks accurately when transcoding, so the cut is unchanged.'''
+    _, outgoing_edge_graphs = topological_sort(list(nodes))
+    windows = {}  # input node -> input options
+    seeks = set()  # filters replaced by input options
+
+    for node, outgoing_edge_graph in list(outgoing_edge_graphs.items()):
+        if node.Type != NodeTypes.Input or not _can_seek(node):
+            continue
+
+        consumers = [edge for edges in outgoing_edge_graph.values() for edge in edges]
+        window = {get_seek_window(edge.Node) for edge in consumers}
+        if len(window) != 1 or None in window:
+            continue
+
+        for edge in consumers:
+            downstreams = [downstream for downstreams in outgoing_edge_graphs[edge.Node].values()
+                           for downstream in downstreams]
+            if len(downstreams) != 1 or downstreams[0].Selector or not _is_pts_reset(downstreams[0].Node):
+                break
+        else:
+            windows[node] = dict(window.pop())
+            seeks.update(edge.Node for edge in consumers)
+
+    if not windows:
+        return nodes
+
+    bypass = {}  # rewritten seek filter -> its incoming edge
+
+    def rewrite(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> DagNode:
+        if node in windows:
+            return node.clone(kwargs={**node._kwargs, **windows[node]})
+
+        _reconnect(incoming_edge_graph, bypass)
+
+        new_node = _copy_if_changed(node, incoming_edge_graph)
+        if node in seeks:
+            (bypass[new_node],) = incoming_edge_graph.values()
+            if report is not None:
+                report.pushed_seeks += 1
+
+        return new_node
+
+    return rewrite_graph(nodes, rewrite)
+
+
+def _get_probe_streams(probe: Any) -> List[Dict]:
+    if probe is None:
+        return []
+    if hasattr(probe, 'streams'):  # FFprobe
+        return probe.streams
+    if isinstance(probe, dict):  # ffprobe json output
+        return probe.get('streams', [])
+    return list(probe)
+
+
+def get_probe_key(probes: Dict[str, Any]) -> Tuple:
+    '''The part of the probe data used by the optimizer, hashable.'''
+    return tuple(sorted(
+            (source, tuple((stream.get('codec_type'), stream.get('width'), stream.get('height'),
+                            stream.get('start_time'), _is_rotated(stream)) for stream in _get_probe_streams(probe)))
+            for source, probe in probes.items()
+    ))
+
+
+def _get_probe_stream(probe: Any, selector: Optional[str], codec_type: str) -> Optional[Dict]:
+    streams = _get_probe_streams(probe)
+    parts = str(selector).split(':') if selector else [codec_type[0]]
+
+    if parts[0].isdigit():
+        return streams[int(parts[0])] if len(parts) == 1 and int(parts[0]) < len(streams) else None
+
+    if parts[0] != codec_type[0] or len(parts) > 2 or not all(part.isdigit() for part in parts[1:]):
+        return None
+
+    streams = [stream for stream in streams if stream.get('codec_type') == codec_type]
+    index = int(parts[1]) if len(parts) == 2 else 0
+    return streams[index] if index < len(streams) else None
+
+
+def _is_rotated(stream: Dict) -> bool:
+    '''Whether a `rotate` tag or display matrix turns the video, ffmpeg then
+    autorotates it and the frames are no longer of the coded size.'''
+    angles = [(stream.get('tags') or {}).get('rotate')]
+    angles.extend(side_data.get('rotation') for side_data in stream.get('side_data_list') or ())
+    return any(float(angle) % 360 for angle in angles if angle is not None)
+
+
+def _get_scale_size(node: DagNode) -> Optional[Tuple[str, str]]:
+    if len(node._args) == 2 and not node._kwargs:
+        return node._args
+    for w, h in (('w', 'h'), ('width', 'height')):
+        if not node._args and set(node._kwargs) == {w, h}:
+            return str(node._kwargs[w]), str(node._kwargs[h])
+    return None
+
+
+def _is_no_op(node: DagNode, edge: Edge, consumers: int, probes: Dict[str, Any]) -> bool:
+    if node.Label in _PASS_FILTERS:
+        return not node._args and not node._kwargs
+
+    if node.Label in _SPLIT_FILTERS:
+        return consumers == 1
+
+    if edge.Node.Type != NodeTypes.Input or node.Label not in _RESET_FILTERS | {'scale'}:
+        return False
+
+    codec_type = 'audio' if node.Label == 'asetpts' else 'video'
+    stream = _get_probe_stream(probes.get(edge.Node._kwargs['source']), edge.Selector, codec_type)
+    if stream is None:
+        return False
+
+    if _is_pts_reset(node):  # ffmpeg shifts the input to start at 0, unless told where to start
+        return not _SEEK_OPTIONS & set(edge.Node._kwargs) and stream.get('start_time') in {0, '0', '0.000000'}
+
+    size = _get_scale_size(node)
+    return size is not None and 's' not in edge.Node._kwargs and not _is_rotated(stream) and \
+           size == (str(stream.get('width')), str(stream.get('height')))
+
+
+def eliminate_no_ops(nodes: List[DagNode], report: CompileReport = None,
+                     probes: Dict[str, Any] = None) -> List[DagNode]:
+    '''Remove filters that pass their input through unchanged.
+
+    These are `null`, `anull`, `copy` and `acopy`, and `split`/`asplit` with
+    a single consumer. With probe data, an `FFprobe` or ffprobe json keyed
+    by input source, also `setpts=PTS-STARTPTS` on an input stream starting
+    at 0, and `scale` of an unrotated input stream to its own size. A filter between
+    an input and an output is kept, its `-map` selects the streams written.
+
+    Nodes unreachable from the outputs are never part of the graph, since it
+    is collected by walking upstream from them.'''
+    sorted_nodes, outgoing_edge_graphs = topological_sort(list(nodes))
+    removed = {}  # no-op filter -> its incoming edge, skipping removed filters
+
+    for node in sorted_nodes:
+        outgoing_edge_graph = outgoing_edge_graphs[node]
+        if node.Type != NodeTypes.Filter or len(node.incoming_edge_graph) != 1 or len(outgoing_edge_graph) != 1:
+            continue
+
+        (edge,) = node.incoming_edge_graph.values()
+        edge = removed.get(edge.Node, edge)
+
+        downstreams = [downstream for downstreams in outgoing_edge_graph.values() for downstream in downstreams]
+        if any(downstream.Selector for downstream in downstreams):
+            continue
+
+        # An input mapped straight to an output selects other streams than the
+        # filter read, `-map 0` all of them and `0:v` every video stream
+        if edge.Node.Type == NodeTypes.Input and \
+                any(downstream.Node.Type == NodeTypes.Output for downstream in downstreams):
+            continue
+
+        if _is_no_op(node, edge, len(downstreams), probes or {}):
+            removed[node] = edge
+
+    if not removed:
+        return nodes
+
+    bypass = {}  # rewritten no-op filter -> its incoming edge
+
+    def rewrite(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> DagNode:
+        _reconnect(incoming_edge_graph, bypass)
+
+        new_node = _copy_if_changed(node, incoming_edge_graph)
+        if node in removed:
+            (bypass[new_node],) = incoming_edge_graph.values()
+            if report is not None:
+                report.removed_nodes.append(node.detail)
+
+        return new_node
+
+    return rewrite_graph(nodes, rewrite)
+
+
+def optimize(nodes: List[DagNode], report: CompileReport = None,
+             probes: Dict[str, Any] = None) -> List[DagNode]:
+    '''Run the enabled rewriting passes over the graph ending at the nodes,
+    counting what they changed in `report` if given.'''
+    if settings.MERGE_COMMON_SUBGRAPHS:
+        nodes = merge_common_subgraphs(nodes, report)
+
+    if settings.PUSH_DOWN_SEEKS:
+        nodes = push_down_seeks(nodes, report)
+
+    if settings.ELIMINATE_NO_OPS:
+        nodes = eliminate_no_ops(nodes, report, probes)
+
+    if settings.AUTO_SPLIT:
+        nodes = insert_split_filters(nodes, report)
+
+    return nodes
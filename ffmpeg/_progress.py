@@ -0,0 +1,230 @@
+'''
+Date: 2026.10.18 17:21:36
+Description: Parse ffmpeg `-progress` output and watch the progress of many jobs on one thread
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 17:21:36
+'''
+from __future__ import annotations
+
+import os
+import selectors
+import threading
+import traceback
+from typing import Callable, Dict, List, Optional, Union
+
+from ._instrument import get_sink
+
+__all__ = [
+    'ProgressEvent',
+    'ProgressMonitor',
+    'ProgressParser',
+]
+
+
+def _to_number(value: Optional[str], type_=float):
+    # ffmpeg writes N/A until a value is known, speed and bitrate come with units
+    try:
+        return type_(value.rstrip('x'))
+    except (AttributeError, ValueError):
+        return None
+
+
+class ProgressEvent(object):
+    """One block of ffmpeg `-progress` output, ending with a `progress=` line.
+
+    `eta` is the estimated number of seconds left, known if the duration of
+    the output was given and ffmpeg reports its speed."""
+    __slots__ = ('frame', 'fps', 'bitrate', 'total_size', 'out_time_us', 'speed', 'end', 'eta', 'fields')
+
+    def __init__(self, fields: Dict[str, str], duration: float = None):
+        self.fields = fields
+        self.frame = _to_number(fields.get('frame'), int)
+        self.fps = _to_number(fields.get('fps'))
+        self.bitrate = fields.get('bitrate')
+        self.total_size = _to_number(fields.get('total_size'), int)
+        self.out_time_us = _to_number(fields.get('out_time_us'), int)
+        self.speed = _to_number(fields.get('speed'))
+        self.end = fields.get('progress') == 'end'
+
+        self.eta = None
+        if self.end:
+            self.eta = 0.0
+        elif duration and self.speed and self.out_time_us is not None:
+            self.eta = max(0.0, duration - self.out_time) / self.speed
+
+    @property
+    def out_time(self) -> Optional[float]:
+        """Timestamp of the output in seconds."""
+        return None if self.out_time_us is None else self.out_time_us / 1e6
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__[:-1])
+        return f'{type(self).__name__}({fields})'
+
+
+class ProgressParser(object):
+    """Turns chunks of `-progress` output into `ProgressEvent`s, only the
+    last incomplete line is carried over to the next chunk."""
+    __slots__ = ('_duration', '_pending', '_fields')
+
+    def __init__(self, duration: float = None):
+        self._duration = duration
+        self._pending = b''
+        self._fields = {}
+
+    def feed(self, data: bytes) -> List[ProgressEvent]:
+        *lines, self._pending = (self._pending + data).split(b'\n') if self._pending else data.split(b'\n')
+
+        events = []
+        for line in lines:
+            key, sep, value = line.decode('utf-8', errors='replace').partition('=')
+            if not sep:
+                continue
+
+            key = key.strip()
+            self._fields[key] = value.strip()
+            if key == 'progress':
+                events.append(ProgressEvent(self._fields, self._duration))
+                self._fields = {}
+
+        return events
+
+
+class _Watch(object):
+    __slots__ = ('fd', 'parser', 'callback', 'owned')
+
+    def __init__(self, fd: int, parser: ProgressParser, callback: Callable[[ProgressEvent], None], owned: bool):
+        self.fd = fd
+        self.parser = parser
+        self.callback = callback
+        self.owned = owned
+
+
+class ProgressMonitor(object):
+    """Reads the `-progress` output of many ffmpeg jobs on a single thread.
+
+    `run_async` starts a job writing its progress to a pipe of its own,
+    `watch` adds any readable pipe or socket. Callbacks run on the monitor
+    thread, they should return quickly. POSIX only."""
+
+    def __init__(self, chunk_size=1 << 16):
+        self._chunk_size = chunk_size
+        self._selector = selectors.DefaultSelector()
+        self._waker, self._wakeup = os.pipe()
+        os.set_blocking(self._waker, False)
+        self._selector.register(self._waker, selectors.EVENT_READ)
+        self._pending: List[_Watch] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._loop, name='ffmpeg-progress', daemon=True)
+        self._thread.start()
+
+    @property
+    def watching(self) -> int:
+        return len(self._selector.get_map()) - 1
+
+    def watch(self, fileobj: Union[int, object], callback: Callable[[ProgressEvent], None],
+              duration: float = None, close=True):
+        '''Read progress from a file descriptor or an object with `fileno`,
+        until end of file. With `close`, it is closed then.'''
+        fd = fileobj if isinstance(fileobj, int) else fileobj.fileno()
+        if close and not isinstance(fileobj, int):
+            fd = os.dup(fd)  # the descriptor outlives the object
+            fileobj.close()
+
+        with self._lock:
+            if self._closed:
+                raise ValueError('Watch on a closed progress monitor')
+            self._pending.append(_Watch(fd, ProgressParser(duration), callback, close))
+        os.write(self._wakeup, b'\0')
+
+    def run_async(self, stream, callback: Callable[[ProgressEvent], None], duration: float = None,
+                  **kwargs):
+        '''Start ffmpeg for the graph like `OutputStream.run_async`,
+        passing its progress to `callback`.'''
+        read_fd, write_fd = os.pipe()
+        try:
+            process = stream.run_async(progress=f'pipe:{write_fd}', pass_fds=(write_fd,), **kwargs)
+        except BaseException:
+            os.close(read_fd)
+            raise
+        finally:
+            os.close(write_fd)
+
+        self.watch(read_fd, callback, duration)
+        return process
+
+    def _loop(self):
+        while True:
+            for key, _ in self._selector.select():
+                if key.fileobj == self._waker:
+                    if not self._wake():
+                        return
+                    continue
+
+                watch: _Watch = key.data
+                try:
+                    data = os.read(watch.fd, self._chunk_size)
+                except OSError:
+                    data = b''
+
+                if not data:
+                    self._unwatch(watch)
+                    continue
+
+                sink = get_sink()
+                for event in watch.parser.feed(data):
+                    sink.on_progress(event)
+                    try:
+                        watch.callback(event)
+                    except Exception:
+                        traceback.print_exc()
+
+    def _wake(self) -> bool:
+        # Register what `watch` queued, false once closed
+        try:
+            while os.read(self._waker, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+            closed = self._closed
+
+        for watch in pending:
+            self._selector.register(watch.fd, selectors.EVENT_READ, watch)
+
+        if closed:
+            for key in list(self._selector.get_map().values()):
+                if key.data is not None:
+                    self._unwatch(key.data)
+
+        return not closed
+
+    def _unwatch(self, watch: _Watch):
+        self._selector.unregister(watch.fd)
+        if watch.owned:
+            os.close(watch.fd)
+
+    def close(self):
+        '''Stop watching, pending progress is dropped.'''
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        os.write(self._wakeup, b'\0')
+        self._thread.join()
+        self._selector.close()
+        os.close(self._waker)
+        os.close(self._wakeup)
+
+    def __enter__(self) -> ProgressMonitor:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} watching={self.watching}>'
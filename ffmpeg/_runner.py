@@ -0,0 +1,223 @@
+'''
+Date: 2026.10.18 14:48:55
+Description: Run many ffmpeg jobs at once, sharing the CPUs between them
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 14:48:55
+'''
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+from . import settings
+from ._dag import DagNode, Edge
+from ._instrument import get_sink
+from ._node import NodeTypes, get_stream_spec_nodes
+from ._optimizer import rewrite_graph
+from ._progress import ProgressEvent, ProgressMonitor
+from ._stderr import StderrCapture
+from ._usage import ResourceUsage
+from ._watchdog import FFmpegTimeoutError, Watchdog, WatchdogEvent
+from .nodes import FFmpegError, FFmpegProcess, GlobalNode, OutputStream, RunResult
+
+__all__ = [
+    'JobRunner',
+    'available_cpus',
+    'with_threads',
+]
+
+_thread_options = ('-filter_threads', '-filter_complex_threads')
+
+
+def available_cpus() -> int:
+    '''CPUs this process may run on.'''
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not Linux
+        return os.cpu_count() or 1
+
+
+def with_threads(stream: OutputStream, threads: int) -> OutputStream:
+    '''Copy of the graph running each decoder, encoder and filter graph
+    with at most `threads` threads. Thread options already set are kept.'''
+
+    def rewrite(node: DagNode, incoming_edge_graph: Dict[str, Edge]) -> DagNode:
+        kwargs = None
+        if node.Type in {NodeTypes.Input, NodeTypes.Output} and 'threads' not in node._kwargs:
+            kwargs = {**node._kwargs, 'threads': threads}
+
+        if kwargs is None and incoming_edge_graph == node.incoming_edge_graph:
+            return node
+        return node.clone(incoming_edge_graph, kwargs)
+
+    (node,) = rewrite_graph([stream.Node], rewrite)
+    stream = OutputStream(node, stream.Label, stream.Selector)
+
+    present = {arg for node in get_stream_spec_nodes(stream) if node.Type == NodeTypes.Global
+               for arg in node._args}
+    args = [arg for option in _thread_options if option not in present for arg in (option, str(threads))]
+
+    return GlobalNode(stream, args=args).stream() if args else stream
+
+
+class JobRunner(object):
+    """Run ffmpeg jobs with bounded concurrency, dividing the CPUs between them.
+
+    Every job is limited to `threads` threads with `-threads`, `-filter_threads`
+    and `-filter_complex_threads`, so running jobs don't oversubscribe the CPUs.
+    By default half as many jobs as CPUs run at once, with two threads each.
+
+    `on_event` receives the `WatchdogEvent`s of jobs submitted with a timeout,
+    a 'timeout' or 'stall' event comes as soon as the job is being stopped."""
+
+    def __init__(self, max_workers: int = None, threads: int = None, executable="ffmpeg",
+                 on_event: Callable[[WatchdogEvent], None] = None):
+        cpus = available_cpus()
+
+        self._max_workers = max_workers or max(1, cpus // 2)
+        self._threads = threads or max(1, cpus // self._max_workers)
+        self._executable = executable
+        self._executor = ThreadPoolExecutor(self._max_workers, thread_name_prefix='ffmpeg-job')
+        self._processes = set()
+        self._lock = threading.Lock()
+        self._monitor = None
+        self._watchdog = None
+        self._on_event = on_event
+        self._usage = ResourceUsage(jobs=0)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def threads(self) -> int:
+        return self._threads
+
+    @property
+    def executable(self) -> str:
+        return self._executable
+
+    @property
+    def usage(self) -> ResourceUsage:
+        """Summed up usage of the jobs finished so far, failed ones included."""
+        with self._lock:
+            return ResourceUsage(**self._usage.to_dict())
+
+    def submit(self, stream: OutputStream, *, pipe_stdin: bytes = None, capture_stdout=True,
+               capture_stderr=True, overwrite=True, probes: Dict[str, Any] = None,
+               on_progress: Callable[[ProgressEvent], None] = None, duration: float = None,
+               timeout: float = None, stall_timeout: float = None) -> Future:
+        '''Schedule a job, the future resolves to its `RunResult`, unpacking to `(stdout, stderr)`
+        with only the last `settings.STDERR_TAIL_LINES` lines of stderr, or raises
+        `FFmpegError` if ffmpeg fails.
+
+        `on_progress` receives the job's progress, read for all jobs on one
+        thread, `duration` of the output in seconds lets it estimate the ETA.
+
+        A job running for more than `timeout` seconds, or without progress for
+        `stall_timeout` seconds is stopped and raises `FFmpegTimeoutError`.'''
+        stream = with_threads(stream, self._threads)
+        return self._executor.submit(self._run, stream, pipe_stdin, capture_stdout, capture_stderr,
+                                     overwrite, probes, on_progress, duration, timeout, stall_timeout)
+
+    def map(self, streams: Iterable[OutputStream], **kwargs) -> Iterator[RunResult]:
+        '''Schedule all jobs at once, then yield their results in order.'''
+        futures = [self.submit(stream, **kwargs) for stream in streams]
+
+        def results():
+            for future in futures:
+                yield future.result()
+
+        return results()
+
+    def _run(self, stream: OutputStream, pipe_stdin, capture_stdout, capture_stderr,
+             overwrite, probes, on_progress, duration, timeout, stall_timeout) -> RunResult:
+        kwargs = dict(
+                executable=self._executable,
+                print_cmd=False,
+                pipe_stdin=pipe_stdin is not None,
+                pipe_stdout=capture_stdout,
+                pipe_stderr=capture_stderr,
+                overwrite=overwrite,
+                probes=probes,
+        )
+
+        start = perf_counter()
+        job = None
+        if timeout is not None or stall_timeout is not None:
+            job = self._get_watchdog().run_async(stream, timeout=timeout, stall_timeout=stall_timeout,
+                                                 on_progress=on_progress, duration=duration, **kwargs)
+            process: FFmpegProcess = job.process
+        elif on_progress is None:
+            process = stream.run_async(**kwargs)
+        else:
+            process = self._get_monitor().run_async(stream, on_progress, duration, **kwargs)
+
+        with self._lock:
+            self._processes.add(process)
+
+        try:
+            stdout, stderr = process.collect(pipe_stdin, StderrCapture(settings.STDERR_TAIL_LINES))
+        finally:
+            with self._lock:
+                self._processes.discard(process)
+                if process.usage is not None:
+                    self._usage += process.usage
+            if job is not None:
+                job.unwatch()
+
+        error = None
+        if job is not None and job.reason is not None:
+            error = FFmpegTimeoutError(self._executable, stdout, stderr, job.reason)
+        elif process.returncode:
+            error = FFmpegError(self._executable, stdout, stderr)
+
+        if error is not None:
+            get_sink().on_error(error, perf_counter() - start)
+            raise error
+
+        result = RunResult(stdout, stderr, process.args, process.returncode, process.usage, perf_counter() - start,
+                           print_cmd=False)
+        get_sink().on_result(result)
+        return result
+
+    def _get_monitor(self) -> ProgressMonitor:
+        with self._lock:
+            if self._monitor is None:
+                self._monitor = ProgressMonitor()
+            return self._monitor
+
+    def _get_watchdog(self) -> Watchdog:
+        monitor = self._get_monitor()
+        with self._lock:
+            if self._watchdog is None:
+                self._watchdog = Watchdog(on_event=self._on_event, monitor=monitor)
+            return self._watchdog
+
+    def shutdown(self, wait=True, cancel=False):
+        '''Stop accepting jobs. With `cancel`, drop pending jobs and terminate running ones.'''
+        self._executor.shutdown(wait=False, cancel_futures=cancel)
+
+        if cancel:
+            with self._lock:
+                for process in self._processes:
+                    process.terminate()
+
+        self._executor.shutdown(wait=wait)
+
+        if wait and self._watchdog is not None:
+            self._watchdog.close()
+        if wait and self._monitor is not None:
+            self._monitor.close()
+
+    def __enter__(self) -> JobRunner:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown(cancel=exc_type is not None)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} max_workers={self._max_workers} threads={self._threads}>'
@@ -0,0 +1,97 @@
+'''
+Date: 2026.10.18 17:58:12
+Description: Read ffmpeg's stderr as it is written, keeping only its last lines
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 17:58:12
+'''
+from __future__ import annotations
+
+import collections
+import re
+import threading
+from typing import Callable, Dict, List, Match, Pattern, Union
+
+__all__ = [
+    'StderrCapture',
+]
+
+# ffmpeg ends progress lines with '\r' to redraw them in place
+_line_break = re.compile(rb'\r\n|\r|\n')
+
+
+class StderrCapture(object):
+    """Splits stderr into lines as it arrives and keeps the last `lines` of them,
+    all of them if `lines` is 0.
+
+    `on_line` is called with every line, `hooks` map regular expressions to
+    functions called with the match of each line they are found in. Lines are
+    decoded for callbacks only, the tail is kept as bytes."""
+
+    def __init__(self, lines: int = 256, on_line: Callable[[str], None] = None,
+                 hooks: Dict[Union[str, Pattern], Callable[[Match], None]] = None, encoding='utf-8'):
+        self._lines = collections.deque(maxlen=lines or None)
+        self._on_line = on_line
+        self._hooks = [(re.compile(pattern), hook) for pattern, hook in (hooks or {}).items()]
+        self._encoding = encoding
+        self._pending = b''
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        """Number of lines seen, including those dropped from the tail."""
+        return self._total
+
+    @property
+    def lines(self) -> List[str]:
+        return [line.decode(self._encoding, errors='replace') for line in self._lines]
+
+    @property
+    def tail(self) -> bytes:
+        """The kept lines, each ending with a newline."""
+        return b''.join(line + b'\n' for line in self._lines)
+
+    def feed(self, data: bytes):
+        *lines, self._pending = _line_break.split(self._pending + data)
+        for line in lines:
+            if line:
+                self._add(line)
+
+    def close(self):
+        '''Take the last line even if it has no line break.'''
+        if self._pending:
+            self._add(self._pending)
+            self._pending = b''
+
+    def _add(self, line: bytes):
+        self._lines.append(line)
+        self._total += 1
+
+        if self._on_line is not None or self._hooks:
+            text = line.decode(self._encoding, errors='replace')
+            if self._on_line is not None:
+                self._on_line(text)
+            for pattern, hook in self._hooks:
+                match = pattern.search(text)
+                if match:
+                    hook(match)
+
+    def drain(self, stream, chunk_size=1 << 12) -> threading.Thread:
+        '''Feed everything read from `stream` on a thread, closing it at end of file.
+        ffmpeg blocks once the stderr pipe is full, so it has to be read while it runs.'''
+
+        def drain():
+            with stream:
+                while True:
+                    chunk = stream.read1(chunk_size)
+                    if not chunk:
+                        break
+                    self.feed(chunk)
+            self.close()
+
+        thread = threading.Thread(target=drain, name='ffmpeg-stderr', daemon=True)
+        thread.start()
+        return thread
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {len(self._lines)}/{self._total} lines>'
+
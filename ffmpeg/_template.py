@@ -0,0 +1,102 @@
+'''
+Date: 2026.10.18 13:05:21
+Description: Graphs compiled once and bound to sources/parameters per job
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 13:05:21
+'''
+from __future__ import annotations
+
+import re
+from typing import Any, FrozenSet, List, Tuple
+
+from ._utils import _filter_symbols, escape
+from .nodes import OutputStream, apply_filter_script
+
+__all__ = [
+    'CommandTemplate',
+    'Placeholder',
+]
+
+# Options taking a filter graph, whose placeholder values are escaped
+_filter_options = _filter_symbols | {'-filter', '-filter:v', '-filter:a'}
+
+# NUL can never appear in a real argument, so a placeholder can't collide with one
+_placeholder = re.compile('\0([A-Za-z_][A-Za-z0-9_]*)\0')
+
+
+class Placeholder(str):
+    """A source or parameter left open when building a graph,
+    e.g. ``input(Placeholder('src')).scale(w=Placeholder('width'))``."""
+    __slots__ = ()
+
+    def __new__(cls, name: str):
+        if not name.isidentifier():
+            raise ValueError(f'Placeholder name must be an identifier, got {name!r}')
+        return super().__new__(cls, f'\0{name}\0')
+
+    @property
+    def name(self) -> str:
+        return self[1:-1]
+
+    def __repr__(self):
+        return f'{type(self).__name__}({self.name!r})'
+
+
+def escape_filter_value(value: str) -> str:
+    """Escape a value the way `FilterNode` escapes filter options."""
+    return escape(escape(value, '\\\'=:'), '\\\'[],;')
+
+
+class CommandTemplate(object):
+    """Command line compiled once from a graph with placeholders.
+
+    Binding only copies the argument list and substitutes the arguments
+    holding placeholders, values inside filter graphs, `-filter_complex`
+    as well as `-vf` and `-af`, are escaped."""
+
+    def __init__(self, stream: OutputStream, executable="ffmpeg", overwrite=True, progress=''):
+        self._args = [executable] + stream.get_output_args(overwrite, progress, filter_script=False)
+        self._report = stream.report
+        self._slots: List[Tuple[int, List[str], bool]] = []
+
+        for index, arg in enumerate(self._args):
+            parts = _placeholder.split(arg)  # literal, name, literal, name, ..., literal
+            if len(parts) > 1:
+                self._slots.append((index, parts, self._args[index - 1] in _filter_options))
+
+        self._names = frozenset(name for _, parts, _ in self._slots for name in parts[1::2])
+
+    @property
+    def names(self) -> FrozenSet[str]:
+        return self._names
+
+    @property
+    def args(self) -> List[str]:
+        return list(self._args)
+
+    @property
+    def report(self):
+        return self._report
+
+    def bind(self, filter_script=False, **values: Any) -> List[str]:
+        """Build the command line with every placeholder replaced by its value.
+
+        With `filter_script` the filter graph is passed in a temp file, removed
+        once an `FFmpegProcess` running the command line has exited."""
+        missing = self._names - values.keys()
+        if missing:
+            raise KeyError(f'Missing values for placeholders: {", ".join(sorted(missing))}')
+
+        args = list(self._args)
+
+        for index, parts, is_filter_graph in self._slots:
+            bound = list(parts)
+            for i in range(1, len(bound), 2):
+                value = str(values[bound[i]])
+                bound[i] = escape_filter_value(value) if is_filter_graph else value
+            args[index] = ''.join(bound)
+
+        return apply_filter_script(args, True) if filter_script else args
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {", ".join(sorted(self._names))}>'
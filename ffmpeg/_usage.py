@@ -0,0 +1,74 @@
+'''
+Date: 2026.10.18 19:31:09
+Description: CPU time, peak memory and I/O of ffmpeg child processes
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 19:31:09
+'''
+from __future__ import annotations
+
+import sys
+from typing import Iterable
+
+__all__ = [
+    'ResourceUsage',
+]
+
+# ru_maxrss is in KiB on Linux, in bytes on macOS
+_MAXRSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+class ResourceUsage(object):
+    """What one ffmpeg process, or `jobs` of them summed up, used.
+
+    Times are in seconds, `max_rss` is the peak resident memory in bytes,
+    the largest of the processes when summed up. `read_blocks` and
+    `write_blocks` count 512-byte blocks of real disk I/O, reads served
+    from the page cache are not counted."""
+    __slots__ = ('wall_time', 'user_time', 'system_time', 'max_rss', 'read_blocks', 'write_blocks', 'jobs')
+
+    def __init__(self, wall_time=0.0, user_time=0.0, system_time=0.0, max_rss=0,
+                 read_blocks=0, write_blocks=0, jobs=1):
+        self.wall_time = wall_time
+        self.user_time = user_time
+        self.system_time = system_time
+        self.max_rss = max_rss
+        self.read_blocks = read_blocks
+        self.write_blocks = write_blocks
+        self.jobs = jobs
+
+    @classmethod
+    def from_rusage(cls, rusage, wall_time: float) -> ResourceUsage:
+        return cls(wall_time, rusage.ru_utime, rusage.ru_stime, rusage.ru_maxrss * _MAXRSS_UNIT,
+                   rusage.ru_inblock, rusage.ru_oublock)
+
+    @classmethod
+    def total(cls, usages: Iterable[ResourceUsage]) -> ResourceUsage:
+        '''Sum of the usage of a batch, `wall_time` adds up the time of every job.'''
+        total = cls(jobs=0)
+        for usage in usages:
+            total += usage
+        return total
+
+    @property
+    def cpu_time(self) -> float:
+        return self.user_time + self.system_time
+
+    @property
+    def cpu_utilization(self) -> float:
+        """CPU time per wall-clock second, above 1 when ffmpeg ran on several cores."""
+        return self.cpu_time / self.wall_time if self.wall_time else 0.0
+
+    def __add__(self, other: ResourceUsage) -> ResourceUsage:
+        if not isinstance(other, ResourceUsage):
+            return NotImplemented
+        return ResourceUsage(self.wall_time + other.wall_time, self.user_time + other.user_time,
+                             self.system_time + other.system_time, max(self.max_rss, other.max_rss),
+                             self.read_blocks + other.read_blocks, self.write_blocks + other.write_blocks,
+                             self.jobs + other.jobs)
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
@@ -4,7 +4,9 @@ Description: Omit
 LastEditors: Rustle Karl
 LastEditTime: 2021.05.04 23:37:10
 '''
-from typing import Dict, Iterable, List, Union
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Union
 
 _backslash = '\\'
 _empty_symbols = (None, '', [], {})  # exclude 0
@@ -106,6 +108,70 @@ def seconds_to_string(seconds: Union[float, int, str]) -> str:
     return f"{hours:02.0f}:{minutes:02.0f}:{seconds:02.03f}"
 
 
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache(object):
+    """A thread-safe least-recently-used mapping with hit/miss counters."""
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self._maxsize = maxsize
+
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+
 if __name__ == "__main__":
     assert escape('a:b', ':') == 'a\:b'
     assert escape('a\\:b', ':\\') == 'a\\\\\\:b'
@@ -0,0 +1,300 @@
+'''
+Date: 2026.10.18 18:24:05
+Description: Time out ffmpeg jobs that run too long or stop making progress
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 18:24:05
+'''
+from __future__ import annotations
+
+import signal
+import subprocess
+import threading
+import traceback
+from time import monotonic
+from typing import Callable, Dict, Optional
+
+from ._progress import ProgressEvent, ProgressMonitor
+from .constants import WINDOWS
+from .nodes import FFmpegError
+
+__all__ = [
+    'FFmpegTimeoutError',
+    'Watchdog',
+    'WatchdogEvent',
+    'WatchdogJob',
+    'escalate',
+    'get_watchdog',
+]
+
+# Ways of stopping ffmpeg, gentlest first: `q` lets it finish its outputs like
+# SIGINT does, but also works on Windows, SIGKILL leaves them truncated
+CANCEL_STEPS = ('quit', 'interrupt', 'kill')
+
+
+def _reads_stdin(args) -> bool:
+    return any(arg == '-i' and source in ('-', 'pipe:', 'pipe:0')
+               for arg, source in zip(args, args[1:]))
+
+
+def _take_step(process: subprocess.Popen, step: str) -> bool:
+    # False if the step does not apply to this process
+    try:
+        if step == 'quit':
+            # ffmpeg only reads commands from stdin when it is not an input, and
+            # `q` would interleave with data `collect` is writing to it
+            if process.stdin is None or process.stdin.closed or _reads_stdin(process.args) or \
+                    getattr(process, '_feeding_stdin', False):
+                return False
+            process.stdin.write(b'q')
+            process.stdin.flush()
+        elif step == 'interrupt':
+            if WINDOWS:
+                return False
+            process.send_signal(signal.SIGINT)
+        else:
+            process.kill()
+    except (OSError, ValueError):  # exited, or stdin closed meanwhile
+        return step == 'kill'
+    return True
+
+
+def escalate(process: subprocess.Popen, grace: float = 5,
+             on_step: Callable[[str], None] = None) -> int:
+    '''Stop `process`, taking the steps of `CANCEL_STEPS` one after another
+    until it exits, `grace` seconds apart. Returns its return code.'''
+    for step in CANCEL_STEPS:
+        if process.poll() is not None:
+            break
+        if not _take_step(process, step):
+            continue
+
+        if on_step is not None:
+            on_step(step)
+        try:
+            return process.wait(None if step == 'kill' else grace)
+        except subprocess.TimeoutExpired:
+            pass
+
+    return process.wait()
+
+
+class WatchdogEvent(object):
+    """Something the watchdog noticed or did to a job.
+
+    `kind` is 'timeout' or 'stall' when a job is found to have run too long
+    or made no progress for too long, 'cancel' when cancelled by hand, one of
+    `CANCEL_STEPS` as it is being stopped, and 'exit' once it is gone."""
+    __slots__ = ('kind', 'pid', 'elapsed', 'idle', 'returncode')
+
+    def __init__(self, kind: str, pid: int, elapsed: float, idle: float, returncode: int = None):
+        self.kind = kind
+        self.pid = pid
+        self.elapsed = elapsed
+        self.idle = idle
+        self.returncode = returncode
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+
+class FFmpegTimeoutError(FFmpegError):
+    """ffmpeg was stopped by the watchdog, `event` tells why."""
+
+    def __init__(self, executable, stdout, stderr, event: WatchdogEvent):
+        super().__init__(executable, stdout, stderr)
+        self.event = event
+
+
+class WatchdogJob(object):
+    """A process watched by a `Watchdog`.
+
+    Anything reading its progress calls `touch`, `run_async` does it for jobs
+    it starts. `reason` is the event that made the watchdog stop it, if any."""
+
+    def __init__(self, watchdog: Watchdog, process: subprocess.Popen, timeout: Optional[float],
+                 stall_timeout: Optional[float], grace: float, on_event: Callable[[WatchdogEvent], None]):
+        self.process = process
+        self.timeout = timeout
+        self.stall_timeout = stall_timeout
+        self.grace = grace
+        self.reason: Optional[WatchdogEvent] = None
+        self._watchdog = watchdog
+        self._on_event = on_event
+        self._started = self._touched = monotonic()
+        self._steps = iter(CANCEL_STEPS)
+        self._deadline = None
+
+    @property
+    def elapsed(self) -> float:
+        return monotonic() - self._started
+
+    @property
+    def idle(self) -> float:
+        """Seconds since the last progress."""
+        return monotonic() - self._touched
+
+    def touch(self, *_):
+        '''Record progress, takes and ignores a `ProgressEvent` to be usable as callback.'''
+        self._touched = monotonic()
+
+    def cancel(self):
+        '''Stop the job the way the watchdog stops jobs that time out, without waiting.'''
+        self._watchdog._trigger(self, 'cancel')
+
+    def unwatch(self):
+        self._watchdog._unwatch(self)
+
+    def _event(self, kind: str, returncode: int = None) -> WatchdogEvent:
+        return WatchdogEvent(kind, self.process.pid, self.elapsed, self.idle, returncode)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} pid={self.process.pid} reason={self.reason and self.reason.kind}>'
+
+
+class Watchdog(object):
+    """Checks many ffmpeg processes on one thread every `poll` seconds.
+
+    A job running for more than its `timeout`, or without progress for more
+    than its `stall_timeout` seconds is stopped with the steps of `escalate`,
+    without blocking the thread. Events go to the job's `on_event` and to the
+    watchdog's, they run on the watchdog thread and should return quickly."""
+
+    def __init__(self, poll: float = 0.5, grace: float = 5, on_event: Callable[[WatchdogEvent], None] = None,
+                 monitor: ProgressMonitor = None):
+        self._poll = poll
+        self._grace = grace
+        self._on_event = on_event
+        self._monitor = monitor
+        self._jobs: Dict[int, WatchdogJob] = {}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name='ffmpeg-watchdog', daemon=True)
+        self._thread.start()
+
+    @property
+    def watching(self) -> int:
+        return len(self._jobs)
+
+    def watch(self, process: subprocess.Popen, *, timeout: float = None, stall_timeout: float = None,
+              grace: float = None, on_event: Callable[[WatchdogEvent], None] = None) -> WatchdogJob:
+        '''Watch a running process, the caller touches the job on progress.'''
+        job = WatchdogJob(self, process, timeout, stall_timeout, self._grace if grace is None else grace, on_event)
+
+        with self._lock:
+            if self._closed.is_set():
+                raise ValueError('Watch on a closed watchdog')
+            self._jobs[id(job)] = job
+
+        return job
+
+    def run_async(self, stream, *, timeout: float = None, stall_timeout: float = None, grace: float = None,
+                  on_event: Callable[[WatchdogEvent], None] = None,
+                  on_progress: Callable[[ProgressEvent], None] = None, duration: float = None,
+                  **kwargs) -> WatchdogJob:
+        '''Start ffmpeg for the graph like `OutputStream.run_async` and watch it,
+        its progress is read to detect stalls if `stall_timeout` is given.'''
+        if stall_timeout is None and on_progress is None:
+            process = stream.run_async(**kwargs)
+            return self.watch(process, timeout=timeout, grace=grace, on_event=on_event)
+
+        job = None
+
+        def progress(event: ProgressEvent):
+            if job is not None:
+                job.touch()
+            if on_progress is not None:
+                on_progress(event)
+
+        process = self._get_monitor().run_async(stream, progress, duration, **kwargs)
+        job = self.watch(process, timeout=timeout, stall_timeout=stall_timeout, grace=grace, on_event=on_event)
+        return job
+
+    def _get_monitor(self) -> ProgressMonitor:
+        with self._lock:
+            if self._monitor is None:
+                self._monitor = ProgressMonitor()
+            return self._monitor
+
+    def _unwatch(self, job: WatchdogJob):
+        with self._lock:
+            watched = self._jobs.pop(id(job), None) is not None
+
+        returncode = job.process.poll()
+        if watched and job.reason is not None and returncode is not None:
+            self._emit(job, job._event('exit', returncode))
+
+    def _trigger(self, job: WatchdogJob, kind: str):
+        with self._lock:
+            if job.reason is not None:
+                return
+            job.reason = job._event(kind)
+
+        self._emit(job, job.reason)
+        self._step(job)
+
+    def _step(self, job: WatchdogJob):
+        # Take the next step that applies, then give ffmpeg `grace` seconds to exit
+        for step in job._steps:
+            if _take_step(job.process, step):
+                self._emit(job, job._event(step))
+                job._deadline = None if step == 'kill' else monotonic() + job.grace
+                return
+
+    def _loop(self):
+        while not self._closed.wait(self._poll):
+            with self._lock:
+                jobs = list(self._jobs.values())
+
+            now = monotonic()
+            for job in jobs:
+                if job.process.poll() is not None:
+                    self._unwatch(job)
+                elif job.reason is not None:
+                    if job._deadline is not None and now >= job._deadline:
+                        self._step(job)
+                elif job.timeout is not None and now - job._started > job.timeout:
+                    self._trigger(job, 'timeout')
+                elif job.stall_timeout is not None and now - job._touched > job.stall_timeout:
+                    self._trigger(job, 'stall')
+
+    def _emit(self, job: WatchdogJob, event: WatchdogEvent):
+        for callback in (job._on_event, self._on_event):
+            if callback is not None:
+                try:
+                    callback(event)
+                except Exception:
+                    traceback.print_exc()
+
+    def close(self):
+        '''Stop watching, running jobs are left alone.'''
+        with self._lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            self._jobs.clear()
+
+        self._thread.join()
+
+    def __enter__(self) -> Watchdog:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} watching={self.watching}>'
+
+
+_watchdog: Optional[Watchdog] = None
+_watchdog_lock = threading.Lock()
+
+
+def get_watchdog() -> Watchdog:
+    '''The watchdog `OutputStream.run` uses for its timeouts.'''
+    global _watchdog
+
+    with _watchdog_lock:
+        if _watchdog is None:
+            _watchdog = Watchdog()
+        return _watchdog
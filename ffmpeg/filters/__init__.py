@@ -4,10 +4,22 @@ Description : Omit
 LastEditors: Rustle Karl
 LastEditTime: 2021.04.25 9:36
 '''
-from . import afilters, vfilters, avfilters
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import afilters, avfilters, vfilters
 
 __all__ = [
     'afilters',
     'avfilters',
     'vfilters',
 ]
+
+
+def __getattr__(name: str):
+    # Importing a module attaches its filters to `FilterableStream`,
+    # which also imports it on demand, see `FilterableStream.__getattr__`
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,474 @@
+'''
+Date: 2026.10.18 14:02:37
+Description: Which module attaches each filter to `FilterableStream`,
+             generated by `python -m ffmpeg.filters._registry`, do not edit
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 14:02:37
+'''
+FILTERS = {
+    'abench': 'avfilters',
+    'abitscope': 'avfilters',
+    'abuffer': 'afilters',
+    'abuffersink': 'afilters',
+    'acompressor': 'afilters',
+    'acontrast': 'afilters',
+    'acopy': 'afilters',
+    'acrossfade': 'afilters',
+    'acrossover': 'afilters',
+    'acrusher': 'afilters',
+    'acue': 'afilters',
+    'addroi': 'vfilters',
+    'adeclick': 'afilters',
+    'adeclip': 'afilters',
+    'adelay': 'afilters',
+    'adenorm': 'afilters',
+    'adrawgraph': 'avfilters',
+    'aecho': 'afilters',
+    'aemphasis': 'afilters',
+    'aeval': 'afilters',
+    'aevalsrc': 'afilters',
+    'aexciter': 'afilters',
+    'afade': 'afilters',
+    'afftdn': 'afilters',
+    'afftfilt': 'afilters',
+    'afifo': 'vfilters',
+    'afir': 'afilters',
+    'afirsrc': 'afilters',
+    'aformat': 'afilters',
+    'afreqshift': 'afilters',
+    'agate': 'afilters',
+    'agraphmonitor': 'avfilters',
+    'ahistogram': 'avfilters',
+    'aiir': 'afilters',
+    'aintegral': 'afilters',
+    'ainterleave': 'avfilters',
+    'alimiter': 'afilters',
+    'allpass': 'afilters',
+    'aloop': 'afilters',
+    'alphaextract': 'vfilters',
+    'alphamerge': 'vfilters',
+    'amerge': 'afilters',
+    'ametadata': 'avfilters',
+    'amix': 'afilters',
+    'amovie': 'avfilters',
+    'amplify': 'vfilters',
+    'amultiply': 'afilters',
+    'anequalizer': 'afilters',
+    'anlmdn': 'afilters',
+    'anlms': 'afilters',
+    'anoisesrc': 'afilters',
+    'anull': 'afilters',
+    'anullsink': 'afilters',
+    'anullsrc': 'afilters',
+    'apad': 'afilters',
+    'aperms': 'avfilters',
+    'aphasemeter': 'avfilters',
+    'aphaser': 'afilters',
+    'aphaseshift': 'afilters',
+    'apulsator': 'afilters',
+    'arealtime': 'avfilters',
+    'aresample': 'afilters',
+    'areverse': 'afilters',
+    'arnndn': 'afilters',
+    'aselect': 'avfilters',
+    'asendcmd': 'avfilters',
+    'asetnsamples': 'afilters',
+    'asetpts': 'avfilters',
+    'asetrate': 'afilters',
+    'asettb': 'avfilters',
+    'ashowinfo': 'afilters',
+    'asidedata': 'avfilters',
+    'asoftclip': 'afilters',
+    'asplit': 'avfilters',
+    'asr': 'afilters',
+    'ass': 'vfilters',
+    'astats': 'afilters',
+    'astreamselect': 'vfilters',
+    'asubboost': 'afilters',
+    'asubcut': 'afilters',
+    'asupercut': 'afilters',
+    'asuperpass': 'afilters',
+    'asuperstop': 'afilters',
+    'atadenoise': 'vfilters',
+    'atempo': 'afilters',
+    'atrim': 'afilters',
+    'avectorscope': 'avfilters',
+    'avgblur': 'vfilters',
+    'avgblur_opencl': 'vfilters',
+    'axcorrelate': 'afilters',
+    'azmq': 'avfilters',
+    'bandpass': 'afilters',
+    'bandreject': 'afilters',
+    'bbox': 'vfilters',
+    'bilateral': 'vfilters',
+    'biquad': 'afilters',
+    'bitplanenoise': 'vfilters',
+    'blackdetect': 'vfilters',
+    'blackframe': 'vfilters',
+    'blend': 'vfilters',
+    'bm3d': 'vfilters',
+    'boxblur': 'vfilters',
+    'boxblur_opencl': 'vfilters',
+    'bs2b': 'afilters',
+    'buffer': 'vfilters',
+    'buffersink': 'vfilters',
+    'bwdif': 'vfilters',
+    'cas': 'vfilters',
+    'cellauto': 'vfilters',
+    'channelmap': 'afilters',
+    'channelsplit': 'afilters',
+    'chorus': 'afilters',
+    'chromahold': 'vfilters',
+    'chromakey': 'vfilters',
+    'chromanr': 'vfilters',
+    'chromashift': 'vfilters',
+    'ciescope': 'vfilters',
+    'codecview': 'vfilters',
+    'colorbalance': 'vfilters',
+    'colorchannelmixer': 'vfilters',
+    'colorcontrast': 'vfilters',
+    'colorcorrect': 'vfilters',
+    'colorhold': 'vfilters',
+    'colorize': 'vfilters',
+    'colorkey': 'vfilters',
+    'colorkey_opencl': 'vfilters',
+    'colorlevels': 'vfilters',
+    'colormatrix': 'vfilters',
+    'colorspace': 'vfilters',
+    'colortemperature': 'vfilters',
+    'compand': 'afilters',
+    'compensationdelay': 'afilters',
+    'concat': 'avfilters',
+    'convolution': 'vfilters',
+    'convolution_opencl': 'vfilters',
+    'convolve': 'vfilters',
+    'copy': 'vfilters',
+    'coreimage': 'vfilters',
+    'coreimagesrc': 'vfilters',
+    'cover_rect': 'vfilters',
+    'crop': 'vfilters',
+    'cropdetect': 'vfilters',
+    'crossfeed': 'afilters',
+    'crystalizer': 'afilters',
+    'cue': 'vfilters',
+    'curves': 'vfilters',
+    'datascope': 'vfilters',
+    'dblur': 'vfilters',
+    'dcshift': 'afilters',
+    'dctdnoiz': 'vfilters',
+    'deband': 'vfilters',
+    'deblock': 'vfilters',
+    'decimate': 'vfilters',
+    'deconvolve': 'vfilters',
+    'dedot': 'vfilters',
+    'deesser': 'afilters',
+    'deflate': 'vfilters',
+    'deflicker': 'vfilters',
+    'dejudder': 'vfilters',
+    'delogo': 'vfilters',
+    'derain': 'vfilters',
+    'deshake': 'vfilters',
+    'deshake_opencl': 'vfilters',
+    'despill': 'vfilters',
+    'detelecine': 'vfilters',
+    'dilation': 'vfilters',
+    'dilation_opencl': 'vfilters',
+    'displace': 'vfilters',
+    'dnn_processing': 'vfilters',
+    'doubleweave': 'vfilters',
+    'drawbox': 'vfilters',
+    'drawgraph': 'vfilters',
+    'drawgrid': 'vfilters',
+    'drawtext': 'vfilters',
+    'drmeter': 'afilters',
+    'dynaudnorm': 'afilters',
+    'earwax': 'afilters',
+    'ebur128': 'avfilters',
+    'edgedetect': 'vfilters',
+    'elbg': 'vfilters',
+    'entropy': 'vfilters',
+    'epx': 'vfilters',
+    'eq': 'vfilters',
+    'equalizer': 'afilters',
+    'erosion': 'vfilters',
+    'erosion_opencl': 'vfilters',
+    'estdif': 'vfilters',
+    'exposure': 'vfilters',
+    'extractplanes': 'vfilters',
+    'extrastereo': 'afilters',
+    'fade': 'vfilters',
+    'fftdnoiz': 'vfilters',
+    'fftfilt': 'vfilters',
+    'field': 'vfilters',
+    'fieldhint': 'vfilters',
+    'fieldmatch': 'vfilters',
+    'fieldorder': 'vfilters',
+    'fillborders': 'vfilters',
+    'filter': 'avfilters',
+    'filter_multi_output': 'avfilters',
+    'find_rect': 'vfilters',
+    'firequalizer': 'afilters',
+    'flanger': 'afilters',
+    'flite': 'afilters',
+    'floodfill': 'vfilters',
+    'format': 'vfilters',
+    'fps': 'vfilters',
+    'framepack': 'vfilters',
+    'framerate': 'vfilters',
+    'framestep': 'vfilters',
+    'freezedetect': 'vfilters',
+    'freezeframes': 'vfilters',
+    'frei0r': 'vfilters',
+    'frei0r_src': 'vfilters',
+    'fspp': 'vfilters',
+    'gblur': 'vfilters',
+    'geq': 'vfilters',
+    'gltransition': 'vfilters',
+    'gradfun': 'vfilters',
+    'gradients': 'vfilters',
+    'graphmonitor': 'vfilters',
+    'greyedge': 'vfilters',
+    'haas': 'afilters',
+    'haldclut': 'vfilters',
+    'hdcd': 'afilters',
+    'headphone': 'afilters',
+    'hflip': 'vfilters',
+    'highpass': 'afilters',
+    'highshelf': 'afilters',
+    'hilbert': 'afilters',
+    'histeq': 'vfilters',
+    'histogram': 'vfilters',
+    'hqdn3d': 'vfilters',
+    'hqx': 'vfilters',
+    'hstack': 'vfilters',
+    'hue': 'vfilters',
+    'hwdownload': 'vfilters',
+    'hwmap': 'vfilters',
+    'hwupload': 'vfilters',
+    'hwupload_cuda': 'vfilters',
+    'hysteresis': 'vfilters',
+    'identity': 'vfilters',
+    'idet': 'vfilters',
+    'il': 'vfilters',
+    'inflate': 'vfilters',
+    'interlace': 'vfilters',
+    'join': 'afilters',
+    'kerndeint': 'vfilters',
+    'kirsch': 'vfilters',
+    'ladspa': 'afilters',
+    'lagfun': 'vfilters',
+    'lenscorrection': 'vfilters',
+    'lensfun': 'vfilters',
+    'libvmaf': 'vfilters',
+    'life': 'vfilters',
+    'limiter': 'vfilters',
+    'loop': 'vfilters',
+    'loudnorm': 'afilters',
+    'lowpass': 'afilters',
+    'lowshelf': 'afilters',
+    'lumakey': 'vfilters',
+    'lut1d': 'vfilters',
+    'lut3d': 'vfilters',
+    'lutyuv': 'vfilters',
+    'lv2': 'afilters',
+    'mandelbrot': 'vfilters',
+    'maskedclamp': 'vfilters',
+    'maskedmax': 'vfilters',
+    'maskedmerge': 'vfilters',
+    'maskedmin': 'vfilters',
+    'maskedthreshold': 'vfilters',
+    'maskfun': 'vfilters',
+    'mcdeint': 'vfilters',
+    'mcompand': 'afilters',
+    'median': 'vfilters',
+    'mergeplanes': 'vfilters',
+    'mestimate': 'vfilters',
+    'midequalizer': 'vfilters',
+    'minterpolate': 'vfilters',
+    'mix': 'vfilters',
+    'monochrome': 'vfilters',
+    'movie': 'avfilters',
+    'mpdecimate': 'vfilters',
+    'mptestsrc': 'vfilters',
+    'negate': 'vfilters',
+    'nlmeans': 'vfilters',
+    'nlmeans_opencl': 'vfilters',
+    'nnedi': 'vfilters',
+    'noformat': 'vfilters',
+    'noise': 'vfilters',
+    'normalize': 'vfilters',
+    'null': 'vfilters',
+    'nullsink': 'vfilters',
+    'ocr': 'vfilters',
+    'ocv': 'vfilters',
+    'openclsrc': 'vfilters',
+    'oscilloscope': 'vfilters',
+    'overlay': 'vfilters',
+    'overlay_cuda': 'vfilters',
+    'overlay_opencl': 'vfilters',
+    'owdenoise': 'vfilters',
+    'pad': 'vfilters',
+    'pad_opencl': 'vfilters',
+    'palettegen': 'vfilters',
+    'paletteuse': 'vfilters',
+    'pan': 'afilters',
+    'perspective': 'vfilters',
+    'phase': 'vfilters',
+    'photosensitivity': 'vfilters',
+    'pixdesctest': 'vfilters',
+    'pixscope': 'vfilters',
+    'pp': 'vfilters',
+    'pp7': 'vfilters',
+    'premultiply': 'vfilters',
+    'prewitt': 'vfilters',
+    'prewitt_opencl': 'vfilters',
+    'program_opencl': 'vfilters',
+    'pseudocolor': 'vfilters',
+    'psnr': 'vfilters',
+    'pullup': 'vfilters',
+    'qp': 'vfilters',
+    'random': 'vfilters',
+    'readeia608': 'vfilters',
+    'readvitc': 'vfilters',
+    'remap': 'vfilters',
+    'removegrain': 'vfilters',
+    'removelogo': 'vfilters',
+    'repeatfields': 'vfilters',
+    'replaygain': 'afilters',
+    'resample': 'afilters',
+    'reverse': 'vfilters',
+    'rgbashift': 'vfilters',
+    'roberts': 'vfilters',
+    'roberts_opencl': 'vfilters',
+    'rotate': 'vfilters',
+    'rubberband': 'afilters',
+    'sab': 'vfilters',
+    'scale': 'vfilters',
+    'scale2ref': 'vfilters',
+    'scale_npp': 'vfilters',
+    'scdet': 'vfilters',
+    'scroll': 'vfilters',
+    'select': 'avfilters',
+    'selectivecolor': 'vfilters',
+    'separatefields': 'vfilters',
+    'setfield': 'vfilters',
+    'setparams': 'vfilters',
+    'setpts': 'avfilters',
+    'setrange': 'avfilters',
+    'setsar': 'vfilters',
+    'shear': 'vfilters',
+    'showcqt': 'avfilters',
+    'showfreqs': 'avfilters',
+    'showinfo': 'vfilters',
+    'showpalette': 'vfilters',
+    'showspatial': 'avfilters',
+    'showspectrum': 'avfilters',
+    'showspectrumpic': 'avfilters',
+    'showvolume': 'avfilters',
+    'showwaves': 'avfilters',
+    'showwavespic': 'avfilters',
+    'shuffleframes': 'vfilters',
+    'shufflepixels': 'vfilters',
+    'shuffleplanes': 'vfilters',
+    'sidechaincompress': 'afilters',
+    'sidechaingate': 'afilters',
+    'sidedata': 'avfilters',
+    'sierpinski': 'vfilters',
+    'signalstats': 'vfilters',
+    'signature': 'vfilters',
+    'silencedetect': 'afilters',
+    'silenceremove': 'afilters',
+    'sinc': 'afilters',
+    'sine': 'afilters',
+    'smartblur': 'vfilters',
+    'sobel': 'vfilters',
+    'sobel_opencl': 'vfilters',
+    'sofalizer': 'afilters',
+    'spectrumsynth': 'avfilters',
+    'speechnorm': 'afilters',
+    'split': 'avfilters',
+    'spp': 'vfilters',
+    'sr': 'vfilters',
+    'ssim': 'vfilters',
+    'stereo3d': 'vfilters',
+    'stereotools': 'afilters',
+    'stereowiden': 'afilters',
+    'subtitles': 'vfilters',
+    'super2xsai': 'vfilters',
+    'superequalizer': 'afilters',
+    'surround': 'afilters',
+    'swaprect': 'vfilters',
+    'swapuv': 'vfilters',
+    'tblend': 'vfilters',
+    'telecine': 'vfilters',
+    'thistogram': 'vfilters',
+    'threshold': 'vfilters',
+    'thumbnail': 'vfilters',
+    'tile': 'vfilters',
+    'tinterlace': 'vfilters',
+    'tlut2': 'vfilters',
+    'tmedian': 'vfilters',
+    'tmidequalizer': 'vfilters',
+    'tmix': 'vfilters',
+    'tonemap': 'vfilters',
+    'tonemap_opencl': 'vfilters',
+    'tonemap_vaapi': 'vfilters',
+    'tpad': 'vfilters',
+    'transpose': 'vfilters',
+    'transpose_npp': 'vfilters',
+    'tremolo': 'afilters',
+    'trim': 'vfilters',
+    'unpremultiply': 'vfilters',
+    'unsharp': 'vfilters',
+    'unsharp_opencl': 'vfilters',
+    'untile': 'vfilters',
+    'uspp': 'vfilters',
+    'v360': 'vfilters',
+    'vaguedenoiser': 'vfilters',
+    'vectorscope': 'vfilters',
+    'vflip': 'vfilters',
+    'vfrdet': 'vfilters',
+    'vibrance': 'vfilters',
+    'vibrato': 'afilters',
+    'vidstabdetect': 'vfilters',
+    'vidstabtransform': 'vfilters',
+    'vif': 'vfilters',
+    'vignette': 'vfilters',
+    'vmafmotion': 'vfilters',
+    'volume': 'afilters',
+    'volumedetect': 'afilters',
+    'vstack': 'vfilters',
+    'w3fdif': 'vfilters',
+    'waveform': 'vfilters',
+    'xbr': 'vfilters',
+    'xfade': 'vfilters',
+    'xfade_opencl': 'vfilters',
+    'xmedian': 'vfilters',
+    'xstack': 'vfilters',
+    'yadif': 'vfilters',
+    'yadif_cuda': 'vfilters',
+    'yaepblur': 'vfilters',
+    'yuvtestsrc': 'vfilters',
+    'zmq': 'avfilters',
+    'zoompan': 'vfilters',
+    'zscale': 'vfilters',
+}
+
+if __name__ == '__main__':
+    import ast
+    from pathlib import Path
+
+    here = Path(__file__)
+    filters = {}
+
+    for module in ('afilters', 'avfilters', 'vfilters'):
+        tree = ast.parse((here.parent / f'{module}.py').read_text(encoding='utf-8'))
+        for node in tree.body:
+            if isinstance(node, ast.FunctionDef) and \
+                    any(ast.unparse(decorator) == 'filterable()' for decorator in node.decorator_list):
+                filters[node.name] = module
+
+    head, tail = here.read_text(encoding='utf-8').split('FILTERS = {', 1)
+    _, tail = tail.split('}\n', 1)
+    body = ''.join(f'    {name!r}: {module!r},\n' for name, module in sorted(filters.items()))
+    here.write_text(f'{head}FILTERS = {{\n{body}}}\n{tail}', encoding='utf-8')
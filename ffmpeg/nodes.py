@@ -6,24 +6,40 @@ LastEditTime: 2021.05.04 23:35:59
 '''
 from __future__ import annotations
 
+import atexit
+import contextlib
 import copy
+import importlib
+import inspect
 import os
 import shutil
 import subprocess
+import tempfile
+import threading
 from collections import defaultdict
 from pathlib import Path
 from time import perf_counter
-from typing import Dict, List, Tuple, Union
+from typing import (TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Match, Optional,
+                    Pattern, Tuple, Union)
 
-from pkgs import color
-
-from ._dag import DagEdge, DagNode, topological_sort
-from ._node import (Node, NodeTypes, Stream, format_input_stream_tag,
+from . import settings
+from ._dag import DagEdge, DagNode, gc_paused, topological_sort
+from ._instrument import get_sink
+from ._node import (CompileReport, Node, NodeTypes, Stream, format_input_stream_tag,
                     get_filters_spec, get_stream_spec_nodes, streamable)
-from ._utils import convert_kwargs_to_cmd_line_args, escape, join_cmd_args_seq
+from ._stderr import StderrCapture
+from ._usage import ResourceUsage
+from ._utils import (CacheInfo, LRUCache, convert_kwargs_to_cmd_line_args,
+                     escape, join_cmd_args_seq)
+
+if TYPE_CHECKING:
+    from ._aio import AsyncProcess
+    from ._template import CommandTemplate
 
 __all__ = [
     'FFmpegError',
+    'FFmpegProcess',
+    'RunResult',
     'FilterableStream',
     'FilterNode',
     'GlobalNode',
@@ -32,29 +48,304 @@ __all__ = [
     'OutputNode',
     'OutputStream',
     'Stream',
+    'apply_filter_script',
+    'compile_cache_clear',
+    'compile_cache_info',
     'filterable',
+    'get_progress_url',
+    'remove_filter_scripts',
+    'write_filter_script',
 ]
 
 
+
+def _can_reap_with_wait4() -> bool:
+    # FFmpegProcess overrides how Popen reaps on POSIX, private methods of CPython's
+    # subprocess with the same names and arguments since 3.3, checked to be there
+    try:
+        parameters = list(inspect.signature(subprocess.Popen._try_wait).parameters)
+        return hasattr(os, 'wait4') and callable(subprocess.Popen._handle_exitstatus) and \
+               parameters == ['self', 'wait_flags']
+    except (AttributeError, TypeError, ValueError):
+        return False
+
+
+_REAP_WITH_WAIT4 = _can_reap_with_wait4()
+
+# fingerprint of the output node and compile options -> command-line arguments
+_compile_cache = LRUCache(settings.COMPILE_CACHE_SIZE)
+_compile_settings = ('MERGE_COMMON_SUBGRAPHS', 'PUSH_DOWN_SEEKS', 'ELIMINATE_NO_OPS',
+                     'AUTO_SPLIT', 'FUSE_FILTER_CHAINS')
+
+
+def compile_cache_info() -> CacheInfo:
+    """Report hits and misses of the compiled command-line cache."""
+    return _compile_cache.info()
+
+
+def compile_cache_clear():
+    _compile_cache.clear()
+    _validated.clear()
+
+
+# (fingerprint of the output node, executable) of graphs whose filters passed validation
+_validated = LRUCache(settings.COMPILE_CACHE_SIZE)
+
+
+def _validate_filters(stream: OutputStream, executable: str, strict: bool):
+    # Not strict, a graph is let through if ffmpeg can't say what it supports
+    from ._capabilities import validate_filters
+
+    key = (stream.Node.fingerprint, executable)
+    if _validated.get(key) is None:
+        try:
+            validate_filters(stream, executable)
+        except (OSError, subprocess.CalledProcessError):
+            if strict:
+                raise
+            return
+        _validated.set(key, True)
+
+
+# temp files holding filter graphs passed with `-filter_complex_script`
+_filter_scripts = set()
+
+
+def write_filter_script(filters_spec: str) -> str:
+    """Write a filter graph to a temp file, removed once the ffmpeg process
+    using it has exited, or at the latest when the interpreter exits."""
+    fd, path = tempfile.mkstemp(prefix='ffmpeg-', suffix='.filter')
+
+    with os.fdopen(fd, 'w', encoding='utf-8') as fp:
+        fp.write(filters_spec)
+
+    _filter_scripts.add(path)
+    return path
+
+
+def remove_filter_scripts(args: Iterable[str] = None):
+    """Remove the filter scripts referenced in the arguments, or all of them."""
+    paths = set(_filter_scripts) if args is None else _filter_scripts.intersection(args)
+
+    for path in paths:
+        _filter_scripts.discard(path)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+atexit.register(remove_filter_scripts)
+
+
+def apply_filter_script(args: List[str], filter_script: bool = None) -> List[str]:
+    """Move the `-filter_complex` graph into a filter script if `filter_script`
+    is true, or if it is longer than `settings.FILTER_COMPLEX_SCRIPT_THRESHOLD`.
+    Every call writes a new file, call it only right before starting ffmpeg."""
+    if filter_script is not False and '-filter_complex' in args:
+        index = args.index('-filter_complex')
+        threshold = settings.FILTER_COMPLEX_SCRIPT_THRESHOLD
+        if filter_script or 0 < threshold < len(args[index + 1]):
+            args[index:index + 2] = ['-filter_complex_script', write_filter_script(args[index + 1])]
+
+    return args
+
+
+def get_progress_url(progress: str) -> str:
+    """`-progress` target, e.g. ``pipe:3`` or ``tcp://host:port``, or a unix socket path."""
+    if progress.startswith('pipe:') or '://' in progress:
+        return progress
+    return 'unix://' + progress
+
+
+def _check_executable(executable: str):
+    if shutil.which(executable) is None:
+        raise FileNotFoundError(f"Can't find {executable} in $PATH or "
+                                f"current directory. Please specify a absolute path or "
+                                f"add {executable} into $PATH.")
+
+
+def _get_stdio(pipe_stdin: bool, pipe_stdout: bool, pipe_stderr: bool, quiet: bool) -> Dict[str, Any]:
+    return {
+        'stdin': subprocess.PIPE if pipe_stdin else None,
+        'stdout': subprocess.DEVNULL if quiet else subprocess.PIPE if pipe_stdout else None,
+        'stderr': subprocess.STDOUT if quiet else subprocess.PIPE if pipe_stderr else None,
+    }
+
+
+def _raise(error: FFmpegError, start: float):
+    get_sink().on_error(error, perf_counter() - start)
+    raise error
+
+
+def _get_stderr_capture(lines: Optional[int], on_line, hooks) -> StderrCapture:
+    if lines is None:
+        lines = settings.STDERR_TAIL_LINES
+    return StderrCapture(lines, on_line, hooks)
+
+
 def filterable():
     return streamable(FilterableStream)
 
 
 class FFmpegError(Exception):
+    """`stderr` holds what was captured of it, only its last lines
+    if it was read by a `StderrCapture`."""
 
     def __init__(self, executable, stdout, stderr):
+        self.executable = executable
+        self.stdout = stdout
+        self.stderr = stderr
+
         msg = [executable]
 
         if stdout:
-            msg.append(stdout.decode('utf-8'))
+            msg.append(stdout.decode('utf-8', errors='replace'))
 
         if stderr:
-            msg.append(stderr.decode('utf-8'))
+            msg.append(stderr.decode('utf-8', errors='replace'))
 
         super(FFmpegError, self).__init__(' '.join(msg))
 
 
+class RunResult(tuple):
+    """What `run` returns, unpacking to `(stdout, stderr)` as it used to.
+
+    `args` is the command line ffmpeg ran, `usage` its `ResourceUsage`,
+    None where it can't be measured, and `elapsed` the seconds `run` took.
+    `print_cmd` tells whether the run was asked to print its command line,
+    `ConsoleSink` prints the timing of those runs only."""
+
+    def __new__(cls, stdout: Optional[bytes], stderr: Optional[bytes], args: List[str],
+                returncode: int, usage: ResourceUsage = None, elapsed: float = None, print_cmd=True):
+        result = super().__new__(cls, (stdout, stderr))
+        result.args = args
+        result.returncode = returncode
+        result.usage = usage
+        result.elapsed = elapsed
+        result.print_cmd = print_cmd
+        return result
+
+    @property
+    def stdout(self) -> Optional[bytes]:
+        return self[0]
+
+    @property
+    def stderr(self) -> Optional[bytes]:
+        return self[1]
+
+    def __repr__(self):
+        return f'<{type(self).__name__} returncode={self.returncode} elapsed={self.elapsed} usage={self.usage}>'
+
+
+class FFmpegProcess(subprocess.Popen):
+    """Removes the filter scripts it was started with once ffmpeg has exited,
+    and keeps what it used, see `usage`."""
+
+    def __init__(self, *args, **kwargs):
+        self._started = perf_counter()
+        self._usage = None
+        self._wait4 = False
+        self._feeding_stdin = False  # stdin is written by `collect`, the watchdog can't send `q`
+        super().__init__(*args, **kwargs)
+        self._wait4 = _REAP_WITH_WAIT4 and hasattr(self, '_waitpid_lock')
+
+    @property
+    def usage(self) -> Optional[ResourceUsage]:
+        """CPU time, peak memory and I/O of ffmpeg once it has been waited for,
+        None before, or where `os.wait4` or the Popen internals it is used
+        through are missing, ffmpeg is then reaped by Popen as usual."""
+        return self._usage
+
+    def poll(self):
+        # Popen.poll reaps with waitpid, losing the rusage, reap with wait4 first
+        if self._wait4 and self.returncode is None and self._waitpid_lock.acquire(False):
+            try:
+                if self.returncode is None:
+                    pid, sts = self._try_wait(os.WNOHANG)
+                    if pid == self.pid:
+                        self._handle_exitstatus(sts)
+            finally:
+                self._waitpid_lock.release()
+
+        returncode = super().poll()
+        if returncode is not None:
+            self._remove_filter_scripts()
+        return returncode
+
+    def wait(self, timeout=None):
+        returncode = super().wait(timeout)
+        self._remove_filter_scripts()
+        return returncode
+
+    def cancel(self, grace: float = 5) -> int:
+        '''Stop ffmpeg, sending `q`, then SIGINT, then SIGKILL until it exits,
+        `grace` seconds apart. Outputs are finished unless it had to be killed.'''
+        from ._watchdog import escalate
+        return escalate(self, grace)
+
+    def collect(self, input: bytes = None, stderr: StderrCapture = None) -> Tuple[Optional[bytes], Optional[bytes]]:
+        '''Like `communicate`, but stderr goes through `stderr` as it is written,
+        the second item is its tail instead of all of it.'''
+        self._feeding_stdin = self.stdin is not None
+        if stderr is None or self.stderr is None:
+            try:
+                return self.communicate(input)
+            finally:
+                self._feeding_stdin = False
+
+        drain = stderr.drain(self.stderr)
+
+        writer = None
+        if self.stdin is not None:
+            def write():
+                try:
+                    if input:
+                        self.stdin.write(input)
+                except BrokenPipeError:
+                    pass  # ffmpeg exited early, its return code tells why
+                finally:
+                    try:
+                        self.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    self._feeding_stdin = False
+
+            writer = threading.Thread(target=write, name='ffmpeg-stdin', daemon=True)
+            writer.start()
+
+        stdout = None
+        if self.stdout is not None:
+            with self.stdout:
+                stdout = self.stdout.read()
+
+        if writer is not None:
+            writer.join()
+        self.wait()
+        drain.join()
+
+        return stdout, stderr.tail
+
+    def _try_wait(self, wait_flags):
+        # What Popen.wait reaps with, called holding its lock
+        if not self._wait4:
+            return super()._try_wait(wait_flags)
+
+        try:
+            pid, sts, rusage = os.wait4(self.pid, wait_flags)
+        except ChildProcessError:  # reaped elsewhere, e.g. SIGCHLD is ignored
+            return self.pid, 0
+
+        if pid == self.pid:
+            self._usage = ResourceUsage.from_rusage(rusage, perf_counter() - self._started)
+        return pid, sts
+
+    def _remove_filter_scripts(self):
+        if not isinstance(self.args, (str, bytes)):
+            remove_filter_scripts(self.args)
+
+
 class OutputStream(Stream):
+    __slots__ = ('_report',)
+
     def __init__(self, upstream_node: Node, upstream_label: str, selector=None):
         super().__init__(upstream_node=upstream_node, upstream_label=upstream_label,
                          node_types=(OutputNode, GlobalNode, MergeOutputsNode), selector=selector)
@@ -66,8 +357,49 @@ class OutputStream(Stream):
         """Add extra global command-line argument(s), e.g. ``-progress``."""
         return MergeOutputsNode([self, *streams]).stream()
 
-    def get_output_args(self, overwrite=True, progress='') -> List[str]:
-        nodes = get_stream_spec_nodes(self)
+    @property
+    def report(self) -> Optional[CompileReport]:
+        """What the optimizing passes changed in the last compile, if any."""
+        return getattr(self, '_report', None)
+
+    def get_output_args(self, overwrite=True, progress='', filter_script: bool = None,
+                        probes: Dict[str, Any] = None) -> List[str]:
+        '''Build the arguments after the executable.
+
+        `probes` maps input sources to their `FFprobe` or ffprobe json output,
+        letting the optimizer prove more filters to be no-ops.
+
+        The filter graph is written to a temp file and passed with
+        `-filter_complex_script` only if `filter_script` is true, the file is
+        removed once an `FFmpegProcess` running the arguments has exited.
+        `run_async` also does it for graphs longer than
+        `settings.FILTER_COMPLEX_SCRIPT_THRESHOLD`.'''
+        if _compile_cache.maxsize != settings.COMPILE_CACHE_SIZE:
+            _compile_cache.resize(settings.COMPILE_CACHE_SIZE)
+
+        key = (self.Node.fingerprint, overwrite, progress,
+               *(getattr(settings, name) for name in _compile_settings))
+        if probes:
+            from ._optimizer import get_probe_key
+            key = (*key, get_probe_key(probes))
+
+        compiled = _compile_cache.get(key)
+
+        if compiled is None:
+            report = CompileReport()
+            with gc_paused():
+                args = self._get_output_args(overwrite, progress, report, probes)
+            compiled = tuple(args), report
+            _compile_cache.set(key, compiled)
+
+        args, self._report = compiled
+        return apply_filter_script(list(args), True) if filter_script else list(args)
+
+    def _get_output_args(self, overwrite=True, progress='', report: CompileReport = None,
+                         probes: Dict[str, Any] = None) -> List[str]:
+        from ._optimizer import optimize
+
+        nodes = optimize(get_stream_spec_nodes(self), report, probes)
         sorted_nodes, outgoing_edge_graphs = topological_sort(nodes)
 
         type_nodes = defaultdict(list)
@@ -81,8 +413,8 @@ class OutputStream(Stream):
         for node in type_nodes[NodeTypes.Input]:
             args.extend(node.get_input_args())
 
-        filters_spec = get_filters_spec(type_nodes[NodeTypes.Filter],
-                                        stream_tag_graph, outgoing_edge_graphs)
+        filters_spec = get_filters_spec(type_nodes[NodeTypes.Filter], stream_tag_graph, outgoing_edge_graphs,
+                                        settings.FUSE_FILTER_CHAINS, report)
         if filters_spec:
             args.extend(['-filter_complex', filters_spec])
 
@@ -93,7 +425,7 @@ class OutputStream(Stream):
             args.extend(node.get_global_args())
 
         if progress:
-            args.extend(['-progress', 'unix://' + progress.replace('unix://', '', 1)])
+            args.extend(['-progress', get_progress_url(progress)])
 
         if overwrite:
             args.append('-y')
@@ -102,54 +434,156 @@ class OutputStream(Stream):
 
         return args
 
+    def template(self, *, executable="ffmpeg", overwrite=True, progress='') -> CommandTemplate:
+        '''Precompile a graph built with `Placeholder` sources or parameters.'''
+        from ._template import CommandTemplate
+        return CommandTemplate(self, executable=executable, overwrite=overwrite, progress=progress)
+
+    def validate(self, executable="ffmpeg") -> OutputStream:
+        '''Raise `FilterError` if `executable` lacks a filter, or a filter option,
+        the graph uses. Filters are looked up once, see `get_filter_options`.'''
+        _validate_filters(self, executable, strict=True)
+        return self
+
     def compile(self, *, executable="ffmpeg", print_cmd=True, join_args=False,
-                overwrite=True, progress='') -> Union[str, List[str]]:
-        '''Build command-line for invoking ffmpeg.'''
-        cmd_args_seq = [executable] + self.get_output_args(overwrite, progress)
-        command = join_cmd_args_seq(cmd_args_seq)
+                overwrite=True, progress='', filter_script: bool = None,
+                probes: Dict[str, Any] = None, validate=False) -> Union[str, List[str]]:
+        '''Build command-line for invoking ffmpeg, with `validate` checking the filters first.'''
+        if validate:
+            self.validate(executable)
+
+        cmd_args_seq = [executable] + self.get_output_args(overwrite, progress, filter_script, probes)
 
         if print_cmd:
-            color.greenln(command)
+            get_sink().on_command(cmd_args_seq)
 
         if join_args:
-            return command
+            return join_cmd_args_seq(cmd_args_seq)
+
+        return cmd_args_seq
+
+    def _compile_to_spawn(self, executable, print_cmd, overwrite, progress, filter_script, probes) -> List[str]:
+        '''Command line for a process about to be started, the only place filter
+        scripts are written to by default, see `apply_filter_script`.'''
+        cmd_args_seq = self.compile(executable=executable, print_cmd=False, overwrite=overwrite,
+                                    progress=progress, filter_script=False, probes=probes)
+        cmd_args_seq = apply_filter_script(cmd_args_seq, filter_script)
+
+        if print_cmd:
+            get_sink().on_command(cmd_args_seq)
 
         return cmd_args_seq
 
     def run_async(self, *, executable="ffmpeg", print_cmd=True, join_args=False,
                   pipe_stdin=False, pipe_stdout=True, pipe_stderr=True, quiet=False,
-                  overwrite=True, progress='') -> subprocess.Popen:
-        '''Asynchronously invoke ffmpeg for the supplied node graph.'''
-        if shutil.which(executable) is None:
-            raise FileNotFoundError(f"Can't find {executable} in $PATH or "
-                                    f"current directory. Please specify a absolute path or "
-                                    f"add {executable} into $PATH.")
-
-        cmd_args_seq = self.compile(
+                  overwrite=True, progress='', filter_script: bool = None,
+                  probes: Dict[str, Any] = None, pass_fds: Tuple[int, ...] = ()) -> FFmpegProcess:
+        '''Asynchronously invoke ffmpeg for the supplied node graph.
+
+        `progress` is a `-progress` target, e.g. ``pipe:1`` when stdout is free,
+        or a unix socket path. File descriptors in `pass_fds` stay open in ffmpeg.
+        With `settings.VALIDATE_FILTERS`, unknown filters and options raise
+        `FilterError` instead of starting ffmpeg.'''
+        _check_executable(executable)
+        if settings.VALIDATE_FILTERS:
+            _validate_filters(self, executable, strict=False)
+
+        cmd_args_seq = self._compile_to_spawn(executable, print_cmd, overwrite, progress, filter_script, probes)
+        try:
+            return FFmpegProcess(join_cmd_args_seq(cmd_args_seq) if join_args else cmd_args_seq, pass_fds=pass_fds,
+                                 **_get_stdio(pipe_stdin, pipe_stdout, pipe_stderr, quiet))
+        except BaseException:
+            remove_filter_scripts(cmd_args_seq)
+            raise
+
+    def run(self, executable="ffmpeg", print_cmd=True, quiet=False,
+            capture_stdout=True, capture_stderr=True, pipe_stdin=None,
+            overwrite=True, progress='', filter_script: bool = None,
+            probes: Dict[str, Any] = None, stderr_lines: int = None,
+            on_stderr: Callable[[str], None] = None,
+            stderr_hooks: Dict[Union[str, Pattern], Callable[[Match], None]] = None,
+            timeout: float = None, stall_timeout: float = None) -> RunResult:
+        '''Invoke ffmpeg for the supplied node graph, see `RunResult`.
+
+        Only the last `stderr_lines` lines of stderr are kept, `settings.STDERR_TAIL_LINES`
+        by default. `on_stderr` and `stderr_hooks` see every line as it is written,
+        see `StderrCapture`.
+
+        ffmpeg is stopped and `FFmpegTimeoutError` raised if it runs for more than
+        `timeout` seconds, or reports no progress for `stall_timeout` seconds.'''
+        start = perf_counter()
+        kwargs = dict(
                 executable=executable,
                 print_cmd=print_cmd,
-                join_args=join_args,
+                quiet=quiet,
+                pipe_stdin=pipe_stdin is not None,
+                pipe_stdout=capture_stdout,
+                pipe_stderr=capture_stderr,
                 overwrite=overwrite,
-                progress=progress,
+                filter_script=filter_script,
+                probes=probes,
         )
 
-        stdin_stream = subprocess.PIPE if pipe_stdin else None
-        stdout_stream = subprocess.PIPE if pipe_stdout else None
-        stderr_stream = subprocess.PIPE if pipe_stderr else None
+        if stall_timeout is None:
+            kwargs['progress'] = progress
+        elif progress:
+            raise ValueError("Can't specify both `stall_timeout` and `progress`")
 
-        return subprocess.Popen(
-                cmd_args_seq,
-                stdin=stdin_stream,
-                stdout=stdout_stream if not quiet else subprocess.DEVNULL,
-                stderr=stderr_stream if not quiet else subprocess.STDOUT,
-        )
+        job = None
+        if timeout is None and stall_timeout is None:
+            process = self.run_async(**kwargs)
+        else:
+            from ._watchdog import get_watchdog
 
-    def run(self, executable="ffmpeg", print_cmd=True, quiet=False,
-            capture_stdout=True, capture_stderr=True, pipe_stdin=None,
-            overwrite=True, progress='') -> Union[str, List[str]]:
-        '''Invoke ffmpeg for the supplied node graph.'''
+            job = get_watchdog().run_async(self, timeout=timeout, stall_timeout=stall_timeout, **kwargs)
+            process = job.process
+
+        capture = _get_stderr_capture(stderr_lines, on_stderr, stderr_hooks)
+        try:
+            stdout, stderr = process.collect(pipe_stdin, capture)
+        finally:
+            if job is not None:
+                job.unwatch()
+
+        if job is not None and job.reason is not None:
+            from ._watchdog import FFmpegTimeoutError
+            _raise(FFmpegTimeoutError('ffmpeg', stdout, stderr, job.reason), start)
+
+        if process.poll():
+            _raise(FFmpegError('ffmpeg', stdout, stderr), start)
+
+        result = RunResult(stdout, stderr, process.args, process.returncode, process.usage, perf_counter() - start,
+                           print_cmd)
+        get_sink().on_result(result)
+        return result
+
+    async def arun_async(self, *, executable="ffmpeg", print_cmd=True, pipe_stdin=False,
+                         pipe_stdout=True, pipe_stderr=True, quiet=False, overwrite=True,
+                         progress='', filter_script: bool = None, probes: Dict[str, Any] = None) -> AsyncProcess:
+        '''Start ffmpeg for the supplied node graph as an asyncio subprocess.'''
+        from ._aio import create_process
+
+        _check_executable(executable)
+        if settings.VALIDATE_FILTERS:
+            _validate_filters(self, executable, strict=False)
+
+        cmd_args_seq = self._compile_to_spawn(executable, print_cmd, overwrite, progress, filter_script, probes)
+        try:
+            return await create_process(cmd_args_seq, **_get_stdio(pipe_stdin, pipe_stdout, pipe_stderr, quiet))
+        except BaseException:
+            remove_filter_scripts(cmd_args_seq)
+            raise
+
+    async def arun(self, executable="ffmpeg", print_cmd=True, quiet=False,
+                   capture_stdout=True, capture_stderr=True, pipe_stdin=None,
+                   overwrite=True, progress='', filter_script: bool = None,
+                   probes: Dict[str, Any] = None, stderr_lines: int = None,
+                   on_stderr: Callable[[str], None] = None,
+                   stderr_hooks: Dict[Union[str, Pattern], Callable[[Match], None]] = None) -> RunResult:
+        '''Invoke ffmpeg for the supplied node graph without blocking the event loop,
+        cancelling terminates ffmpeg. stderr is kept like in `run`.'''
         start = perf_counter()
-        process = self.run_async(
+        process = await self.arun_async(
                 executable=executable,
                 print_cmd=print_cmd,
                 quiet=quiet,
@@ -158,20 +592,24 @@ class OutputStream(Stream):
                 pipe_stderr=capture_stderr,
                 overwrite=overwrite,
                 progress=progress,
+                filter_script=filter_script,
+                probes=probes,
         )
 
-        stdout, stderr = process.communicate(pipe_stdin)
-        if process.poll():
-            raise FFmpegError('ffmpeg', stdout, stderr)
-
-        end = perf_counter()
-        if not progress:
-            color.redln("[%2.4fs]\n" % (end - start))
+        capture = _get_stderr_capture(stderr_lines, on_stderr, stderr_hooks)
+        stdout, stderr = await process.collect(pipe_stdin, capture)
+        if process.returncode:
+            _raise(FFmpegError('ffmpeg', stdout, stderr), start)
 
-        return stdout, stderr
+        # asyncio reaps the process itself, leaving no rusage
+        result = RunResult(stdout, stderr, process.args, process.returncode, elapsed=perf_counter() - start,
+                           print_cmd=print_cmd)
+        get_sink().on_result(result)
+        return result
 
 
 class FilterableStream(Stream):
+    __slots__ = ()
 
     def __init__(self, upstream_node: Node, upstream_label: str, selector=None):
         super().__init__(
@@ -181,1963 +619,1978 @@ class FilterableStream(Stream):
                 selector=selector,
         )
 
-    def output(self, *streams_or_source, vn=False, an=False, ar=None, ab=None, ac=None,
-               acodec=None, vcodec=None, codec: str = None, aq_scale=None, vq_scale=None,
-               aspect=None, fps=None, format=None, pixel_format=None, video_bitrate=None,
-               audio_bitrate=None, v_profile=None, preset=None, mov_flags=None,
-               shortest=False, frame_size=None, v_frames: int = None, duration: Union[float, int, str] = None,
-               start_position: Union[float, int, str] = None, video_filter: str = None,
-               audio_filter: str = None, ignore_output=False, preview: bool = False,
-               enable_cuda=True, args: list = None, **kwargs) -> OutputStream:
-        raise NotImplementedError
-
-    def filter(self, *args, **kwargs) -> FilterableStream:
-        raise NotImplementedError
-
-    # Custom Filters
-    def gltransition(self, source: Union[str, Path] = None, offset: float = 1,
-                     duration: float = 1) -> FilterableStream:
-        raise NotImplementedError
-
-    # Audio Filters
-    def acompressor(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acompressor"""
-        raise NotImplementedError
-
-    def acontrast(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acontrast"""
-        raise NotImplementedError
-
-    def acopy(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acopy"""
-        raise NotImplementedError
-
-    def acrossfade(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acrossfade"""
-        raise NotImplementedError
-
-    def acrossover(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acrossover"""
-        raise NotImplementedError
-
-    def acrusher(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acrusher"""
-        raise NotImplementedError
-
-    def acue(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#acue"""
-        raise NotImplementedError
-
-    def adeclick(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#adeclick"""
-        raise NotImplementedError
-
-    def adeclip(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#adeclip"""
-        raise NotImplementedError
-
-    def adelay(self, delays: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#adelay"""
-        raise NotImplementedError
-
-    def adenorm(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#adenorm"""
-        raise NotImplementedError
-
-    def aintegral(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aintegral"""
-        raise NotImplementedError
-
-    def aecho(self, in_gain: int = 0.6, out_gain: int = 0.3, delays: str = "1000|1800",
-              decays: str = "0.3|0.25") -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aecho"""
-        raise NotImplementedError
-
-    def aemphasis(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aemphasis"""
-        raise NotImplementedError
-
-    def aeval(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aeval"""
-        raise NotImplementedError
-
-    def aexciter(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aexciter"""
-        raise NotImplementedError
-
-    def afade(self, fadein: bool = False, fadeout: bool = False,
-              start_sample: int = None, nb_samples: int = None,
-              start_time: int = None, duration: int = None,
-              curve: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#afade"""
-        raise NotImplementedError
-
-    def afftdn(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#afftdn"""
-        raise NotImplementedError
-
-    def afftfilt(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#afftfilt"""
-        raise NotImplementedError
-
-    def afir(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#afir"""
-        raise NotImplementedError
-
-    def aformat(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aformat"""
-        raise NotImplementedError
-
-    def afreqshift(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#afreqshift"""
-        raise NotImplementedError
-
-    def agate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#agate"""
-        raise NotImplementedError
-
-    def aiir(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aiir"""
-        raise NotImplementedError
-
-    def alimiter(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#alimiter"""
-        raise NotImplementedError
-
-    def allpass(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#allpass"""
-        raise NotImplementedError
-
-    def aloop(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aloop"""
-        raise NotImplementedError
-
-    def amerge(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#amerge"""
-        raise NotImplementedError
-
-    def amix(self, inputs: int = None, duration: str = None,
-             dropout_transition: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#amix"""
-        raise NotImplementedError
-
-    def amultiply(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#amultiply"""
-        raise NotImplementedError
-
-    def anequalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anequalizer"""
-        raise NotImplementedError
-
-    def anlmdn(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anlmdn"""
-        raise NotImplementedError
-
-    def anlms(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anlms"""
-        raise NotImplementedError
-
-    def anull(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anull"""
-        raise NotImplementedError
-
-    def apad(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#apad"""
-        raise NotImplementedError
-
-    def aphaser(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aphaser"""
-        raise NotImplementedError
-
-    def aphaseshift(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aphaseshift"""
-        raise NotImplementedError
-
-    def apulsator(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#apulsator"""
-        raise NotImplementedError
-
-    def aresample(self, inputs: int = None, duration: str = None,
-                  dropout_transition: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aresample"""
-        raise NotImplementedError
-
-    def areverse(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#areverse"""
-        raise NotImplementedError
-
-    def arnndn(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#arnndn"""
-        raise NotImplementedError
-
-    def asetnsamples(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asetnsamples"""
-        raise NotImplementedError
-
-    def asetrate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asetrate"""
-        raise NotImplementedError
-
-    def ashowinfo(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ashowinfo"""
-        raise NotImplementedError
-
-    def asoftclip(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asoftclip"""
-        raise NotImplementedError
-
-    def asr(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asr"""
-        raise NotImplementedError
-
-    def astats(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#astats"""
-        raise NotImplementedError
-
-    def asubboost(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asubboost"""
-        raise NotImplementedError
-
-    def asubcut(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asubcut"""
-        raise NotImplementedError
-
-    def asupercut(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asupercut"""
-        raise NotImplementedError
-
-    def asuperpass(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asuperpass"""
-        raise NotImplementedError
-
-    def asuperstop(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asuperstop"""
-        raise NotImplementedError
-
-    def atempo(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#atempo"""
-        raise NotImplementedError
-
-    def atrim(self, start: float = None, end: float = None, start_pts: int = None,
-              end_pts: int = None, duration: float = None, start_frame: int = None,
-              end_frame: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#atrim"""
-        raise NotImplementedError
+    def __getattr__(self, name: str):
+        # Filters are attached to the class by `@filterable()` when their module
+        # is imported, look up which module that is and import it on first use
+        from .filters._registry import FILTERS
+
+        module = FILTERS.get(name)
+        if module is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        importlib.import_module(f'.filters.{module}', __package__)
+        return object.__getattribute__(self, name)
+
+    if TYPE_CHECKING:
+        # Signatures for IDEs only, see `__getattr__`
+        def output(self, *streams_or_source, vn=False, an=False, ar=None, ab=None, ac=None,
+                   acodec=None, vcodec=None, codec: str = None, aq_scale=None, vq_scale=None,
+                   aspect=None, fps=None, format=None, pixel_format=None, video_bitrate=None,
+                   audio_bitrate=None, v_profile=None, preset=None, mov_flags=None,
+                   shortest=False, frame_size=None, v_frames: int = None, duration: Union[float, int, str] = None,
+                   start_position: Union[float, int, str] = None, video_filter: str = None,
+                   audio_filter: str = None, ignore_output=False, preview: bool = False,
+                   enable_cuda=True, args: list = None, **kwargs) -> OutputStream:
+            raise NotImplementedError
+
+        def filter(self, *args, **kwargs) -> FilterableStream:
+            raise NotImplementedError
+
+        # Custom Filters
+        def gltransition(self, source: Union[str, Path] = None, offset: float = 1,
+                         duration: float = 1) -> FilterableStream:
+            raise NotImplementedError
+
+        # Audio Filters
+        def acompressor(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acompressor"""
+            raise NotImplementedError
+
+        def acontrast(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acontrast"""
+            raise NotImplementedError
+
+        def acopy(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acopy"""
+            raise NotImplementedError
+
+        def acrossfade(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acrossfade"""
+            raise NotImplementedError
+
+        def acrossover(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acrossover"""
+            raise NotImplementedError
+
+        def acrusher(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acrusher"""
+            raise NotImplementedError
+
+        def acue(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#acue"""
+            raise NotImplementedError
+
+        def adeclick(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#adeclick"""
+            raise NotImplementedError
+
+        def adeclip(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#adeclip"""
+            raise NotImplementedError
+
+        def adelay(self, delays: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#adelay"""
+            raise NotImplementedError
+
+        def adenorm(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#adenorm"""
+            raise NotImplementedError
+
+        def aintegral(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aintegral"""
+            raise NotImplementedError
+
+        def aecho(self, in_gain: int = 0.6, out_gain: int = 0.3, delays: str = "1000|1800",
+                  decays: str = "0.3|0.25") -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aecho"""
+            raise NotImplementedError
+
+        def aemphasis(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aemphasis"""
+            raise NotImplementedError
+
+        def aeval(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aeval"""
+            raise NotImplementedError
+
+        def aexciter(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aexciter"""
+            raise NotImplementedError
+
+        def afade(self, fadein: bool = False, fadeout: bool = False,
+                  start_sample: int = None, nb_samples: int = None,
+                  start_time: int = None, duration: int = None,
+                  curve: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#afade"""
+            raise NotImplementedError
+
+        def afftdn(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#afftdn"""
+            raise NotImplementedError
+
+        def afftfilt(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#afftfilt"""
+            raise NotImplementedError
+
+        def afir(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#afir"""
+            raise NotImplementedError
+
+        def aformat(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aformat"""
+            raise NotImplementedError
+
+        def afreqshift(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#afreqshift"""
+            raise NotImplementedError
+
+        def agate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#agate"""
+            raise NotImplementedError
+
+        def aiir(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aiir"""
+            raise NotImplementedError
+
+        def alimiter(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#alimiter"""
+            raise NotImplementedError
+
+        def allpass(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#allpass"""
+            raise NotImplementedError
+
+        def aloop(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aloop"""
+            raise NotImplementedError
+
+        def amerge(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#amerge"""
+            raise NotImplementedError
+
+        def amix(self, inputs: int = None, duration: str = None,
+                 dropout_transition: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#amix"""
+            raise NotImplementedError
+
+        def amultiply(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#amultiply"""
+            raise NotImplementedError
+
+        def anequalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anequalizer"""
+            raise NotImplementedError
+
+        def anlmdn(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anlmdn"""
+            raise NotImplementedError
+
+        def anlms(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anlms"""
+            raise NotImplementedError
+
+        def anull(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anull"""
+            raise NotImplementedError
+
+        def apad(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#apad"""
+            raise NotImplementedError
+
+        def aphaser(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aphaser"""
+            raise NotImplementedError
+
+        def aphaseshift(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aphaseshift"""
+            raise NotImplementedError
+
+        def apulsator(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#apulsator"""
+            raise NotImplementedError
+
+        def aresample(self, inputs: int = None, duration: str = None,
+                      dropout_transition: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aresample"""
+            raise NotImplementedError
+
+        def areverse(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#areverse"""
+            raise NotImplementedError
+
+        def arnndn(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#arnndn"""
+            raise NotImplementedError
+
+        def asetnsamples(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asetnsamples"""
+            raise NotImplementedError
+
+        def asetrate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asetrate"""
+            raise NotImplementedError
+
+        def ashowinfo(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ashowinfo"""
+            raise NotImplementedError
+
+        def asoftclip(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asoftclip"""
+            raise NotImplementedError
+
+        def asr(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asr"""
+            raise NotImplementedError
+
+        def astats(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#astats"""
+            raise NotImplementedError
+
+        def asubboost(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asubboost"""
+            raise NotImplementedError
+
+        def asubcut(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asubcut"""
+            raise NotImplementedError
+
+        def asupercut(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asupercut"""
+            raise NotImplementedError
+
+        def asuperpass(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asuperpass"""
+            raise NotImplementedError
+
+        def asuperstop(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asuperstop"""
+            raise NotImplementedError
+
+        def atempo(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#atempo"""
+            raise NotImplementedError
+
+        def atrim(self, start: float = None, end: float = None, start_pts: int = None,
+                  end_pts: int = None, duration: float = None, start_frame: int = None,
+                  end_frame: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#atrim"""
+            raise NotImplementedError
 
-    def axcorrelate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#axcorrelate"""
-        raise NotImplementedError
+        def axcorrelate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#axcorrelate"""
+            raise NotImplementedError
 
-    def bandpass(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bandpass"""
-        raise NotImplementedError
+        def bandpass(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bandpass"""
+            raise NotImplementedError
 
-    def bandreject(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bandreject"""
-        raise NotImplementedError
+        def bandreject(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bandreject"""
+            raise NotImplementedError
 
-    def lowshelf(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lowshelf"""
-        raise NotImplementedError
+        def lowshelf(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lowshelf"""
+            raise NotImplementedError
 
-    def biquad(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#biquad"""
-        raise NotImplementedError
+        def biquad(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#biquad"""
+            raise NotImplementedError
 
-    def bs2b(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bs2b"""
-        raise NotImplementedError
+        def bs2b(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bs2b"""
+            raise NotImplementedError
 
-    def channelmap(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#channelmap"""
-        raise NotImplementedError
+        def channelmap(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#channelmap"""
+            raise NotImplementedError
 
-    def channelsplit(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#channelsplit"""
-        raise NotImplementedError
+        def channelsplit(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#channelsplit"""
+            raise NotImplementedError
 
-    def chorus(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#chorus"""
-        raise NotImplementedError
+        def chorus(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#chorus"""
+            raise NotImplementedError
 
-    def compand(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#compand"""
-        raise NotImplementedError
+        def compand(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#compand"""
+            raise NotImplementedError
 
-    def compensationdelay(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#compensationdelay"""
-        raise NotImplementedError
+        def compensationdelay(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#compensationdelay"""
+            raise NotImplementedError
 
-    def crossfeed(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#crossfeed"""
-        raise NotImplementedError
+        def crossfeed(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#crossfeed"""
+            raise NotImplementedError
 
-    def crystalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#crystalizer"""
-        raise NotImplementedError
+        def crystalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#crystalizer"""
+            raise NotImplementedError
 
-    def dcshift(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dcshift"""
-        raise NotImplementedError
+        def dcshift(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dcshift"""
+            raise NotImplementedError
 
-    def deesser(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deesser"""
-        raise NotImplementedError
+        def deesser(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deesser"""
+            raise NotImplementedError
 
-    def drmeter(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#drmeter"""
-        raise NotImplementedError
+        def drmeter(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#drmeter"""
+            raise NotImplementedError
 
-    def dynaudnorm(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dynaudnorm"""
-        raise NotImplementedError
+        def dynaudnorm(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dynaudnorm"""
+            raise NotImplementedError
 
-    def earwax(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#earwax"""
-        raise NotImplementedError
+        def earwax(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#earwax"""
+            raise NotImplementedError
 
-    def equalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#equalizer"""
-        raise NotImplementedError
+        def equalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#equalizer"""
+            raise NotImplementedError
 
-    def extrastereo(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#extrastereo"""
-        raise NotImplementedError
+        def extrastereo(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#extrastereo"""
+            raise NotImplementedError
 
-    def firequalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#firequalizer"""
-        raise NotImplementedError
+        def firequalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#firequalizer"""
+            raise NotImplementedError
 
-    def flanger(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#flanger"""
-        raise NotImplementedError
+        def flanger(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#flanger"""
+            raise NotImplementedError
 
-    def haas(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#haas"""
-        raise NotImplementedError
+        def haas(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#haas"""
+            raise NotImplementedError
 
-    def hdcd(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hdcd"""
-        raise NotImplementedError
+        def hdcd(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hdcd"""
+            raise NotImplementedError
 
-    def headphone(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#headphone"""
-        raise NotImplementedError
+        def headphone(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#headphone"""
+            raise NotImplementedError
 
-    def highpass(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#highpass"""
-        raise NotImplementedError
+        def highpass(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#highpass"""
+            raise NotImplementedError
 
-    def join(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#join"""
-        raise NotImplementedError
+        def join(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#join"""
+            raise NotImplementedError
 
-    def ladspa(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ladspa"""
-        raise NotImplementedError
+        def ladspa(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ladspa"""
+            raise NotImplementedError
 
-    def loudnorm(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#loudnorm"""
-        raise NotImplementedError
+        def loudnorm(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#loudnorm"""
+            raise NotImplementedError
 
-    def lowpass(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lowpass"""
-        raise NotImplementedError
+        def lowpass(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lowpass"""
+            raise NotImplementedError
 
-    def lv2(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lv2"""
-        raise NotImplementedError
+        def lv2(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lv2"""
+            raise NotImplementedError
 
-    def mcompand(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mcompand"""
-        raise NotImplementedError
+        def mcompand(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mcompand"""
+            raise NotImplementedError
 
-    def pan(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pan"""
-        raise NotImplementedError
+        def pan(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pan"""
+            raise NotImplementedError
 
-    def replaygain(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#replaygain"""
-        raise NotImplementedError
+        def replaygain(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#replaygain"""
+            raise NotImplementedError
 
-    def resample(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#resample"""
-        raise NotImplementedError
+        def resample(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#resample"""
+            raise NotImplementedError
 
-    def rubberband(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#rubberband"""
-        raise NotImplementedError
+        def rubberband(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#rubberband"""
+            raise NotImplementedError
 
-    def sidechaincompress(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sidechaincompress"""
-        raise NotImplementedError
+        def sidechaincompress(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sidechaincompress"""
+            raise NotImplementedError
 
-    def sidechaingate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sidechaingate"""
-        raise NotImplementedError
+        def sidechaingate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sidechaingate"""
+            raise NotImplementedError
 
-    def silencedetect(self, noise: float, duration: float) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#silencedetect"""
-        raise NotImplementedError
+        def silencedetect(self, noise: float, duration: float) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#silencedetect"""
+            raise NotImplementedError
 
-    def silenceremove(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#silenceremove"""
-        raise NotImplementedError
+        def silenceremove(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#silenceremove"""
+            raise NotImplementedError
 
-    def sofalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sofalizer"""
-        raise NotImplementedError
+        def sofalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sofalizer"""
+            raise NotImplementedError
 
-    def speechnorm(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#speechnorm"""
-        raise NotImplementedError
+        def speechnorm(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#speechnorm"""
+            raise NotImplementedError
 
-    def stereotools(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#stereotools"""
-        raise NotImplementedError
-
-    def stereowiden(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#stereowiden"""
-        raise NotImplementedError
-
-    def superequalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#superequalizer"""
-        raise NotImplementedError
-
-    def surround(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#surround"""
-        raise NotImplementedError
-
-    def highshelf(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#highshelf"""
-        raise NotImplementedError
-
-    def tremolo(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tremolo"""
-        raise NotImplementedError
-
-    def vibrato(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vibrato"""
-        raise NotImplementedError
-
-    def volume(self, volume: Union[str, float], *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#volume"""
-        raise NotImplementedError
-
-    def volumedetect(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#volumedetect"""
-        raise NotImplementedError
-
-    def abuffer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#abuffer"""
-        raise NotImplementedError
-
-    def aevalsrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aevalsrc"""
-        raise NotImplementedError
-
-    def afirsrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#afirsrc"""
-        raise NotImplementedError
-
-    def anullsrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anullsrc"""
-        raise NotImplementedError
-
-    def flite(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#flite"""
-        raise NotImplementedError
-
-    def anoisesrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anoisesrc"""
-        raise NotImplementedError
-
-    def hilbert(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hilbert"""
-        raise NotImplementedError
-
-    def sinc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sinc"""
-        raise NotImplementedError
-
-    def sine(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sine"""
-        raise NotImplementedError
-
-    def abuffersink(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#abuffersink"""
-        raise NotImplementedError
-
-    def anullsink(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#anullsink"""
-        raise NotImplementedError
-
-    # Video Filters
-    def addroi(self, x: int = None, y: int = None, w: int = None, h: int = None,
-               qoffset: float = None, clear: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#addroi"""
-        raise NotImplementedError
-
-    def alphaextract(self) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#alphaextract"""
-        raise NotImplementedError
-
-    def alphamerge(self, *streams: Stream) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#alphamerge"""
-        raise NotImplementedError
-
-    def amplify(self, radius: int = None, factor: int = None, threshold: int = None,
-                tolerance: int = None, low: int = None, high: int = None,
-                planes: int = None, ) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#amplify"""
-        raise NotImplementedError
-
-    def ass(self, filename: Union[str, Path] = None, original_size: str = None,
-            fontsdir: Union[str, Path] = None, alpha: int = None, charenc: str = None,
-            stream_index: int = None, force_style: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ass"""
-        raise NotImplementedError
-
-    def atadenoise(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#atadenoise"""
-        raise NotImplementedError
-
-    def avgblur(self, x: int = None, y: int = None,
-                planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#avgblur"""
-        raise NotImplementedError
-
-    def bbox(self, min_val: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bbox"""
-        raise NotImplementedError
-
-    def bilateral(self, s: float = None, r: float = None,
-                  planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bilateral"""
-        raise NotImplementedError
-
-    def bitplanenoise(self, bitplane: int = None,
-                      filter: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bitplanenoise"""
-        raise NotImplementedError
-
-    def blackdetect(self, d: float = None, pic_th: float = None,
-                    pix_th: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#blackdetect"""
-        raise NotImplementedError
-
-    def blackframe(self, amount: float = None,
-                   threshold: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#blackframe"""
-        raise NotImplementedError
-
-    def blend(self, all_mode: str = None, all_opacity: float = None,
-              all_expr: str = None, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#blend"""
-        raise NotImplementedError
-
-    def bm3d(self, sigma: float = None, block: int = None, bstep: int = None,
-             group: int = None, range: int = None, mstep: int = None, thmse: int = None,
-             hdthr: int = None, estim: str = None, ref: bool = None,
-             planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bm3d"""
-        raise NotImplementedError
-
-    def boxblur(self, luma_radius: int = None, luma_power: int = None,
-                chroma_radius: int = None, chroma_power: int = None,
-                alpha_radius: int = None, alpha_power: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#boxblur"""
-        raise NotImplementedError
-
-    def bwdif(self, mode: int = None, parity: int = None,
-              deint: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#bwdif"""
-        raise NotImplementedError
-
-    def cas(self, strength: float = None, planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#cas"""
-        raise NotImplementedError
-
-    def chromahold(self, color: str = None, similarity: float = None,
-                   blend: float = None, yuv: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#chromahold"""
-        raise NotImplementedError
-
-    def chromakey(self, color: str = None, similarity: float = None,
-                  blend: float = None, yuv: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#chromakey"""
-        raise NotImplementedError
-
-    def chromanr(self, thres: int = None, sizew: int = None, sizeh: int = None,
-                 stepw: int = None, steph: int = None, threy: int = None,
-                 threu: int = None, threv: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#chromanr"""
-        raise NotImplementedError
-
-    def chromashift(self, cbh: int = None, cbv: int = None, crh: int = None,
-                    crv: int = None, edge: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#chromashift"""
-        raise NotImplementedError
-
-    def ciescope(self, system: str = None, cie: str = None, gamuts: str = None,
-                 size: int = None, intensity: float = None, contrast: float = None,
-                 corrgamma: bool = None, showwhite: bool = None,
-                 gamma: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ciescope"""
-        raise NotImplementedError
-
-    def codecview(self, mv: str = None, qp: str = None, mv_type: str = None,
-                  frame_type: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#codecview"""
-        raise NotImplementedError
-
-    def colorbalance(self, rs: float = None, gs: float = None,
-                     bs: float = None, rm: float = None, gm: float = None,
-                     bm: float = None, rh: float = None, gh: float = None,
-                     bh: float = None, pl: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorbalance"""
-        raise NotImplementedError
-
-    def colorcontrast(self, rc: float = None, gm: float = None, by: float = None,
-                      rcw: float = None, gmw: float = None, byw: float = None,
-                      pl: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorcontrast"""
-        raise NotImplementedError
-
-    def colorcorrect(self, rl: float = None, bl: float = None, rh: float = None,
-                     bh: float = None, saturation: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorcorrect"""
-        raise NotImplementedError
-
-    def colorchannelmixer(self, rr: float = None, rg: float = None,
-                          rb: float = None, ra: float = None, gr: float = None,
-                          gg: float = None, gb: float = None, ga: float = None,
-                          br: float = None, bg: float = None, ba: float = None,
-                          ar: float = None, ag: float = None, ab: float = None,
-                          aa: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorchannelmixer"""
-        raise NotImplementedError
-
-    def colorize(self, hue: int = None, saturation: float = None,
-                 lightness: float = None, mix: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorize"""
-        raise NotImplementedError
-
-    def colorkey(self, color: str = None, similarity: float = None,
-                 blend: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorkey"""
-        raise NotImplementedError
-
-    def colorhold(self, color: str = None, similarity: float = None,
-                  blend: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorhold"""
-        raise NotImplementedError
-
-    def colorlevels(self, rimin: float = None, gimin: float = None,
-                    bimin: float = None, aimin: float = None, rimax: float = None,
-                    gimax: float = None, bimax: float = None, aimax: float = None,
-                    romin: float = None, gomin: float = None, bomin: float = None,
-                    aomin: float = None, romax: float = None, gomax: float = None,
-                    bomax: float = None, aomax: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorlevels"""
-        raise NotImplementedError
-
-    def colormatrix(self, src: str, dst: str) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colormatrix"""
-        raise NotImplementedError
-
-    def colorspace(self, all: str = None, space: str = None, trc: str = None,
-                   primaries: str = None, range: str = None, format: str = None,
-                   fast: bool = None, dither: str = None, wpadapt: str = None,
-                   iall: str = None, ispace: str = None, iprimaries: str = None,
-                   itrc: str = None, irange: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorspace"""
-        raise NotImplementedError
-
-    def colortemperature(self, temperature: int = None, mix: float = None,
-                         pl: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colortemperature"""
-        raise NotImplementedError
-
-    def convolution(self, m0: int = None, m1: int = None, m2: int = None, m3: int = None,
-                    rdiv0: int = None, rdiv1: int = None, rdiv2: int = None, rdiv3: int = None,
-                    bias0: int = None, bias1: int = None, bias2: int = None, bias3: int = None,
-                    mode0: int = None, mode1: int = None, mode2: int = None,
-                    mode3: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#convolution"""
-        raise NotImplementedError
-
-    def convolve(self, planes: int = None, impulse: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#convolve"""
-        raise NotImplementedError
-
-    def copy(self) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#copy"""
-        raise NotImplementedError
-
-    def coreimage(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#coreimage"""
-        raise NotImplementedError
-
-    def cover_rect(self, cover: Union[str, Path] = None,
-                   mode: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#cover_rect"""
-        raise NotImplementedError
-
-    def crop(self, w: int = None, h: int = None, x: int = None, y: int = None,
-             keep_aspect: bool = None, exact: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#crop"""
-        raise NotImplementedError
-
-    def cropdetect(self, limit: int = None, round: int = None,
-                   reset_count: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#cropdetect"""
-        raise NotImplementedError
-
-    def cue(self, cue: int = None, preroll: int = None,
-            buffer: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#cue"""
-        raise NotImplementedError
-
-    def curves(self, preset: str = None, master: str = None, red: str = None,
-               green: str = None, blue: str = None, all: str = None,
-               psfile: Union[str, Path] = None, plot: str = None) -> FilterableStream:
-        """Apply color adjustments using curves.
-
-        https://ffmpeg.org/ffmpeg-filters.html#curves"""
-        raise NotImplementedError
-
-    def datascope(self, size: str = None, x: int = None, y: int = None,
-                  mode: str = None, axis: str = None, opacity: float = None,
-                  format: str = None, components: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#datascope"""
-        raise NotImplementedError
-
-    def dblur(self, angle: int = None, radius: int = None,
-              planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dblur"""
-        raise NotImplementedError
-
-    def dctdnoiz(self, sigma: float = None, overlap: int = None, expr: str = None,
-                 n: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dctdnoiz"""
-        raise NotImplementedError
-
-    def deband(self, thr1: float = None, thr2: float = None, thr3: float = None,
-               thr4: float = None, r: int = None, d: float = None, blur: bool = None,
-               c: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deband"""
-        raise NotImplementedError
-
-    def deblock(self, filter: str = None, block: int = None, alpha: float = None,
-                beta: float = None, gamma: float = None, delta: float = None,
-                planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deblock"""
-        raise NotImplementedError
-
-    def decimate(self, cycle: int = None, dupthres: float = None,
-                 scthresh: float = None, blockx: int = None, blocky: int = None,
-                 ppsrc: int = None, chroma: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#decimate"""
-        raise NotImplementedError
-
-    def deconvolve(self, planes: int = None, impulse: str = None,
-                   noise: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deconvolve"""
-        raise NotImplementedError
-
-    def dedot(self, m: str = None, lt: float = None, tl: float = None,
-              tc: float = None, ct: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dedot"""
-        raise NotImplementedError
-
-    def deflate(self, threshold0: int = None, threshold1: int = None,
-                threshold2: int = None, threshold3: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deflate"""
-        raise NotImplementedError
-
-    def deflicker(self, size: int = None, mode: str = None,
-                  bypass: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deflicker"""
-        raise NotImplementedError
-
-    def dejudder(self, cycle: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dejudder"""
-        raise NotImplementedError
-
-    def delogo(self, x: int, y: int, w: int, h: int, band: int = None,
-               show: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#delogo"""
-        raise NotImplementedError
-
-    def derain(self, filter_type: str = None, dnn_backend: str = None,
-               mode: Union[str, Path] = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#derain"""
-        raise NotImplementedError
-
-    def deshake(self, x: int = None, y: int = None, w: int = None,
-                h: int = None, rx: int = None, ry: int = None, edge: str = None,
-                blocksize: int = None, contrast: int = None, search: str = None,
-                filename: Union[str, Path] = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deshake"""
-        raise NotImplementedError
-
-    def despill(self, type: str = None, mix: str = None, expand: int = None,
-                red: int = None, green: int = None, blue: int = None,
-                brightness: int = None, alpha: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#despill"""
-        raise NotImplementedError
-
-    def detelecine(self, first_field: str = None, pattern: int = None,
-                   start_frame: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#detelecine"""
-        raise NotImplementedError
-
-    def dilation(self, threshold0: int = None, threshold1: int = None,
-                 threshold2: int = None, threshold3: int = None,
-                 coordinates: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dilation"""
-        raise NotImplementedError
-
-    def displace(self, edge: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#displace"""
-        raise NotImplementedError
-
-    def dnn_processing(self, dnn_backend: str = None,
-                       model: Union[str, Path] = None, input: str = None,
-                       output: str = None, set_async: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dnn_processing"""
-        raise NotImplementedError
-
-    def drawbox(self, x: int = None, y: int = None, w: int = None,
-                h: int = None, color: str = None, thickness: int = None,
-                replace: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#drawbox"""
-        raise NotImplementedError
-
-    def drawgraph(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#drawgraph"""
-        raise NotImplementedError
-
-    def drawgrid(self, x: int = None, y: int = None, w: int = None,
-                 h: int = None, color: str = None, thickness: int = None,
-                 replace: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#drawgrid"""
-        raise NotImplementedError
-
-    def drawtext(self, text: str = None, x: int = 0, y: int = 0,
-                 fontsize: int = 0, fontfile: Union[str, Path] = None,
-                 fontcolor: str = None, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#drawtext"""
-        raise NotImplementedError
-
-    def edgedetect(self, low: float = None, high: float = None, mode: str = None,
-                   planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#edgedetect"""
-        raise NotImplementedError
-
-    def elbg(self, codebook_length: int = None, nb_steps: int = None,
-             seed: int = None, pal8: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#elbg"""
-        raise NotImplementedError
-
-    def entropy(self, mode: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#entropy"""
-        raise NotImplementedError
-
-    def epx(self, n: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#epx"""
-        raise NotImplementedError
-
-    def eq(self, contrast: float = None, brightness: float = None,
-           saturation: float = None, gamma: float = None, gamma_r: float = None,
-           gamma_g: float = None, gamma_b: float = None,
-           gamma_weight: float = None, eval: str = None, ) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#eq"""
-        raise NotImplementedError
-
-    def erosion(self, threshold0: int = None, threshold1: int = None,
-                threshold2: int = None, threshold3: int = None,
-                coordinates: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#erosion"""
-        raise NotImplementedError
-
-    def estdif(self, mode: str = None, parity: str = None, deint: str = None,
-               rslope: int = None, redge: int = None, interp: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#estdif"""
-        raise NotImplementedError
-
-    def exposure(self, exposure: float = None, black: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#exposure"""
-        raise NotImplementedError
-
-    def extractplanes(self, planes: str = None) -> List[FilterableStream]:
-        """https://ffmpeg.org/ffmpeg-filters.html#extractplanes"""
-        raise NotImplementedError
-
-    def fade(self, t: str = None, start_frame: int = None, nb_frames: int = None,
-             alpha: int = None, start_time: int = None, duration: int = None,
-             color: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fade"""
-        raise NotImplementedError
-
-    def fftdnoiz(self, sigma: int = None, amount: int = None, block: int = None,
-                 overlap: float = None, prev: int = None, next: int = None,
+        def stereotools(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#stereotools"""
+            raise NotImplementedError
+
+        def stereowiden(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#stereowiden"""
+            raise NotImplementedError
+
+        def superequalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#superequalizer"""
+            raise NotImplementedError
+
+        def surround(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#surround"""
+            raise NotImplementedError
+
+        def highshelf(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#highshelf"""
+            raise NotImplementedError
+
+        def tremolo(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tremolo"""
+            raise NotImplementedError
+
+        def vibrato(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vibrato"""
+            raise NotImplementedError
+
+        def volume(self, volume: Union[str, float], *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#volume"""
+            raise NotImplementedError
+
+        def volumedetect(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#volumedetect"""
+            raise NotImplementedError
+
+        def abuffer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#abuffer"""
+            raise NotImplementedError
+
+        def aevalsrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aevalsrc"""
+            raise NotImplementedError
+
+        def afirsrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#afirsrc"""
+            raise NotImplementedError
+
+        def anullsrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anullsrc"""
+            raise NotImplementedError
+
+        def flite(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#flite"""
+            raise NotImplementedError
+
+        def anoisesrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anoisesrc"""
+            raise NotImplementedError
+
+        def hilbert(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hilbert"""
+            raise NotImplementedError
+
+        def sinc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sinc"""
+            raise NotImplementedError
+
+        def sine(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sine"""
+            raise NotImplementedError
+
+        def abuffersink(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#abuffersink"""
+            raise NotImplementedError
+
+        def anullsink(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#anullsink"""
+            raise NotImplementedError
+
+        # Video Filters
+        def addroi(self, x: int = None, y: int = None, w: int = None, h: int = None,
+                   qoffset: float = None, clear: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#addroi"""
+            raise NotImplementedError
+
+        def alphaextract(self) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#alphaextract"""
+            raise NotImplementedError
+
+        def alphamerge(self, *streams: Stream) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#alphamerge"""
+            raise NotImplementedError
+
+        def amplify(self, radius: int = None, factor: int = None, threshold: int = None,
+                    tolerance: int = None, low: int = None, high: int = None,
+                    planes: int = None, ) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#amplify"""
+            raise NotImplementedError
+
+        def ass(self, filename: Union[str, Path] = None, original_size: str = None,
+                fontsdir: Union[str, Path] = None, alpha: int = None, charenc: str = None,
+                stream_index: int = None, force_style: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ass"""
+            raise NotImplementedError
+
+        def atadenoise(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#atadenoise"""
+            raise NotImplementedError
+
+        def avgblur(self, x: int = None, y: int = None,
+                    planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#avgblur"""
+            raise NotImplementedError
+
+        def bbox(self, min_val: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bbox"""
+            raise NotImplementedError
+
+        def bilateral(self, s: float = None, r: float = None,
+                      planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bilateral"""
+            raise NotImplementedError
+
+        def bitplanenoise(self, bitplane: int = None,
+                          filter: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bitplanenoise"""
+            raise NotImplementedError
+
+        def blackdetect(self, d: float = None, pic_th: float = None,
+                        pix_th: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#blackdetect"""
+            raise NotImplementedError
+
+        def blackframe(self, amount: float = None,
+                       threshold: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#blackframe"""
+            raise NotImplementedError
+
+        def blend(self, all_mode: str = None, all_opacity: float = None,
+                  all_expr: str = None, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#blend"""
+            raise NotImplementedError
+
+        def bm3d(self, sigma: float = None, block: int = None, bstep: int = None,
+                 group: int = None, range: int = None, mstep: int = None, thmse: int = None,
+                 hdthr: int = None, estim: str = None, ref: bool = None,
                  planes: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fftdnoiz"""
-        raise NotImplementedError
-
-    def fftfilt(self, dc_Y: int = None, dc_U: int = None, dc_V: int = None,
-                weight_Y: str = None, weight_U: str = None, weight_V: str = None,
-                eval: str = None, X: int = None, Y: int = None, W: int = None,
-                H: int = None, N: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fftfilt"""
-        raise NotImplementedError
-
-    def field(self, t: Union[int, str] = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#field"""
-        raise NotImplementedError
-
-    def fieldhint(self, hint: Union[str, Path], mode: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fieldhint"""
-        raise NotImplementedError
-
-    def fieldmatch(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fieldmatch"""
-        raise NotImplementedError
-
-    def fieldorder(self, order: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fieldorder"""
-        raise NotImplementedError
-
-    def fifo(self) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fifo_002c-afifo"""
-        raise NotImplementedError
-
-    def afifo(self) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fifo_002c-afifo"""
-        raise NotImplementedError
-
-    def fillborders(self, left: int = None, right: int = None, top: int = None,
-                    bottom: int = None, mode: str = None,
-                    color: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fillborders"""
-        raise NotImplementedError
-
-    def find_rect(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#find_rect"""
-        raise NotImplementedError
-
-    def floodfill(self, x: int = None, y: int = None, s0: str = None, s1: str = None,
-                  s2: str = None, s3: str = None, d0: str = None, d1: str = None,
-                  d2: str = None, d3: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#floodfill"""
-        raise NotImplementedError
-
-    def format(self, *pix_fmt: str) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#format"""
-        raise NotImplementedError
-
-    def fps(self, fps: int = None, start_time: int = None, round: str = None,
-            eof_action: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fps"""
-        raise NotImplementedError
-
-    def framepack(self, *streams: Stream, format: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#framepack"""
-        raise NotImplementedError
-
-    def framerate(self, fps: int = None, interp_start: int = None, interp_end: int = None,
-                  scene: int = None, flags: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#framerate"""
-        raise NotImplementedError
-
-    def framestep(self, step: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#framestep"""
-        raise NotImplementedError
-
-    def freezedetect(self, noise: Union[str, float], duration: int) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#freezedetect"""
-        raise NotImplementedError
-
-    def freezeframes(self, first: int = None, last: int = None,
-                     replace: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#freezeframes"""
-        raise NotImplementedError
-
-    def frei0r(self, filter_name: str, filter_params: str) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#frei0r"""
-        raise NotImplementedError
-
-    def fspp(self, quality: int = None, qp: int = None, strength: int = None,
-             use_bframe_qp: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#fspp"""
-        raise NotImplementedError
-
-    def gblur(self, sigma: float = None, steps: int = None, planes: int = None,
-              sigma_v: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#gblur"""
-        raise NotImplementedError
-
-    def geq(self, lum_expr: str = None, cb_expr: str = None, cr_expr: str = None,
-            alpha_expr: str = None, red_expr: str = None, green_expr: str = None,
-            blue_expr: str = None, lum: str = None, cb: str = None, cr: str = None,
-            r: str = None, g: str = None, b: str = None, a: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#geq"""
-        raise NotImplementedError
-
-    def gradfun(self, strength: float = None, radius: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#gradfun"""
-        raise NotImplementedError
-
-    def graphmonitor(self, size: str = None, opacity: float = None, mode: str = None,
-                     flags: str = None, rate: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#graphmonitor"""
-        raise NotImplementedError
-
-    def greyedge(self, difford: float = None, minknorm: int = None,
-                 sigma: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#greyedge"""
-        raise NotImplementedError
-
-    def haldclut(self, shortest: bool = None, repeatlast: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#haldclut"""
-        raise NotImplementedError
-
-    def hflip(self) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hflip"""
-        raise NotImplementedError
-
-    def histeq(self, strength: float = None, intensity: float = None,
-               antibanding: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#histeq"""
-        raise NotImplementedError
-
-    def histogram(self, level_height: int = None, scale_height: int = None,
-                  display_mode: str = None, levels_mode: str = None,
-                  components: int = None, fgopacity: float = None,
-                  bgopacity: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#histogram"""
-        raise NotImplementedError
-
-    def hqdn3d(self, luma_spatial: float = None, chroma_spatial: float = None,
-               luma_tmp: float = None, chroma_tmp: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hqdn3d"""
-        raise NotImplementedError
-
-    def hwdownload(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hwdownload"""
-        raise NotImplementedError
-
-    def hwmap(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hwmap"""
-        raise NotImplementedError
-
-    def hwupload(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hwupload"""
-        raise NotImplementedError
-
-    def hwupload_cuda(self, device: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hwupload_cuda"""
-        raise NotImplementedError
-
-    def hqx(self, n: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hqx"""
-        raise NotImplementedError
-
-    def hstack(self, *streams: Stream, inputs: int = None,
-               shortest: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hstack"""
-        raise NotImplementedError
-
-    def hue(self, h: Union[str, int] = None, s: Union[str, int] = None,
-            H: Union[str, int] = None, b: Union[str, int] = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hue"""
-        raise NotImplementedError
-
-    def hysteresis(self, planes: int = None, threshold: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#hysteresis"""
-        raise NotImplementedError
-
-    def identity(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#identity"""
-        raise NotImplementedError
-
-    def idet(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#idet"""
-        raise NotImplementedError
-
-    def il(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#il"""
-        raise NotImplementedError
-
-    def inflate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#inflate"""
-        raise NotImplementedError
-
-    def interlace(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#interlace"""
-        raise NotImplementedError
-
-    def kerndeint(self, thresh: int = None, map: int = None, order: int = None,
-                  sharp: int = None, twoway: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#kerndeint"""
-        raise NotImplementedError
-
-    def kirsch(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#kirsch"""
-        raise NotImplementedError
-
-    def lagfun(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lagfun"""
-        raise NotImplementedError
-
-    def lenscorrection(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lenscorrection"""
-        raise NotImplementedError
-
-    def lensfun(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lensfun"""
-        raise NotImplementedError
-
-    def libvmaf(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#libvmaf"""
-        raise NotImplementedError
-
-    def limiter(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#limiter"""
-        raise NotImplementedError
-
-    def loop(self, loop: int = None, size: int = None,
-             start: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#loop"""
-        raise NotImplementedError
-
-    def lut1d(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lut1d"""
-        raise NotImplementedError
-
-    def lut3d(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lut3d"""
-        raise NotImplementedError
-
-    def lumakey(self, threshold: float = None, tolerance: float = None,
-                softness: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lumakey"""
-        raise NotImplementedError
-
-    def lutyuv(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#lutyuv"""
-        raise NotImplementedError
-
-    def tlut2(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tlut2"""
-        raise NotImplementedError
-
-    def maskedclamp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#maskedclamp"""
-        raise NotImplementedError
-
-    def maskedmax(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#maskedmax"""
-        raise NotImplementedError
-
-    def maskedmerge(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#maskedmerge"""
-        raise NotImplementedError
-
-    def maskedmin(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#maskedmin"""
-        raise NotImplementedError
-
-    def maskedthreshold(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#maskedthreshold"""
-        raise NotImplementedError
-
-    def maskfun(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#maskfun"""
-        raise NotImplementedError
-
-    def mcdeint(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mcdeint"""
-        raise NotImplementedError
-
-    def median(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#median"""
-        raise NotImplementedError
-
-    def mergeplanes(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mergeplanes"""
-        raise NotImplementedError
-
-    def mestimate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mestimate"""
-        raise NotImplementedError
-
-    def midequalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#midequalizer"""
-        raise NotImplementedError
-
-    def minterpolate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#minterpolate"""
-        raise NotImplementedError
-
-    def mix(self, *streams: Stream, inputs: int = None, weights: str = None,
-            scale: str = None, duration: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mix"""
-        raise NotImplementedError
-
-    def monochrome(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#monochrome"""
-        raise NotImplementedError
-
-    def mpdecimate(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mpdecimate"""
-        raise NotImplementedError
-
-    def negate(self, negate_alpha: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#negate"""
-        raise NotImplementedError
-
-    def nlmeans(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#nlmeans"""
-        raise NotImplementedError
-
-    def nnedi(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#nnedi"""
-        raise NotImplementedError
-
-    def noformat(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#noformat"""
-        raise NotImplementedError
-
-    def noise(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#noise"""
-        raise NotImplementedError
-
-    def normalize(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#normalize"""
-        raise NotImplementedError
-
-    def null(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#null"""
-        raise NotImplementedError
-
-    def ocr(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ocr"""
-        raise NotImplementedError
-
-    def ocv(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ocv"""
-        raise NotImplementedError
-
-    def oscilloscope(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#oscilloscope"""
-        raise NotImplementedError
-
-    def overlay(self, overlay_node: Node, x: Union[int, str] = 0, y: Union[int, str] = 0,
-                eof_action: str = None, eval: str = None, shortest: bool = None,
-                format: str = None, repeatlast: bool = None, alpha: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#overlay"""
-        raise NotImplementedError
-
-    def overlay_cuda(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#overlay_cuda"""
-        raise NotImplementedError
-
-    def owdenoise(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#owdenoise"""
-        raise NotImplementedError
-
-    def pad(self, w: Union[str, int] = None, h: Union[str, int] = None,
-            x: Union[str, int] = None, y: Union[str, int] = None, color: str = None,
-            eval: str = None, aspect: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pad"""
-        raise NotImplementedError
-
-    def palettegen(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#palettegen"""
-        raise NotImplementedError
-
-    def paletteuse(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#paletteuse"""
-        raise NotImplementedError
-
-    def perspective(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#perspective"""
-        raise NotImplementedError
-
-    def phase(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#phase"""
-        raise NotImplementedError
-
-    def photosensitivity(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#photosensitivity"""
-        raise NotImplementedError
-
-    def pixdesctest(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pixdesctest"""
-        raise NotImplementedError
-
-    def pixscope(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pixscope"""
-        raise NotImplementedError
-
-    def pp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pp"""
-        raise NotImplementedError
-
-    def pp7(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pp7"""
-        raise NotImplementedError
-
-    def premultiply(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#premultiply"""
-        raise NotImplementedError
-
-    def prewitt(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#prewitt"""
-        raise NotImplementedError
-
-    def pseudocolor(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pseudocolor"""
-        raise NotImplementedError
-
-    def psnr(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#psnr"""
-        raise NotImplementedError
-
-    def pullup(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pullup"""
-        raise NotImplementedError
-
-    def qp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#qp"""
-        raise NotImplementedError
-
-    def random(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#random"""
-        raise NotImplementedError
-
-    def readeia608(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#readeia608"""
-        raise NotImplementedError
-
-    def readvitc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#readvitc"""
-        raise NotImplementedError
-
-    def remap(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#remap"""
-        raise NotImplementedError
-
-    def removegrain(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#removegrain"""
-        raise NotImplementedError
-
-    def removelogo(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#removelogo"""
-        raise NotImplementedError
-
-    def repeatfields(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#repeatfields"""
-        raise NotImplementedError
-
-    def reverse(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#reverse"""
-        raise NotImplementedError
-
-    def rgbashift(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#rgbashift"""
-        raise NotImplementedError
-
-    def roberts(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#roberts"""
-        raise NotImplementedError
+            """https://ffmpeg.org/ffmpeg-filters.html#bm3d"""
+            raise NotImplementedError
+
+        def boxblur(self, luma_radius: int = None, luma_power: int = None,
+                    chroma_radius: int = None, chroma_power: int = None,
+                    alpha_radius: int = None, alpha_power: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#boxblur"""
+            raise NotImplementedError
+
+        def bwdif(self, mode: int = None, parity: int = None,
+                  deint: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#bwdif"""
+            raise NotImplementedError
+
+        def cas(self, strength: float = None, planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#cas"""
+            raise NotImplementedError
+
+        def chromahold(self, color: str = None, similarity: float = None,
+                       blend: float = None, yuv: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#chromahold"""
+            raise NotImplementedError
+
+        def chromakey(self, color: str = None, similarity: float = None,
+                      blend: float = None, yuv: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#chromakey"""
+            raise NotImplementedError
+
+        def chromanr(self, thres: int = None, sizew: int = None, sizeh: int = None,
+                     stepw: int = None, steph: int = None, threy: int = None,
+                     threu: int = None, threv: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#chromanr"""
+            raise NotImplementedError
+
+        def chromashift(self, cbh: int = None, cbv: int = None, crh: int = None,
+                        crv: int = None, edge: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#chromashift"""
+            raise NotImplementedError
+
+        def ciescope(self, system: str = None, cie: str = None, gamuts: str = None,
+                     size: int = None, intensity: float = None, contrast: float = None,
+                     corrgamma: bool = None, showwhite: bool = None,
+                     gamma: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ciescope"""
+            raise NotImplementedError
+
+        def codecview(self, mv: str = None, qp: str = None, mv_type: str = None,
+                      frame_type: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#codecview"""
+            raise NotImplementedError
+
+        def colorbalance(self, rs: float = None, gs: float = None,
+                         bs: float = None, rm: float = None, gm: float = None,
+                         bm: float = None, rh: float = None, gh: float = None,
+                         bh: float = None, pl: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorbalance"""
+            raise NotImplementedError
+
+        def colorcontrast(self, rc: float = None, gm: float = None, by: float = None,
+                          rcw: float = None, gmw: float = None, byw: float = None,
+                          pl: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorcontrast"""
+            raise NotImplementedError
+
+        def colorcorrect(self, rl: float = None, bl: float = None, rh: float = None,
+                         bh: float = None, saturation: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorcorrect"""
+            raise NotImplementedError
+
+        def colorchannelmixer(self, rr: float = None, rg: float = None,
+                              rb: float = None, ra: float = None, gr: float = None,
+                              gg: float = None, gb: float = None, ga: float = None,
+                              br: float = None, bg: float = None, ba: float = None,
+                              ar: float = None, ag: float = None, ab: float = None,
+                              aa: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorchannelmixer"""
+            raise NotImplementedError
+
+        def colorize(self, hue: int = None, saturation: float = None,
+                     lightness: float = None, mix: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorize"""
+            raise NotImplementedError
+
+        def colorkey(self, color: str = None, similarity: float = None,
+                     blend: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorkey"""
+            raise NotImplementedError
+
+        def colorhold(self, color: str = None, similarity: float = None,
+                      blend: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorhold"""
+            raise NotImplementedError
+
+        def colorlevels(self, rimin: float = None, gimin: float = None,
+                        bimin: float = None, aimin: float = None, rimax: float = None,
+                        gimax: float = None, bimax: float = None, aimax: float = None,
+                        romin: float = None, gomin: float = None, bomin: float = None,
+                        aomin: float = None, romax: float = None, gomax: float = None,
+                        bomax: float = None, aomax: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorlevels"""
+            raise NotImplementedError
+
+        def colormatrix(self, src: str, dst: str) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colormatrix"""
+            raise NotImplementedError
+
+        def colorspace(self, all: str = None, space: str = None, trc: str = None,
+                       primaries: str = None, range: str = None, format: str = None,
+                       fast: bool = None, dither: str = None, wpadapt: str = None,
+                       iall: str = None, ispace: str = None, iprimaries: str = None,
+                       itrc: str = None, irange: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorspace"""
+            raise NotImplementedError
+
+        def colortemperature(self, temperature: int = None, mix: float = None,
+                             pl: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colortemperature"""
+            raise NotImplementedError
+
+        def convolution(self, m0: int = None, m1: int = None, m2: int = None, m3: int = None,
+                        rdiv0: int = None, rdiv1: int = None, rdiv2: int = None, rdiv3: int = None,
+                        bias0: int = None, bias1: int = None, bias2: int = None, bias3: int = None,
+                        mode0: int = None, mode1: int = None, mode2: int = None,
+                        mode3: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#convolution"""
+            raise NotImplementedError
+
+        def convolve(self, planes: int = None, impulse: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#convolve"""
+            raise NotImplementedError
+
+        def copy(self) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#copy"""
+            raise NotImplementedError
+
+        def coreimage(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#coreimage"""
+            raise NotImplementedError
+
+        def cover_rect(self, cover: Union[str, Path] = None,
+                       mode: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#cover_rect"""
+            raise NotImplementedError
+
+        def crop(self, w: int = None, h: int = None, x: int = None, y: int = None,
+                 keep_aspect: bool = None, exact: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#crop"""
+            raise NotImplementedError
+
+        def cropdetect(self, limit: int = None, round: int = None,
+                       reset_count: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#cropdetect"""
+            raise NotImplementedError
+
+        def cue(self, cue: int = None, preroll: int = None,
+                buffer: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#cue"""
+            raise NotImplementedError
+
+        def curves(self, preset: str = None, master: str = None, red: str = None,
+                   green: str = None, blue: str = None, all: str = None,
+                   psfile: Union[str, Path] = None, plot: str = None) -> FilterableStream:
+            """Apply color adjustments using curves.
+
+            https://ffmpeg.org/ffmpeg-filters.html#curves"""
+            raise NotImplementedError
+
+        def datascope(self, size: str = None, x: int = None, y: int = None,
+                      mode: str = None, axis: str = None, opacity: float = None,
+                      format: str = None, components: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#datascope"""
+            raise NotImplementedError
+
+        def dblur(self, angle: int = None, radius: int = None,
+                  planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dblur"""
+            raise NotImplementedError
+
+        def dctdnoiz(self, sigma: float = None, overlap: int = None, expr: str = None,
+                     n: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dctdnoiz"""
+            raise NotImplementedError
+
+        def deband(self, thr1: float = None, thr2: float = None, thr3: float = None,
+                   thr4: float = None, r: int = None, d: float = None, blur: bool = None,
+                   c: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deband"""
+            raise NotImplementedError
+
+        def deblock(self, filter: str = None, block: int = None, alpha: float = None,
+                    beta: float = None, gamma: float = None, delta: float = None,
+                    planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deblock"""
+            raise NotImplementedError
+
+        def decimate(self, cycle: int = None, dupthres: float = None,
+                     scthresh: float = None, blockx: int = None, blocky: int = None,
+                     ppsrc: int = None, chroma: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#decimate"""
+            raise NotImplementedError
+
+        def deconvolve(self, planes: int = None, impulse: str = None,
+                       noise: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deconvolve"""
+            raise NotImplementedError
+
+        def dedot(self, m: str = None, lt: float = None, tl: float = None,
+                  tc: float = None, ct: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dedot"""
+            raise NotImplementedError
+
+        def deflate(self, threshold0: int = None, threshold1: int = None,
+                    threshold2: int = None, threshold3: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deflate"""
+            raise NotImplementedError
+
+        def deflicker(self, size: int = None, mode: str = None,
+                      bypass: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deflicker"""
+            raise NotImplementedError
+
+        def dejudder(self, cycle: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dejudder"""
+            raise NotImplementedError
+
+        def delogo(self, x: int, y: int, w: int, h: int, band: int = None,
+                   show: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#delogo"""
+            raise NotImplementedError
+
+        def derain(self, filter_type: str = None, dnn_backend: str = None,
+                   mode: Union[str, Path] = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#derain"""
+            raise NotImplementedError
+
+        def deshake(self, x: int = None, y: int = None, w: int = None,
+                    h: int = None, rx: int = None, ry: int = None, edge: str = None,
+                    blocksize: int = None, contrast: int = None, search: str = None,
+                    filename: Union[str, Path] = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deshake"""
+            raise NotImplementedError
+
+        def despill(self, type: str = None, mix: str = None, expand: int = None,
+                    red: int = None, green: int = None, blue: int = None,
+                    brightness: int = None, alpha: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#despill"""
+            raise NotImplementedError
+
+        def detelecine(self, first_field: str = None, pattern: int = None,
+                       start_frame: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#detelecine"""
+            raise NotImplementedError
+
+        def dilation(self, threshold0: int = None, threshold1: int = None,
+                     threshold2: int = None, threshold3: int = None,
+                     coordinates: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dilation"""
+            raise NotImplementedError
+
+        def displace(self, edge: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#displace"""
+            raise NotImplementedError
+
+        def dnn_processing(self, dnn_backend: str = None,
+                           model: Union[str, Path] = None, input: str = None,
+                           output: str = None, set_async: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dnn_processing"""
+            raise NotImplementedError
+
+        def drawbox(self, x: int = None, y: int = None, w: int = None,
+                    h: int = None, color: str = None, thickness: int = None,
+                    replace: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#drawbox"""
+            raise NotImplementedError
+
+        def drawgraph(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#drawgraph"""
+            raise NotImplementedError
+
+        def drawgrid(self, x: int = None, y: int = None, w: int = None,
+                     h: int = None, color: str = None, thickness: int = None,
+                     replace: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#drawgrid"""
+            raise NotImplementedError
+
+        def drawtext(self, text: str = None, x: int = 0, y: int = 0,
+                     fontsize: int = 0, fontfile: Union[str, Path] = None,
+                     fontcolor: str = None, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#drawtext"""
+            raise NotImplementedError
+
+        def edgedetect(self, low: float = None, high: float = None, mode: str = None,
+                       planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#edgedetect"""
+            raise NotImplementedError
+
+        def elbg(self, codebook_length: int = None, nb_steps: int = None,
+                 seed: int = None, pal8: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#elbg"""
+            raise NotImplementedError
+
+        def entropy(self, mode: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#entropy"""
+            raise NotImplementedError
+
+        def epx(self, n: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#epx"""
+            raise NotImplementedError
+
+        def eq(self, contrast: float = None, brightness: float = None,
+               saturation: float = None, gamma: float = None, gamma_r: float = None,
+               gamma_g: float = None, gamma_b: float = None,
+               gamma_weight: float = None, eval: str = None, ) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#eq"""
+            raise NotImplementedError
+
+        def erosion(self, threshold0: int = None, threshold1: int = None,
+                    threshold2: int = None, threshold3: int = None,
+                    coordinates: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#erosion"""
+            raise NotImplementedError
+
+        def estdif(self, mode: str = None, parity: str = None, deint: str = None,
+                   rslope: int = None, redge: int = None, interp: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#estdif"""
+            raise NotImplementedError
+
+        def exposure(self, exposure: float = None, black: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#exposure"""
+            raise NotImplementedError
+
+        def extractplanes(self, planes: str = None) -> List[FilterableStream]:
+            """https://ffmpeg.org/ffmpeg-filters.html#extractplanes"""
+            raise NotImplementedError
+
+        def fade(self, t: str = None, start_frame: int = None, nb_frames: int = None,
+                 alpha: int = None, start_time: int = None, duration: int = None,
+                 color: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fade"""
+            raise NotImplementedError
+
+        def fftdnoiz(self, sigma: int = None, amount: int = None, block: int = None,
+                     overlap: float = None, prev: int = None, next: int = None,
+                     planes: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fftdnoiz"""
+            raise NotImplementedError
+
+        def fftfilt(self, dc_Y: int = None, dc_U: int = None, dc_V: int = None,
+                    weight_Y: str = None, weight_U: str = None, weight_V: str = None,
+                    eval: str = None, X: int = None, Y: int = None, W: int = None,
+                    H: int = None, N: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fftfilt"""
+            raise NotImplementedError
+
+        def field(self, t: Union[int, str] = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#field"""
+            raise NotImplementedError
+
+        def fieldhint(self, hint: Union[str, Path], mode: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fieldhint"""
+            raise NotImplementedError
+
+        def fieldmatch(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fieldmatch"""
+            raise NotImplementedError
+
+        def fieldorder(self, order: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fieldorder"""
+            raise NotImplementedError
+
+        def fifo(self) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fifo_002c-afifo"""
+            raise NotImplementedError
+
+        def afifo(self) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fifo_002c-afifo"""
+            raise NotImplementedError
+
+        def fillborders(self, left: int = None, right: int = None, top: int = None,
+                        bottom: int = None, mode: str = None,
+                        color: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fillborders"""
+            raise NotImplementedError
+
+        def find_rect(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#find_rect"""
+            raise NotImplementedError
+
+        def floodfill(self, x: int = None, y: int = None, s0: str = None, s1: str = None,
+                      s2: str = None, s3: str = None, d0: str = None, d1: str = None,
+                      d2: str = None, d3: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#floodfill"""
+            raise NotImplementedError
+
+        def format(self, *pix_fmt: str) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#format"""
+            raise NotImplementedError
+
+        def fps(self, fps: int = None, start_time: int = None, round: str = None,
+                eof_action: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fps"""
+            raise NotImplementedError
+
+        def framepack(self, *streams: Stream, format: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#framepack"""
+            raise NotImplementedError
+
+        def framerate(self, fps: int = None, interp_start: int = None, interp_end: int = None,
+                      scene: int = None, flags: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#framerate"""
+            raise NotImplementedError
+
+        def framestep(self, step: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#framestep"""
+            raise NotImplementedError
+
+        def freezedetect(self, noise: Union[str, float], duration: int) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#freezedetect"""
+            raise NotImplementedError
+
+        def freezeframes(self, first: int = None, last: int = None,
+                         replace: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#freezeframes"""
+            raise NotImplementedError
+
+        def frei0r(self, filter_name: str, filter_params: str) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#frei0r"""
+            raise NotImplementedError
+
+        def fspp(self, quality: int = None, qp: int = None, strength: int = None,
+                 use_bframe_qp: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#fspp"""
+            raise NotImplementedError
+
+        def gblur(self, sigma: float = None, steps: int = None, planes: int = None,
+                  sigma_v: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#gblur"""
+            raise NotImplementedError
+
+        def geq(self, lum_expr: str = None, cb_expr: str = None, cr_expr: str = None,
+                alpha_expr: str = None, red_expr: str = None, green_expr: str = None,
+                blue_expr: str = None, lum: str = None, cb: str = None, cr: str = None,
+                r: str = None, g: str = None, b: str = None, a: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#geq"""
+            raise NotImplementedError
+
+        def gradfun(self, strength: float = None, radius: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#gradfun"""
+            raise NotImplementedError
+
+        def graphmonitor(self, size: str = None, opacity: float = None, mode: str = None,
+                         flags: str = None, rate: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#graphmonitor"""
+            raise NotImplementedError
+
+        def greyedge(self, difford: float = None, minknorm: int = None,
+                     sigma: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#greyedge"""
+            raise NotImplementedError
+
+        def haldclut(self, shortest: bool = None, repeatlast: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#haldclut"""
+            raise NotImplementedError
+
+        def hflip(self) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hflip"""
+            raise NotImplementedError
+
+        def histeq(self, strength: float = None, intensity: float = None,
+                   antibanding: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#histeq"""
+            raise NotImplementedError
+
+        def histogram(self, level_height: int = None, scale_height: int = None,
+                      display_mode: str = None, levels_mode: str = None,
+                      components: int = None, fgopacity: float = None,
+                      bgopacity: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#histogram"""
+            raise NotImplementedError
+
+        def hqdn3d(self, luma_spatial: float = None, chroma_spatial: float = None,
+                   luma_tmp: float = None, chroma_tmp: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hqdn3d"""
+            raise NotImplementedError
+
+        def hwdownload(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hwdownload"""
+            raise NotImplementedError
+
+        def hwmap(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hwmap"""
+            raise NotImplementedError
+
+        def hwupload(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hwupload"""
+            raise NotImplementedError
+
+        def hwupload_cuda(self, device: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hwupload_cuda"""
+            raise NotImplementedError
+
+        def hqx(self, n: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hqx"""
+            raise NotImplementedError
+
+        def hstack(self, *streams: Stream, inputs: int = None,
+                   shortest: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hstack"""
+            raise NotImplementedError
+
+        def hue(self, h: Union[str, int] = None, s: Union[str, int] = None,
+                H: Union[str, int] = None, b: Union[str, int] = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hue"""
+            raise NotImplementedError
+
+        def hysteresis(self, planes: int = None, threshold: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#hysteresis"""
+            raise NotImplementedError
+
+        def identity(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#identity"""
+            raise NotImplementedError
+
+        def idet(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#idet"""
+            raise NotImplementedError
+
+        def il(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#il"""
+            raise NotImplementedError
+
+        def inflate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#inflate"""
+            raise NotImplementedError
+
+        def interlace(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#interlace"""
+            raise NotImplementedError
+
+        def kerndeint(self, thresh: int = None, map: int = None, order: int = None,
+                      sharp: int = None, twoway: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#kerndeint"""
+            raise NotImplementedError
+
+        def kirsch(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#kirsch"""
+            raise NotImplementedError
+
+        def lagfun(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lagfun"""
+            raise NotImplementedError
+
+        def lenscorrection(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lenscorrection"""
+            raise NotImplementedError
+
+        def lensfun(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lensfun"""
+            raise NotImplementedError
+
+        def libvmaf(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#libvmaf"""
+            raise NotImplementedError
+
+        def limiter(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#limiter"""
+            raise NotImplementedError
+
+        def loop(self, loop: int = None, size: int = None,
+                 start: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#loop"""
+            raise NotImplementedError
+
+        def lut1d(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lut1d"""
+            raise NotImplementedError
+
+        def lut3d(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lut3d"""
+            raise NotImplementedError
+
+        def lumakey(self, threshold: float = None, tolerance: float = None,
+                    softness: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lumakey"""
+            raise NotImplementedError
+
+        def lutyuv(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#lutyuv"""
+            raise NotImplementedError
+
+        def tlut2(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tlut2"""
+            raise NotImplementedError
+
+        def maskedclamp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#maskedclamp"""
+            raise NotImplementedError
+
+        def maskedmax(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#maskedmax"""
+            raise NotImplementedError
+
+        def maskedmerge(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#maskedmerge"""
+            raise NotImplementedError
+
+        def maskedmin(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#maskedmin"""
+            raise NotImplementedError
+
+        def maskedthreshold(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#maskedthreshold"""
+            raise NotImplementedError
+
+        def maskfun(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#maskfun"""
+            raise NotImplementedError
+
+        def mcdeint(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mcdeint"""
+            raise NotImplementedError
+
+        def median(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#median"""
+            raise NotImplementedError
+
+        def mergeplanes(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mergeplanes"""
+            raise NotImplementedError
+
+        def mestimate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mestimate"""
+            raise NotImplementedError
+
+        def midequalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#midequalizer"""
+            raise NotImplementedError
+
+        def minterpolate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#minterpolate"""
+            raise NotImplementedError
+
+        def mix(self, *streams: Stream, inputs: int = None, weights: str = None,
+                scale: str = None, duration: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mix"""
+            raise NotImplementedError
+
+        def monochrome(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#monochrome"""
+            raise NotImplementedError
+
+        def mpdecimate(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mpdecimate"""
+            raise NotImplementedError
+
+        def negate(self, negate_alpha: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#negate"""
+            raise NotImplementedError
+
+        def nlmeans(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#nlmeans"""
+            raise NotImplementedError
+
+        def nnedi(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#nnedi"""
+            raise NotImplementedError
+
+        def noformat(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#noformat"""
+            raise NotImplementedError
+
+        def noise(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#noise"""
+            raise NotImplementedError
+
+        def normalize(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#normalize"""
+            raise NotImplementedError
+
+        def null(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#null"""
+            raise NotImplementedError
+
+        def ocr(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ocr"""
+            raise NotImplementedError
+
+        def ocv(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ocv"""
+            raise NotImplementedError
+
+        def oscilloscope(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#oscilloscope"""
+            raise NotImplementedError
+
+        def overlay(self, overlay_node: Node, x: Union[int, str] = 0, y: Union[int, str] = 0,
+                    eof_action: str = None, eval: str = None, shortest: bool = None,
+                    format: str = None, repeatlast: bool = None, alpha: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#overlay"""
+            raise NotImplementedError
+
+        def overlay_cuda(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#overlay_cuda"""
+            raise NotImplementedError
+
+        def owdenoise(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#owdenoise"""
+            raise NotImplementedError
+
+        def pad(self, w: Union[str, int] = None, h: Union[str, int] = None,
+                x: Union[str, int] = None, y: Union[str, int] = None, color: str = None,
+                eval: str = None, aspect: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pad"""
+            raise NotImplementedError
+
+        def palettegen(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#palettegen"""
+            raise NotImplementedError
+
+        def paletteuse(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#paletteuse"""
+            raise NotImplementedError
+
+        def perspective(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#perspective"""
+            raise NotImplementedError
+
+        def phase(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#phase"""
+            raise NotImplementedError
+
+        def photosensitivity(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#photosensitivity"""
+            raise NotImplementedError
+
+        def pixdesctest(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pixdesctest"""
+            raise NotImplementedError
+
+        def pixscope(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pixscope"""
+            raise NotImplementedError
+
+        def pp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pp"""
+            raise NotImplementedError
+
+        def pp7(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pp7"""
+            raise NotImplementedError
+
+        def premultiply(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#premultiply"""
+            raise NotImplementedError
+
+        def prewitt(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#prewitt"""
+            raise NotImplementedError
+
+        def pseudocolor(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pseudocolor"""
+            raise NotImplementedError
+
+        def psnr(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#psnr"""
+            raise NotImplementedError
+
+        def pullup(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pullup"""
+            raise NotImplementedError
+
+        def qp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#qp"""
+            raise NotImplementedError
+
+        def random(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#random"""
+            raise NotImplementedError
+
+        def readeia608(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#readeia608"""
+            raise NotImplementedError
+
+        def readvitc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#readvitc"""
+            raise NotImplementedError
+
+        def remap(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#remap"""
+            raise NotImplementedError
+
+        def removegrain(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#removegrain"""
+            raise NotImplementedError
+
+        def removelogo(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#removelogo"""
+            raise NotImplementedError
+
+        def repeatfields(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#repeatfields"""
+            raise NotImplementedError
+
+        def reverse(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#reverse"""
+            raise NotImplementedError
+
+        def rgbashift(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#rgbashift"""
+            raise NotImplementedError
+
+        def roberts(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#roberts"""
+            raise NotImplementedError
 
-    def rotate(self, angle: str = None, ow: str = None, oh: str = None,
-               bilinear: bool = None, fillcolor: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#rotate"""
-        raise NotImplementedError
-
-    def sab(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sab"""
-        raise NotImplementedError
-
-    def scale(self, w: int = -1, h: int = -1, eval: str = None, interl: int = None,
-              flags: str = None, size: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#scale"""
-        raise NotImplementedError
-
-    def scale_npp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#scale_npp"""
-        raise NotImplementedError
-
-    def scale2ref(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#scale2ref"""
-        raise NotImplementedError
-
-    def scroll(self, h: float = None, v: float = None, hpos: float = None,
-               vpos: float = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#scroll"""
-        raise NotImplementedError
-
-    def scdet(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#scdet"""
-        raise NotImplementedError
-
-    def selectivecolor(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#selectivecolor"""
-        raise NotImplementedError
-
-    def separatefields(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#separatefields"""
-        raise NotImplementedError
-
-    def setsar(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#setsar"""
-        raise NotImplementedError
-
-    def setfield(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#setfield"""
-        raise NotImplementedError
-
-    def setparams(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#setparams"""
-        raise NotImplementedError
-
-    def shear(self, shx: float = None, shy: float = None, fillcolor: str = None,
-              interp: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#shear"""
-        raise NotImplementedError
-
-    def showinfo(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showinfo"""
-        raise NotImplementedError
-
-    def showpalette(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showpalette"""
-        raise NotImplementedError
-
-    def shuffleframes(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#shuffleframes"""
-        raise NotImplementedError
-
-    def shufflepixels(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#shufflepixels"""
-        raise NotImplementedError
-
-    def shuffleplanes(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#shuffleplanes"""
-        raise NotImplementedError
-
-    def signalstats(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#signalstats"""
-        raise NotImplementedError
-
-    def signature(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#signature"""
-        raise NotImplementedError
-
-    def smartblur(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#smartblur"""
-        raise NotImplementedError
-
-    def sobel(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sobel"""
-        raise NotImplementedError
-
-    def spp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#spp"""
-        raise NotImplementedError
-
-    def sr(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sr"""
-        raise NotImplementedError
-
-    def ssim(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ssim"""
-        raise NotImplementedError
-
-    def stereo3d(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#stereo3d"""
-        raise NotImplementedError
-
-    def astreamselect(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#astreamselect"""
-        raise NotImplementedError
-
-    def subtitles(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#subtitles"""
-        raise NotImplementedError
-
-    def super2xsai(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#super2xsai"""
-        raise NotImplementedError
-
-    def swaprect(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#swaprect"""
-        raise NotImplementedError
-
-    def swapuv(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#swapuv"""
-        raise NotImplementedError
-
-    def tblend(self, all_mode: str = None, all_opacity: float = None,
-               all_expr: str = None, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tblend"""
-        raise NotImplementedError
-
-    def telecine(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#telecine"""
-        raise NotImplementedError
-
-    def thistogram(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#thistogram"""
-        raise NotImplementedError
-
-    def threshold(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#threshold"""
-        raise NotImplementedError
-
-    def thumbnail(self, n: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#thumbnail"""
-        raise NotImplementedError
-
-    def tile(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tile"""
-        raise NotImplementedError
-
-    def tinterlace(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tinterlace"""
-        raise NotImplementedError
-
-    def tmedian(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tmedian"""
-        raise NotImplementedError
-
-    def tmidequalizer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tmidequalizer"""
-        raise NotImplementedError
-
-    def tmix(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tmix"""
-        raise NotImplementedError
-
-    def tonemap(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tonemap"""
-        raise NotImplementedError
-
-    def tpad(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tpad"""
-        raise NotImplementedError
-
-    def transpose(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#transpose"""
-        raise NotImplementedError
-
-    def transpose_npp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#transpose_npp"""
-        raise NotImplementedError
-
-    def trim(self, start: float = None, end: float = None, start_pts: int = None,
-             end_pts: int = None, duration: float = None, start_frame: int = None,
-             end_frame: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#trim"""
-        raise NotImplementedError
-
-    def unpremultiply(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#unpremultiply"""
-        raise NotImplementedError
-
-    def unsharp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#unsharp"""
-        raise NotImplementedError
-
-    def untile(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#untile"""
-        raise NotImplementedError
-
-    def uspp(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#uspp"""
-        raise NotImplementedError
-
-    def v360(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#v360"""
-        raise NotImplementedError
-
-    def vaguedenoiser(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vaguedenoiser"""
-        raise NotImplementedError
-
-    def vectorscope(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vectorscope"""
-        raise NotImplementedError
-
-    def vidstabdetect(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vidstabdetect"""
-        raise NotImplementedError
-
-    def vidstabtransform(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vidstabtransform"""
-        raise NotImplementedError
-
-    def vflip(self) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vflip"""
-        raise NotImplementedError
-
-    def vfrdet(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vfrdet"""
-        raise NotImplementedError
-
-    def vibrance(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vibrance"""
-        raise NotImplementedError
-
-    def vif(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vif"""
-        raise NotImplementedError
-
-    def vignette(self, angle="PI/5", *args, **kwargs) -> FilterableStream:
-        """Make or reverse a natural vignetting effect.
-
-        https://ffmpeg.org/ffmpeg-filters.html#vignette
-        """
-        raise NotImplementedError
-
-    def vmafmotion(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vmafmotion"""
-        raise NotImplementedError
-
-    def vstack(self, *streams: Stream, inputs: int = None,
-               shortest: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#vstack"""
-        raise NotImplementedError
-
-    def w3fdif(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#w3fdif"""
-        raise NotImplementedError
-
-    def waveform(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#waveform"""
-        raise NotImplementedError
-
-    def doubleweave(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#doubleweave"""
-        raise NotImplementedError
-
-    def xbr(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#xbr"""
-        raise NotImplementedError
-
-    def xfade(self, transition: str = None, duration: float = None,
-              offset: float = None, expr: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#xfade"""
-        raise NotImplementedError
-
-    def xmedian(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#xmedian"""
-        raise NotImplementedError
-
-    def xstack(self, *streams: Stream, inputs: int = None, layout: str = None,
-               shortest: int = None, fill: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#xstack"""
-        raise NotImplementedError
-
-    def yadif(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#yadif"""
-        raise NotImplementedError
-
-    def yadif_cuda(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#yadif_cuda"""
-        raise NotImplementedError
-
-    def yaepblur(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#yaepblur"""
-        raise NotImplementedError
-
-    def zoompan(self, z: int = None, zoom: int = None, x: Union[str, int] = None,
-                y: Union[str, int] = None, d: int = None, s: str = None,
-                fps: int = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#zoompan"""
-        raise NotImplementedError
-
-    def zscale(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#zscale"""
-        raise NotImplementedError
-
-    # OpenCL Video Filters
-    def avgblur_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#avgblur_opencl"""
-        raise NotImplementedError
-
-    def boxblur_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#boxblur_opencl"""
-        raise NotImplementedError
-
-    def colorkey_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#colorkey_opencl"""
-        raise NotImplementedError
-
-    def convolution_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#convolution_opencl"""
-        raise NotImplementedError
-
-    def erosion_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#erosion_opencl"""
-        raise NotImplementedError
-
-    def deshake_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#deshake_opencl"""
-        raise NotImplementedError
-
-    def dilation_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#dilation_opencl"""
-        raise NotImplementedError
-
-    def nlmeans_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#nlmeans_opencl"""
-        raise NotImplementedError
-
-    def overlay_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#overlay_opencl"""
-        raise NotImplementedError
-
-    def pad_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#pad_opencl"""
-        raise NotImplementedError
-
-    def prewitt_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#prewitt_opencl"""
-        raise NotImplementedError
-
-    def program_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#program_opencl"""
-        raise NotImplementedError
-
-    def roberts_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#roberts_opencl"""
-        raise NotImplementedError
-
-    def sobel_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sobel_opencl"""
-        raise NotImplementedError
-
-    def tonemap_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tonemap_opencl"""
-        raise NotImplementedError
-
-    def unsharp_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#unsharp_opencl"""
-        raise NotImplementedError
-
-    def xfade_opencl(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#xfade_opencl"""
-        raise NotImplementedError
-
-    def tonemap_vaapi(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#tonemap_vaapi"""
-        raise NotImplementedError
-
-    # Video Sources
-    def buffer(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#buffer"""
-        raise NotImplementedError
-
-    def cellauto(self, f: Union[str, Path] = None, p: str = None, r: int = None,
-                 ratio: float = None, seed: int = None, rule: int = None, s: str = None,
-                 scroll: bool = None, full: bool = None, stitch: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#cellauto"""
-        raise NotImplementedError
-
-    def coreimagesrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#coreimagesrc"""
-        raise NotImplementedError
-
-    def gradients(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#gradients"""
-        raise NotImplementedError
-
-    def mandelbrot(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mandelbrot"""
-        raise NotImplementedError
-
-    def mptestsrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#mptestsrc"""
-        raise NotImplementedError
-
-    def frei0r_src(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#frei0r_src"""
-        raise NotImplementedError
-
-    def life(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#life"""
-        raise NotImplementedError
-
-    def yuvtestsrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#yuvtestsrc"""
-        raise NotImplementedError
-
-    def openclsrc(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#openclsrc"""
-        raise NotImplementedError
-
-    def sierpinski(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#sierpinski"""
-        raise NotImplementedError
-
-    def buffersink(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#buffersink"""
-        raise NotImplementedError
-
-    def nullsink(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#nullsink"""
-        raise NotImplementedError
-
-    def abitscope(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#abitscope"""
-        raise NotImplementedError
-
-    def adrawgraph(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#adrawgraph"""
-        raise NotImplementedError
-
-    def agraphmonitor(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#agraphmonitor"""
-        raise NotImplementedError
-
-    def ahistogram(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ahistogram"""
-        raise NotImplementedError
-
-    def aphasemeter(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aphasemeter"""
-        raise NotImplementedError
-
-    def avectorscope(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#avectorscope"""
-        raise NotImplementedError
-
-    def abench(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#abench"""
-        raise NotImplementedError
-
-    def concat(self, *streams: Stream, n: int = None, v: int = None, a: int = None,
-               unsafe: bool = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#concat"""
-        raise NotImplementedError
-
-    def ebur128(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ebur128"""
-        raise NotImplementedError
-
-    def ainterleave(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ainterleave"""
-        raise NotImplementedError
-
-    def ametadata(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#ametadata"""
-        raise NotImplementedError
+        def rotate(self, angle: str = None, ow: str = None, oh: str = None,
+                   bilinear: bool = None, fillcolor: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#rotate"""
+            raise NotImplementedError
+
+        def sab(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sab"""
+            raise NotImplementedError
+
+        def scale(self, w: int = -1, h: int = -1, eval: str = None, interl: int = None,
+                  flags: str = None, size: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#scale"""
+            raise NotImplementedError
+
+        def scale_npp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#scale_npp"""
+            raise NotImplementedError
+
+        def scale2ref(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#scale2ref"""
+            raise NotImplementedError
+
+        def scroll(self, h: float = None, v: float = None, hpos: float = None,
+                   vpos: float = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#scroll"""
+            raise NotImplementedError
+
+        def scdet(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#scdet"""
+            raise NotImplementedError
+
+        def selectivecolor(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#selectivecolor"""
+            raise NotImplementedError
+
+        def separatefields(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#separatefields"""
+            raise NotImplementedError
+
+        def setsar(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#setsar"""
+            raise NotImplementedError
+
+        def setfield(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#setfield"""
+            raise NotImplementedError
+
+        def setparams(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#setparams"""
+            raise NotImplementedError
+
+        def shear(self, shx: float = None, shy: float = None, fillcolor: str = None,
+                  interp: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#shear"""
+            raise NotImplementedError
+
+        def showinfo(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showinfo"""
+            raise NotImplementedError
+
+        def showpalette(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showpalette"""
+            raise NotImplementedError
+
+        def shuffleframes(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#shuffleframes"""
+            raise NotImplementedError
+
+        def shufflepixels(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#shufflepixels"""
+            raise NotImplementedError
+
+        def shuffleplanes(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#shuffleplanes"""
+            raise NotImplementedError
+
+        def signalstats(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#signalstats"""
+            raise NotImplementedError
+
+        def signature(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#signature"""
+            raise NotImplementedError
+
+        def smartblur(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#smartblur"""
+            raise NotImplementedError
+
+        def sobel(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sobel"""
+            raise NotImplementedError
+
+        def spp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#spp"""
+            raise NotImplementedError
+
+        def sr(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sr"""
+            raise NotImplementedError
+
+        def ssim(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ssim"""
+            raise NotImplementedError
+
+        def stereo3d(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#stereo3d"""
+            raise NotImplementedError
+
+        def astreamselect(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#astreamselect"""
+            raise NotImplementedError
+
+        def subtitles(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#subtitles"""
+            raise NotImplementedError
+
+        def super2xsai(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#super2xsai"""
+            raise NotImplementedError
+
+        def swaprect(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#swaprect"""
+            raise NotImplementedError
+
+        def swapuv(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#swapuv"""
+            raise NotImplementedError
+
+        def tblend(self, all_mode: str = None, all_opacity: float = None,
+                   all_expr: str = None, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tblend"""
+            raise NotImplementedError
+
+        def telecine(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#telecine"""
+            raise NotImplementedError
+
+        def thistogram(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#thistogram"""
+            raise NotImplementedError
+
+        def threshold(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#threshold"""
+            raise NotImplementedError
+
+        def thumbnail(self, n: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#thumbnail"""
+            raise NotImplementedError
+
+        def tile(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tile"""
+            raise NotImplementedError
+
+        def tinterlace(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tinterlace"""
+            raise NotImplementedError
+
+        def tmedian(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tmedian"""
+            raise NotImplementedError
+
+        def tmidequalizer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tmidequalizer"""
+            raise NotImplementedError
+
+        def tmix(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tmix"""
+            raise NotImplementedError
+
+        def tonemap(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tonemap"""
+            raise NotImplementedError
+
+        def tpad(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tpad"""
+            raise NotImplementedError
+
+        def transpose(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#transpose"""
+            raise NotImplementedError
+
+        def transpose_npp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#transpose_npp"""
+            raise NotImplementedError
+
+        def trim(self, start: float = None, end: float = None, start_pts: int = None,
+                 end_pts: int = None, duration: float = None, start_frame: int = None,
+                 end_frame: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#trim"""
+            raise NotImplementedError
+
+        def unpremultiply(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#unpremultiply"""
+            raise NotImplementedError
+
+        def unsharp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#unsharp"""
+            raise NotImplementedError
+
+        def untile(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#untile"""
+            raise NotImplementedError
+
+        def uspp(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#uspp"""
+            raise NotImplementedError
+
+        def v360(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#v360"""
+            raise NotImplementedError
+
+        def vaguedenoiser(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vaguedenoiser"""
+            raise NotImplementedError
+
+        def vectorscope(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vectorscope"""
+            raise NotImplementedError
+
+        def vidstabdetect(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vidstabdetect"""
+            raise NotImplementedError
+
+        def vidstabtransform(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vidstabtransform"""
+            raise NotImplementedError
+
+        def vflip(self) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vflip"""
+            raise NotImplementedError
+
+        def vfrdet(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vfrdet"""
+            raise NotImplementedError
+
+        def vibrance(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vibrance"""
+            raise NotImplementedError
+
+        def vif(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vif"""
+            raise NotImplementedError
+
+        def vignette(self, angle="PI/5", *args, **kwargs) -> FilterableStream:
+            """Make or reverse a natural vignetting effect.
+
+            https://ffmpeg.org/ffmpeg-filters.html#vignette
+            """
+            raise NotImplementedError
+
+        def vmafmotion(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vmafmotion"""
+            raise NotImplementedError
+
+        def vstack(self, *streams: Stream, inputs: int = None,
+                   shortest: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#vstack"""
+            raise NotImplementedError
+
+        def w3fdif(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#w3fdif"""
+            raise NotImplementedError
+
+        def waveform(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#waveform"""
+            raise NotImplementedError
+
+        def doubleweave(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#doubleweave"""
+            raise NotImplementedError
+
+        def xbr(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#xbr"""
+            raise NotImplementedError
+
+        def xfade(self, transition: str = None, duration: float = None,
+                  offset: float = None, expr: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#xfade"""
+            raise NotImplementedError
+
+        def xmedian(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#xmedian"""
+            raise NotImplementedError
+
+        def xstack(self, *streams: Stream, inputs: int = None, layout: str = None,
+                   shortest: int = None, fill: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#xstack"""
+            raise NotImplementedError
+
+        def yadif(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#yadif"""
+            raise NotImplementedError
+
+        def yadif_cuda(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#yadif_cuda"""
+            raise NotImplementedError
+
+        def yaepblur(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#yaepblur"""
+            raise NotImplementedError
+
+        def zoompan(self, z: int = None, zoom: int = None, x: Union[str, int] = None,
+                    y: Union[str, int] = None, d: int = None, s: str = None,
+                    fps: int = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#zoompan"""
+            raise NotImplementedError
+
+        def zscale(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#zscale"""
+            raise NotImplementedError
+
+        # OpenCL Video Filters
+        def avgblur_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#avgblur_opencl"""
+            raise NotImplementedError
+
+        def boxblur_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#boxblur_opencl"""
+            raise NotImplementedError
+
+        def colorkey_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#colorkey_opencl"""
+            raise NotImplementedError
+
+        def convolution_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#convolution_opencl"""
+            raise NotImplementedError
+
+        def erosion_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#erosion_opencl"""
+            raise NotImplementedError
+
+        def deshake_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#deshake_opencl"""
+            raise NotImplementedError
+
+        def dilation_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#dilation_opencl"""
+            raise NotImplementedError
+
+        def nlmeans_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#nlmeans_opencl"""
+            raise NotImplementedError
+
+        def overlay_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#overlay_opencl"""
+            raise NotImplementedError
+
+        def pad_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#pad_opencl"""
+            raise NotImplementedError
+
+        def prewitt_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#prewitt_opencl"""
+            raise NotImplementedError
+
+        def program_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#program_opencl"""
+            raise NotImplementedError
+
+        def roberts_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#roberts_opencl"""
+            raise NotImplementedError
+
+        def sobel_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sobel_opencl"""
+            raise NotImplementedError
+
+        def tonemap_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tonemap_opencl"""
+            raise NotImplementedError
+
+        def unsharp_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#unsharp_opencl"""
+            raise NotImplementedError
+
+        def xfade_opencl(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#xfade_opencl"""
+            raise NotImplementedError
+
+        def tonemap_vaapi(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#tonemap_vaapi"""
+            raise NotImplementedError
+
+        # Video Sources
+        def buffer(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#buffer"""
+            raise NotImplementedError
+
+        def cellauto(self, f: Union[str, Path] = None, p: str = None, r: int = None,
+                     ratio: float = None, seed: int = None, rule: int = None, s: str = None,
+                     scroll: bool = None, full: bool = None, stitch: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#cellauto"""
+            raise NotImplementedError
+
+        def coreimagesrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#coreimagesrc"""
+            raise NotImplementedError
+
+        def gradients(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#gradients"""
+            raise NotImplementedError
+
+        def mandelbrot(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mandelbrot"""
+            raise NotImplementedError
+
+        def mptestsrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#mptestsrc"""
+            raise NotImplementedError
+
+        def frei0r_src(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#frei0r_src"""
+            raise NotImplementedError
+
+        def life(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#life"""
+            raise NotImplementedError
+
+        def yuvtestsrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#yuvtestsrc"""
+            raise NotImplementedError
+
+        def openclsrc(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#openclsrc"""
+            raise NotImplementedError
+
+        def sierpinski(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#sierpinski"""
+            raise NotImplementedError
+
+        def buffersink(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#buffersink"""
+            raise NotImplementedError
+
+        def nullsink(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#nullsink"""
+            raise NotImplementedError
+
+        def abitscope(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#abitscope"""
+            raise NotImplementedError
+
+        def adrawgraph(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#adrawgraph"""
+            raise NotImplementedError
+
+        def agraphmonitor(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#agraphmonitor"""
+            raise NotImplementedError
+
+        def ahistogram(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ahistogram"""
+            raise NotImplementedError
+
+        def aphasemeter(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aphasemeter"""
+            raise NotImplementedError
+
+        def avectorscope(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#avectorscope"""
+            raise NotImplementedError
+
+        def abench(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#abench"""
+            raise NotImplementedError
+
+        def concat(self, *streams: Stream, n: int = None, v: int = None, a: int = None,
+                   unsafe: bool = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#concat"""
+            raise NotImplementedError
+
+        def ebur128(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ebur128"""
+            raise NotImplementedError
+
+        def ainterleave(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ainterleave"""
+            raise NotImplementedError
+
+        def ametadata(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#ametadata"""
+            raise NotImplementedError
 
-    def aperms(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aperms"""
-        raise NotImplementedError
+        def aperms(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aperms"""
+            raise NotImplementedError
 
-    def arealtime(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#arealtime"""
-        raise NotImplementedError
+        def arealtime(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#arealtime"""
+            raise NotImplementedError
 
-    def aselect(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#aselect"""
-        raise NotImplementedError
+        def aselect(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#aselect"""
+            raise NotImplementedError
 
-    def asendcmd(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asendcmd"""
-        raise NotImplementedError
+        def asendcmd(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asendcmd"""
+            raise NotImplementedError
 
-    def setpts(self, expr: str = "PTS-STARTPTS") -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#setpts"""
-        raise NotImplementedError
+        def setpts(self, expr: str = "PTS-STARTPTS") -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#setpts"""
+            raise NotImplementedError
 
-    def asetpts(self, expr: str = "PTS-STARTPTS") -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asetpts"""
-        raise NotImplementedError
+        def asetpts(self, expr: str = "PTS-STARTPTS") -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asetpts"""
+            raise NotImplementedError
 
-    def setrange(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#setrange"""
-        raise NotImplementedError
+        def setrange(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#setrange"""
+            raise NotImplementedError
 
-    def asettb(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asettb"""
-        raise NotImplementedError
+        def asettb(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asettb"""
+            raise NotImplementedError
 
-    def showcqt(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showcqt"""
-        raise NotImplementedError
+        def showcqt(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showcqt"""
+            raise NotImplementedError
 
-    def showfreqs(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showfreqs"""
-        raise NotImplementedError
+        def showfreqs(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showfreqs"""
+            raise NotImplementedError
 
-    def showspatial(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showspatial"""
-        raise NotImplementedError
+        def showspatial(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showspatial"""
+            raise NotImplementedError
 
-    def showspectrum(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showspectrum"""
-        raise NotImplementedError
+        def showspectrum(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showspectrum"""
+            raise NotImplementedError
 
-    def showspectrumpic(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showspectrumpic"""
-        raise NotImplementedError
+        def showspectrumpic(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showspectrumpic"""
+            raise NotImplementedError
 
-    def showvolume(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showvolume"""
-        raise NotImplementedError
+        def showvolume(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showvolume"""
+            raise NotImplementedError
 
-    def showwaves(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showwaves"""
-        raise NotImplementedError
+        def showwaves(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showwaves"""
+            raise NotImplementedError
 
-    def showwavespic(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#showwavespic"""
-        raise NotImplementedError
+        def showwavespic(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#showwavespic"""
+            raise NotImplementedError
 
-    def asidedata(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asidedata"""
-        raise NotImplementedError
+        def asidedata(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asidedata"""
+            raise NotImplementedError
 
-    def spectrumsynth(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#spectrumsynth"""
-        raise NotImplementedError
+        def spectrumsynth(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#spectrumsynth"""
+            raise NotImplementedError
 
-    def asplit(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#asplit"""
-        raise NotImplementedError
+        def asplit(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#asplit"""
+            raise NotImplementedError
 
-    def azmq(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#azmq"""
-        raise NotImplementedError
+        def azmq(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#azmq"""
+            raise NotImplementedError
 
-    def amovie(self, *args, **kwargs) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#amovie"""
-        raise NotImplementedError
+        def amovie(self, *args, **kwargs) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#amovie"""
+            raise NotImplementedError
 
-    def movie(self, filename: Union[str, Path] = None, format_name: str = None,
-              seek_point: float = None, streams: str = None, stream_index: int = None,
-              loop: int = None, discontinuity: str = None) -> FilterableStream:
-        """https://ffmpeg.org/ffmpeg-filters.html#movie"""
-        raise NotImplementedError
+        def movie(self, filename: Union[str, Path] = None, format_name: str = None,
+                  seek_point: float = None, streams: str = None, stream_index: int = None,
+                  loop: int = None, discontinuity: str = None) -> FilterableStream:
+            """https://ffmpeg.org/ffmpeg-filters.html#movie"""
+            raise NotImplementedError
 
-    # TODO
-    def split(self) -> List[FilterableStream]:
-        raise NotImplementedError
+        # TODO
+        def split(self) -> List[FilterableStream]:
+            raise NotImplementedError
 
-    def select(self, expr: str) -> FilterableStream:
-        raise NotImplementedError
+        def select(self, expr: str) -> FilterableStream:
+            raise NotImplementedError
 
 
 class InputNode(Node):
+    __slots__ = ('_source',)
 
     def __init__(self, args=None, kwargs=None):
         super().__init__(NodeTypes.Input, None, {}, FilterableStream,
@@ -2162,6 +2615,7 @@ class InputNode(Node):
 
 
 class OutputNode(Node):
+    __slots__ = ('_source',)
 
     def __init__(self, streams: List[Stream], args=None, kwargs=None):
         super().__init__(NodeTypes.Output, streams, FilterableStream, OutputStream,
@@ -2176,7 +2630,7 @@ class OutputNode(Node):
         if len(self.incoming_edges) == 0:
             raise ValueError(f'{self} has no mapped streams')
 
-        args = copy.copy(self._args)
+        args = list(self._args)
         kwargs = copy.copy(self._kwargs)
 
         source = kwargs.pop('source')
@@ -2198,6 +2652,7 @@ class OutputNode(Node):
 
 
 class FilterNode(Node):
+    __slots__ = ()
 
     def __init__(self, streams: List[Stream], label: str, min_inputs=1,
                  max_inputs=1, args=None, kwargs=None):
@@ -2226,6 +2681,7 @@ class FilterNode(Node):
 
 
 class GlobalNode(Node):
+    __slots__ = ()
 
     def __init__(self, stream: Stream, args=None, kwargs=None):
         super().__init__(stream.Label, stream, OutputStream, OutputStream,
@@ -2237,6 +2693,7 @@ class GlobalNode(Node):
 
 
 class MergeOutputsNode(Node):
+    __slots__ = ()
 
     def __init__(self, streams: List[Stream]):
         super().__init__(None, streams, OutputStream, OutputStream,
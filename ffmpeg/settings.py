@@ -4,8 +4,46 @@ Description: Omit
 LastEditors: Rustle Karl
 LastEditTime: 2021.04.24 23:34
 '''
-from .constants import H264_CUVID, H264_NVENC
+import os
+
+from .constants import H264_CUVID, H264_NVENC, HEVC_NVENC
 
 CUDA_ENABLE = True
 DEFAULT_ENCODER = H264_NVENC
 DEFAULT_DECODER = H264_CUVID
+
+# Encoders tried in order when a CUDA encoder can't be used on this host,
+# a CUDA decoder falls back to ffmpeg's own choice
+ENCODER_FALLBACKS = {
+    H264_NVENC: ('h264_qsv', 'libx264'),
+    HEVC_NVENC: ('hevc_qsv', 'libx265'),
+}
+
+# Where `get_capabilities` keeps what each ffmpeg binary supports, None to ask ffmpeg every run
+CAPABILITY_CACHE_FILE = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+                                     'ffmpeg-python', 'capabilities.json')
+
+# Number of compiled command lines kept by `OutputStream.get_output_args`, 0 to disable
+COMPILE_CACHE_SIZE = 1024
+
+# Pause the cyclic garbage collector while sorting and compiling very large graphs,
+# for the whole process, which other threads may not expect
+PAUSE_GC_WHILE_COMPILING = False
+
+# Graph rewriting before compiling, see `ffmpeg._optimizer`
+MERGE_COMMON_SUBGRAPHS = True  # open identical inputs once and run identical filter chains once
+PUSH_DOWN_SEEKS = True  # seek inputs with `ss`/`t`/`to` instead of trimming after decoding
+ELIMINATE_NO_OPS = True  # drop `null`/`copy`-like filters, and more given probe data
+AUTO_SPLIT = True  # insert `split`/`asplit` when a filter output feeds several consumers
+FUSE_FILTER_CHAINS = True  # join single-input/single-output filters with commas instead of pad labels
+
+# Check filter names and options against the ffmpeg about to run before starting it,
+# see `OutputStream.validate`
+VALIDATE_FILTERS = True
+
+# Filter graphs longer than this many characters are passed with `-filter_complex_script`
+# instead of inline, since Linux limits a single argument to 128 KiB; 0 to always inline
+FILTER_COMPLEX_SCRIPT_THRESHOLD = 64 * 1024
+
+# Lines of stderr kept by `OutputStream.run` and put into `FFmpegError`, 0 to keep all
+STDERR_TAIL_LINES = 256
@@ -1,20 +1,29 @@
-'''
-Date: 2021.04.25 10:21
-Description : Omit
-LastEditors: Rustle Karl
-LastEditTime: 2021.04.25 10:21
-'''
-from . import atools, avtools, etools, vtools
-
-try:
-    from .etools import view
-except ImportError as e:
-    def view():
-        raise e
-
-__all__ = [
-    'atools',
-    'avtools',
-    'etools',
-    'vtools',
-]
+'''
+Date: 2021.04.25 10:21
+Description : Omit
+LastEditors: Rustle Karl
+LastEditTime: 2021.04.25 10:21
+'''
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import atools, avtools, etools, vtools
+    from .etools import view
+
+__all__ = [
+    'atools',
+    'avtools',
+    'etools',
+    'view',
+    'vtools',
+]
+
+
+def __getattr__(name: str):
+    # Imported on first use, `vtools` needs numpy and `etools` psutil
+    if name == 'view':
+        return importlib.import_module('.etools', __name__).view
+    if name in __all__:
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
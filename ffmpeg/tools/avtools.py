@@ -3,21 +3,41 @@ Date: 2021.02-25 20:50:07
 LastEditors: Rustle Karl
 LastEditTime: 2021.05.04 23:34:46
 '''
+import bisect
+import os
+import shutil
+import subprocess
 import tempfile
+from concurrent.futures import FIRST_EXCEPTION, wait
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional, Union
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from .. import FFprobe, constants
+from .._capabilities import get_capabilities
+from .._dag import Edge, topological_sort
 from .._ffmpeg import input, merge_outputs, output
+from .._node import NodeTypes, get_stream_spec_nodes
+from .._optimizer import rewrite_graph
+from .._runner import JobRunner
+from .._stderr import StderrCapture
+from .._usage import ResourceUsage
 from .._utils import seconds_to_string, string_to_seconds
+from ..nodes import FFmpegError, InputNode, OutputNode, OutputStream
 
 __all__ = [
+    "KeyframeScan",
+    "SegmentedTranscode",
     "adjust_tempo",
     "concat_multiple_parts",
     "cut_into_multiple_parts",
+    "get_ffprobe",
     "merge_video_audio",
+    "scan_keyframes",
     "separate_audio_stream",
     "separate_video_stream",
+    "split_at_keyframes",
+    "transcode_in_segments",
 ]
 
 
@@ -222,3 +242,264 @@ def merge_m3u8_files(src: Union[Path, str], dst: Union[Path, str]):
     input(src, protocol_whitelist='file,http,https,tcp,tls,crypto'). \
         output(dst, codec=constants.COPY). \
         run(capture_stdout=False, capture_stderr=False)
+
+
+# Applied when joining the segments, not to every segment
+_muxer_options = {'f', 'movflags', 'brand', 'metadata'}
+# Would fight with the cuts at keyframes
+_trim_options = {'ss', 't', 'to', 'sseof'}
+
+
+class KeyframeScan(NamedTuple):
+    Keyframes: List[float]
+    Timestamps: List[float]  # of every video packet, in presentation order
+    HasAudio: bool
+
+
+def get_ffprobe(executable="ffmpeg") -> str:
+    '''The ffprobe installed along the ffmpeg `executable`, or the one on PATH.'''
+    path = executable if os.path.dirname(executable) else shutil.which(executable)
+    if path is not None:
+        folder, name = os.path.split(path)
+        ffprobe = os.path.join(folder, name.replace('ffmpeg', 'ffprobe'))
+        if 'ffmpeg' in name and os.path.isfile(ffprobe):
+            return ffprobe
+    return 'ffprobe'
+
+
+def scan_keyframes(src: Union[str, Path], executable="ffprobe") -> KeyframeScan:
+    '''Find the keyframes of the first video stream from the flags of its
+    packets, which ffprobe reads without decoding them.'''
+    args = [executable, '-hide_banner', '-v', 'error', '-show_entries',
+            'packet=codec_type,stream_index,pts_time,flags', '-of', 'csv=p=0', str(src)]
+    process = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stderr = StderrCapture(64)
+    drain = stderr.drain(process.stderr)
+
+    keyframes, timestamps, has_audio, video = [], [], False, None
+    try:
+        # e.g. 'video,0,4.004000,K__', packets without timestamp say 'N/A'
+        for line in process.stdout:
+            codec_type, index, pts_time, flags = line.decode().rstrip().split(',')[:4]
+            if codec_type == 'audio':
+                has_audio = True
+            elif codec_type == 'video' and video in (None, index) and pts_time != 'N/A':
+                video = index
+                timestamps.append(float(pts_time))
+                if flags.startswith('K'):
+                    keyframes.append(timestamps[-1])
+    finally:
+        process.stdout.close()
+        process.wait()
+        drain.join()
+
+    if process.returncode:
+        raise FFmpegError(executable, None, stderr.tail)
+    if not keyframes:
+        raise ValueError(f'{src} has no video keyframes with timestamps')
+
+    return KeyframeScan(sorted(keyframes), sorted(timestamps), has_audio)
+
+
+def split_at_keyframes(scan: KeyframeScan, segments: int) -> List[Tuple[float, Optional[float]]]:
+    '''Start and end of up to `segments` segments about as long as each other,
+    each starting at a keyframe. The last one ends with the file, at None.'''
+    keyframes = scan.Keyframes
+    first, last = keyframes[0], scan.Timestamps[-1]
+
+    starts = [first]
+    for i in range(1, segments):
+        index = bisect.bisect_left(keyframes, first + (last - first) * i / segments)
+        if index < len(keyframes) and keyframes[index] > starts[-1]:
+            starts.append(keyframes[index])
+
+    return list(zip(starts, starts[1:] + [None]))
+
+
+class SegmentedTranscode(NamedTuple):
+    Segments: List[Tuple[float, Optional[float]]]
+    Elapsed: float  # wall-clock time, from the scan to the joined output
+    Usage: ResourceUsage  # of every job summed up
+    BaselineElapsed: Optional[float] = None  # of the single process, if run to compare
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """How many times faster than the single process, if it was run."""
+        return self.BaselineElapsed / self.Elapsed if self.BaselineElapsed else None
+
+
+def _format_time(seconds: float) -> str:
+    # Timestamps are read with microseconds, written back the same they seek exactly
+    return f'{seconds:.6f}'
+
+
+def _get_stream_kind(edge: Edge, executable: str) -> str:
+    # 'audio', 'video' or 'both' for an input mapped whole
+    node = edge.Node
+    if node.Type == NodeTypes.Input:
+        if not edge.Selector:
+            return 'both'
+        return 'audio' if 'a' in str(edge.Selector).split(':') else 'video'
+
+    if node.Type == NodeTypes.Filter:
+        _, inputs, outputs, _ = get_capabilities(executable).filters.get(node.Label.partition('@')[0],
+                                                                           ('', '', '', ''))
+        pads = inputs if outputs == 'N' else outputs  # 'N' is a dynamic number of pads
+        if 'A' in pads and 'V' not in pads:
+            return 'audio'
+
+    return 'video'
+
+
+def _get_segmented_nodes(stream: OutputStream) -> Tuple[InputNode, OutputNode]:
+    sorted_nodes, _ = topological_sort(get_stream_spec_nodes(stream))
+    inputs = [node for node in sorted_nodes if node.Type == NodeTypes.Input]
+    outputs = [node for node in sorted_nodes if node.Type == NodeTypes.Output]
+
+    if len(inputs) != 1 or len(outputs) != 1:
+        raise ValueError(f'{stream} must read one input and write one output to be segmented')
+
+    (input_node,), (output_node,) = inputs, outputs
+    if input_node.source in {constants.PIPE, 'pipe:0', '-'}:
+        raise ValueError(f"{stream} reads a pipe, which can't be split")
+
+    trims = sorted(_trim_options.intersection({**input_node._kwargs, **output_node._kwargs}))
+    if trims:
+        raise ValueError(f'{stream} trims with {", ".join(trims)}, cut the input first')
+
+    return input_node, output_node
+
+
+def _redirect(stream: OutputStream, dst: str, *, kinds: Set[str] = None, executable="ffmpeg",
+              input_kwargs: Dict = None, output_kwargs: Dict = None) -> OutputStream:
+    '''Copy of the graph writing `dst` instead. With `kinds`, only its streams
+    of those kinds are kept and muxer options are dropped.'''
+
+    def rewrite(node, incoming_edge_graph):
+        if node.Type == NodeTypes.Input and input_kwargs:
+            return node.clone(incoming_edge_graph, {**node._kwargs, **input_kwargs})
+
+        if node.Type == NodeTypes.Output:
+            kwargs = node._kwargs
+            if kinds is not None:
+                incoming_edge_graph = {label: edge for label, edge in incoming_edge_graph.items()
+                                       if _get_stream_kind(edge, executable) in kinds}
+                kwargs = {key: value for key, value in kwargs.items() if key not in _muxer_options}
+
+            node = node.clone(incoming_edge_graph, {**kwargs, **(output_kwargs or {}), 'source': dst})
+            node._source = dst
+            return node
+
+        if incoming_edge_graph == node.incoming_edge_graph:
+            return node
+        return node.clone(incoming_edge_graph)
+
+    (node,) = rewrite_graph([stream.Node], rewrite)
+    return OutputStream(node, stream.Label, stream.Selector)
+
+
+def transcode_in_segments(stream: OutputStream, *, segments: int = None, runner: JobRunner = None,
+                          scan: KeyframeScan = None, ffprobe: str = None, workdir: Union[str, Path] = None,
+                          overwrite=True, baseline=False) -> SegmentedTranscode:
+    '''Run `stream` as many ffmpeg processes at once, for inputs too long for
+    one encoder to use all CPUs.
+
+    The input is split at keyframes into `segments` segments, as many as the
+    runner runs jobs at once by default. Each video segment is transcoded with
+    the filters and codec settings of `stream`, while the audio is transcoded
+    in one piece, so encoder priming and frame sizes don't add gaps at the
+    cuts. The segments are then joined without transcoding them again, with
+    the concat demuxer, and muxed with the audio into the output of `stream`.
+
+    `stream` must read one file and write one output. Filters see every segment
+    start at 0, those depending on the position in the file or on frames past
+    a cut, like `fade` at a given time, need the single process. Subtitles and
+    data streams are not carried over.
+
+    Unless given a `scan`, the input is scanned with `ffprobe`, by default
+    the one installed along the runner's ffmpeg. Intermediate files go to a
+    temporary folder in `workdir`. With `baseline`,
+    `stream` also runs as one process afterwards to compare, see `speedup`.'''
+    input_node, output_node = _get_segmented_nodes(stream)
+
+    own_runner = runner is None
+    if own_runner:
+        runner = JobRunner()
+
+    try:
+        with tempfile.TemporaryDirectory(prefix='ffmpeg-segments-', dir=workdir) as folder:
+            return _transcode_in_segments(stream, input_node, output_node, segments or runner.max_workers,
+                                          runner, scan, ffprobe, Path(folder), overwrite, baseline)
+    finally:
+        if own_runner:
+            runner.shutdown()
+
+
+def _transcode_in_segments(stream: OutputStream, input_node: InputNode, output_node: OutputNode,
+                           segments: int, runner: JobRunner, scan: Optional[KeyframeScan], ffprobe: Optional[str],
+                           folder: Path, overwrite: bool, baseline: bool) -> SegmentedTranscode:
+    start = perf_counter()
+    executable = runner.executable
+
+    scan = scan or scan_keyframes(input_node.source, ffprobe or get_ffprobe(executable))
+
+    cuts = split_at_keyframes(scan, segments)
+
+    kinds = [_get_stream_kind(edge, executable) for edge in output_node.incoming_edge_graph.values()]
+    if 'video' not in kinds and 'both' not in kinds:
+        raise ValueError(f'{stream} writes no video to segment')
+    has_audio = '-an' not in output_node._args and ('audio' in kinds or ('both' in kinds and scan.HasAudio))
+
+    # Every job seeks to the first keyframe, like the segments the audio starts there
+    first = {'ss': _format_time(cuts[0][0]), 'seek_timestamp': 1}
+
+    jobs = []
+    if has_audio:  # the longest job goes first
+        audio = folder / 'audio.nut'
+        jobs.append(_redirect(stream, str(audio), kinds={'audio', 'both'}, executable=executable,
+                              input_kwargs=first, output_kwargs={'f': 'nut', 'vn': None, 'sn': None, 'dn': None}))
+
+    playlist = ['ffconcat version 1.0']
+    for order, (begin, end) in enumerate(cuts):
+        kwargs = {'f': 'nut', 'an': None, 'sn': None, 'dn': None}
+        if end is not None:
+            # Halfway to the frame shown before the next keyframe, rounding can't move the cut
+            previous = scan.Timestamps[bisect.bisect_left(scan.Timestamps, end) - 1]
+            kwargs['t'] = _format_time((previous + end) / 2 - begin)
+
+        segment = folder / f'segment{order}.nut'
+        jobs.append(_redirect(stream, str(segment), kinds={'video', 'both'}, executable=executable,
+                              input_kwargs={'ss': _format_time(begin), 'seek_timestamp': 1},
+                              output_kwargs=kwargs))
+
+        playlist.append(f"file '{segment.name}'")
+        if end is not None:
+            playlist.append(f'duration {_format_time(end - begin)}')
+
+    futures = [runner.submit(job, overwrite=True) for job in jobs]
+    _, pending = wait(futures, return_when=FIRST_EXCEPTION)
+    for future in pending:
+        future.cancel()
+    wait(futures)
+    results = [future.result() for future in futures]
+
+    concat = folder / 'segments.ffconcat'
+    concat.write_text('\n'.join(playlist) + '\n', encoding='utf-8')
+
+    streams = [input(concat, format='concat', enable_cuda=False).video]
+    if has_audio:
+        streams.append(input(audio, enable_cuda=False).audio)
+
+    muxer_kwargs = {key: value for key, value in output_node._kwargs.items() if key in _muxer_options}
+    results.append(runner.submit(output(*streams, output_node.source, codec=constants.COPY, enable_cuda=False,
+                                        **muxer_kwargs), overwrite=overwrite).result())
+
+    elapsed = perf_counter() - start
+    usage = ResourceUsage.total(result.usage for result in results if result.usage is not None)
+
+    baseline_elapsed = None
+    if baseline:
+        single = _redirect(stream, str(folder / f'baseline{Path(output_node.source).suffix}'))
+        baseline_elapsed = single.run(executable, print_cmd=False).elapsed
+
+    return SegmentedTranscode(cuts, elapsed, usage, baseline_elapsed)
@@ -17,14 +17,10 @@ from typing import Union
 from .._dag import get_outgoing_edges, topological_sort
 from .._ffmpeg import input
 from .._node import get_stream_spec_nodes, streamable
+from .._progress import ProgressParser
 from ..constants import LINUX, WINDOWS
 from ..nodes import FilterNode, InputNode, OutputNode
 
-try:
-    import psutil
-except ImportError as e:
-    psutil = e
-
 __all__ = [
     'ScreenRecorder',  # Record screen content
     'show_progress',  # Show progress bar
@@ -119,9 +115,7 @@ class ScreenRecorder(object):
                  frame_rate=30, offset_x=0, offset_y=0, video_size="vga",
                  duration=None, output_vcodec="libx264", output_acodec="libfaac",
                  output_format="flv", **output_kwargs):
-
-        if isinstance(psutil, Exception):
-            raise psutil
+        import psutil
 
         if WINDOWS:
             self.command = record_screen_windows(
@@ -140,6 +134,8 @@ class ScreenRecorder(object):
 
     def start(self):
         if self.proc is None:
+            import psutil
+
             _proc = self.command.run_async(quiet=True)
             self.proc = psutil.Process(_proc.pid)
         elif self.paused:
@@ -188,31 +184,13 @@ def open_temporary_directory() -> str:
 def accept(s: socket.socket, handler):
     """Read progress events from a unix-domain socket."""
     conn, _ = s.accept()
+    parser = ProgressParser()
 
-    buffer = b""
-    previous = 0
-
-    while more := conn.recv(16):
-        buffer += more
-        lines = buffer.splitlines()
-
-        for line in lines[:-1]:
-            parts = line.decode().split("=")
-            if len(parts) < 2:
-                continue
-
-            k, v = parts[:2]
-            if v == "continueframe":
-                k = v
-                frame = int(parts[2])
-                v = frame - previous
-                previous = frame
-
-            handler(k, v)
-
-        buffer = lines[-1]
-
-    conn.close()
+    with conn:
+        while more := conn.recv(1 << 16):
+            for event in parser.feed(more):
+                for key, value in event.fields.items():
+                    handler(key, value)
 
 
 @contextlib.contextmanager
@@ -251,8 +229,8 @@ def show_progress(total_frames):
     with tqdm(total=total_frames, desc="Processing", unit="f") as bar:
 
         def handler(key, value):
-            if key == "continueframe":
-                bar.update(value)
+            if key == "frame":
+                bar.update(int(value) - bar.n)
             elif key == "progress" and value == "end":
                 bar.update(bar.total - bar.n)
 
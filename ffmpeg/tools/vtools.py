@@ -3,23 +3,42 @@ Date: 2021.03.01 19:46:08
 LastEditors: Rustle Karl
 LastEditTime: 2021.05.24 07:34:01
 '''
+from __future__ import annotations
+
+import collections
 import os
+import queue
+import re
+import sys
+import threading
 from pathlib import Path
-from typing import Union
-
-import numpy as np
+from time import monotonic, sleep
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 
 from .. import vfilters
-from .._ffmpeg import input
+from .._dag import topological_sort
+from .._ffmpeg import input, output
 from .._ffprobe import FFprobe
+from .._node import NodeTypes, get_stream_spec_nodes
+from .._stderr import StderrCapture
 from ..constants import PIPE, RAW_VIDEO, RGB24
+from ..nodes import FFmpegError, FilterableStream, InputNode, OutputStream
+
+if TYPE_CHECKING:
+    import numpy as np
 
 __all__ = [
     "assemble_video_from_images",
     "compare_2_videos",
+    "FramePool",
+    "FrameWriter",
+    "SharedFrameReader",
+    "SharedFrameRing",
     "convert_video_to_np_array",
     "generate_video_thumbnail",
     "hstack_videos",
+    "iter_video_frames",
+    "process_video_frames",
     "read_frame_as_jpeg",
     "side_by_side_2_videos",
     "timed_video_screenshot",
@@ -167,12 +186,815 @@ def assemble_video_from_images(glob_pattern, dst, *, pattern_type="glob", frame_
 
 
 def convert_video_to_np_array(src, *, width=0, height=0) -> np.ndarray:
+    '''Decode the whole video into one array, see `iter_video_frames` to stream it.'''
+    import numpy as np
+
     width_, height_ = FFprobe(src).video_scale
     stdout, _ = input(src, enable_cuda=False). \
         output(PIPE, format=RAW_VIDEO, pixel_format=RGB24, enable_cuda=False).run()
     return np.frombuffer(stdout, np.uint8).reshape([-1, height or height_, width or width_, 3])
 
 
+# numpy dtype and samples per pixel of the packed pixel formats frames can be read as
+_pixel_formats = {
+    'gray': ('u1', 1),
+    'gray16le': ('<u2', 1),
+    'grayf32le': ('<f4', 1),
+    'rgb24': ('u1', 3),
+    'bgr24': ('u1', 3),
+    'rgb48le': ('<u2', 3),
+    'rgba': ('u1', 4),
+    'bgra': ('u1', 4),
+    'argb': ('u1', 4),
+    'abgr': ('u1', 4),
+    'rgba64le': ('<u2', 4),
+}
+
+
+class FramePool(object):
+    """A fixed set of preallocated arrays frames are decoded into.
+
+    `acquire` hands out a free array, blocking until another thread releases
+    one, and `release` takes back an array or any view of it. Pass a pool
+    to `iter_video_frames` to decode into the same memory over and over."""
+
+    def __init__(self, count: int, shape: Tuple[int, ...], dtype='u1'):
+        import numpy as np
+
+        self._init(np.empty(shape, dtype) for _ in range(count))
+
+    @classmethod
+    def wrap(cls, arrays: Iterable[np.ndarray]) -> FramePool:
+        """Pool of caller-supplied arrays, all of the same shape and dtype."""
+        pool = cls.__new__(cls)
+        pool._init(arrays)
+        return pool
+
+    def _init(self, arrays: Iterable[np.ndarray]):
+        self._arrays = list(arrays)
+        if not self._arrays:
+            raise ValueError('A frame pool needs at least one array')
+
+        for array in self._arrays:
+            if array.base is not None or not array.flags.c_contiguous or not array.flags.writeable:
+                raise ValueError('Pooled arrays must own contiguous, writeable memory')
+            if (array.shape, array.dtype) != (self.shape, self.dtype):
+                raise ValueError('Pooled arrays must all have the same shape and dtype')
+
+        self._indices = {id(array): index for index, array in enumerate(self._arrays)}
+        self._free = collections.deque(range(len(self._arrays)))
+        self._condition = threading.Condition()
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self._arrays[0].shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._arrays[0].dtype
+
+    @property
+    def free(self) -> int:
+        return len(self._free)
+
+    def acquire(self, timeout: float = None) -> np.ndarray:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._free, timeout):
+                raise TimeoutError(f'No frame released within {timeout} seconds, '
+                                   f'all {len(self._arrays)} are in use')
+            return self._arrays[self._free.popleft()]
+
+    def release(self, frame: np.ndarray):
+        owner = frame if frame.base is None else frame.base
+        index = self._indices.get(id(owner))
+        if index is None or owner is not self._arrays[index]:
+            raise ValueError('Frame does not belong to this pool')
+
+        with self._condition:
+            if index in self._free:
+                raise ValueError('Frame released twice')
+            self._free.append(index)
+            self._condition.notify()
+
+    def __len__(self):
+        return len(self._arrays)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self.free}/{len(self)} free shape={self.shape} dtype={self.dtype}>'
+
+
+def _read_into(stream, buffer: memoryview) -> int:
+    # Large reads bypass the pipe buffer and land straight in `buffer`
+    filled = 0
+    while filled < len(buffer):
+        size = stream.readinto(buffer[filled:])
+        if not size:
+            break
+        filled += size
+    return filled
+
+
+def _get_rawvideo_output(src, width: int, height: int, pixel_format: str, stride: int,
+                         enable_cuda: bool) -> Tuple[OutputStream, Tuple[int, int, int], str]:
+    # `src` decoded to rawvideo on stdout, the frame shape and numpy dtype
+    if pixel_format not in _pixel_formats:
+        raise ValueError(f'Unsupported pixel format {pixel_format!r}, choose from {", ".join(_pixel_formats)}')
+
+    if isinstance(src, FilterableStream):
+        stream = src
+    else:
+        stream = input(src, enable_cuda=enable_cuda)
+
+    if not width or not height:
+        width_, height_ = FFprobe(_get_input_node(stream).source).video_scale
+        if width:
+            height = round(height_ * width / width_)
+        elif height:
+            width = round(width_ * height / height_)
+        else:
+            width, height = width_, height_
+
+    if stride > 1:
+        stream = stream.select(f'not(mod(n,{stride}))')
+
+    stream = stream.scale(w=width, h=height). \
+        output(PIPE, format=RAW_VIDEO, pixel_format=pixel_format, vsync='passthrough', enable_cuda=False)
+
+    dtype, channels = _pixel_formats[pixel_format]
+    return stream, (height, width, channels), dtype
+
+
+def iter_video_frames(src, *, width=0, height=0, pixel_format=RGB24, stride=1, batch_size=0,
+                      pool: FramePool = None, timeout: float = None, enable_cuda=False) -> Iterator[np.ndarray]:
+    '''Decode a video frame by frame, holding at most one batch in memory.
+
+    `src` is a file or a `FilterableStream` reading one input. Yields arrays
+    shaped (height, width, channels), or (frames, height, width, channels) with
+    up to `batch_size` frames when given. Frames are scaled to `width` x
+    `height`, a missing side keeps the aspect ratio of the probed source. Only
+    every `stride`-th frame is decoded to rawvideo.
+
+    With a `pool`, frames are decoded straight into its arrays and yielded as
+    views of them, nothing is allocated per frame. The pool must hold arrays of
+    the yielded shape and each frame must be released back to the pool, the next
+    frame waits up to `timeout` seconds for a free array.'''
+    import numpy as np
+
+    stream, frame_shape, dtype = _get_rawvideo_output(src, width, height, pixel_format, stride, enable_cuda)
+    dtype = np.dtype(dtype)
+    frame_size = int(np.prod(frame_shape)) * dtype.itemsize
+    buffer_shape = (batch_size, *frame_shape) if batch_size else frame_shape
+
+    if pool is not None and (pool.shape, pool.dtype) != (buffer_shape, dtype):
+        raise ValueError(f'Pool holds {pool.shape} {pool.dtype} arrays, '
+                         f'frames need {buffer_shape} {dtype}')
+
+    process = stream.run_async(print_cmd=False)
+    stderr = StderrCapture(64)
+    drain = stderr.drain(process.stderr)
+
+    try:
+        while True:
+            if pool is None:
+                array = np.empty(buffer_shape, dtype)
+            else:
+                array = pool.acquire(timeout)
+
+            filled = _read_into(process.stdout, memoryview(array.reshape(-1).view(np.uint8)))
+            frames = filled // frame_size
+
+            if not frames:
+                if pool is not None:
+                    pool.release(array)
+            elif not batch_size:
+                yield array
+            elif frames < batch_size:
+                yield array[:frames]
+            else:
+                yield array
+
+            if filled < array.nbytes:
+                break
+
+        process.wait()
+    finally:
+        if process.poll() is None:  # stopped early
+            process.kill()
+        process.stdout.close()
+        process.wait()
+        drain.join()
+
+    if process.returncode:
+        raise FFmpegError('ffmpeg', None, stderr.tail)
+
+
+def _get_input_node(stream: FilterableStream) -> InputNode:
+    sorted_nodes, _ = topological_sort([stream.Node])
+    nodes = [node for node in sorted_nodes if node.Type == NodeTypes.Input]
+    if len(nodes) != 1:
+        raise ValueError(f'{stream} reads {len(nodes)} inputs, give the frame size')
+    return nodes[0]
+
+
+def _get_pipe_input(stream: OutputStream) -> Tuple[str, int, int]:
+    # pixel format, width and height of the rawvideo read from stdin
+    sorted_nodes, _ = topological_sort(get_stream_spec_nodes(stream))
+    for node in sorted_nodes:
+        if node.Type == NodeTypes.Input and node.source in {PIPE, 'pipe:0', '-'}:
+            kwargs = node._kwargs
+            size = kwargs.get('s') or kwargs.get('video_size')
+            pixel_format = kwargs.get('pix_fmt') or kwargs.get('pixel_format')
+
+            if kwargs.get('f') != RAW_VIDEO or not size:
+                raise ValueError(f'{node} must read {RAW_VIDEO} with a frame size')
+            if pixel_format not in _pixel_formats:
+                raise ValueError(f'Unsupported pixel format {pixel_format!r}, '
+                                 f'choose from {", ".join(_pixel_formats)}')
+
+            width, height = map(int, str(size).split('x'))
+            return pixel_format, width, height
+
+    raise ValueError(f'{stream} has no input reading from {PIPE}')
+
+
+class FrameWriter(object):
+    """Encode numpy frames by feeding them to the stdin of an ffmpeg process.
+
+    `stream` must read rawvideo from `pipe:`, its input gives the frame size and
+    pixel format. Frames are written on a background thread, `write` blocks while
+    `queue_size` frames or batches are waiting, so a producer faster than the
+    encoder is held back instead of buffering the video in memory.
+
+    Queued arrays are written as they are, without a copy, so they must not be
+    modified until written, see `flush`. Closing waits for ffmpeg to finish and
+    raises `FFmpegError` if it failed."""
+
+    def __init__(self, stream: OutputStream, *, queue_size=8, executable="ffmpeg", overwrite=True):
+        import numpy as np
+
+        pixel_format, width, height = _get_pipe_input(stream)
+        dtype, channels = _pixel_formats[pixel_format]
+        self._dtype = np.dtype(dtype)
+        self._frame_shape = (height, width, channels)
+
+        self._queue = queue.Queue(queue_size)
+        self._frames = 0
+        self._stats = {}
+        self._broken = False
+        self._closed = False
+
+        self._process = stream.run_async(executable=executable, print_cmd=False, pipe_stdin=True,
+                                         pipe_stdout=False, pipe_stderr=True, overwrite=overwrite)
+        self._stderr = StderrCapture(64, self._parse_stats)
+        self._drain = self._stderr.drain(self._process.stderr)
+        self._writer = threading.Thread(target=self._write_frames, daemon=True)
+        self._writer.start()
+
+    @classmethod
+    def open(cls, dst, width: int, height: int, *, pixel_format=RGB24, frame_rate=25,
+             queue_size=8, **output_kwargs) -> FrameWriter:
+        """Writer encoding frames of the given size to `dst`."""
+        stream = input(PIPE, format=RAW_VIDEO, pixel_format=pixel_format, width=width,
+                       height=height, frame_rate=frame_rate, enable_cuda=False)
+        return cls(stream.output(dst, **output_kwargs), queue_size=queue_size)
+
+    @property
+    def frame_shape(self) -> Tuple[int, int, int]:
+        return self._frame_shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def frames(self) -> int:
+        """Frames handed to ffmpeg so far."""
+        return self._frames
+
+    @property
+    def stats(self) -> Dict[str, str]:
+        """Fields of the last progress line, e.g. `frame`, `fps` and `speed`."""
+        return dict(self._stats)
+
+    @property
+    def speed(self) -> Optional[float]:
+        """Encoding speed reported by ffmpeg as a multiple of real time."""
+        try:
+            return float(self._stats['speed'].rstrip('x'))
+        except (KeyError, ValueError):
+            return None
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._process.poll()
+
+    def write(self, frames: np.ndarray, timeout: float = None):
+        '''Queue one frame shaped `frame_shape`, or a batch of them.
+
+        Frames of another dtype are converted first. Waits up to `timeout`
+        seconds for room in the queue, then raises `TimeoutError`.'''
+        import numpy as np
+
+        if self._closed:
+            raise ValueError('Write to a closed frame writer')
+        if self._broken:
+            self._stopped()
+
+        array = np.ascontiguousarray(frames, self._dtype)
+        if array.shape == self._frame_shape:
+            count = 1
+        elif array.shape[1:] == self._frame_shape:
+            count = len(array)
+        else:
+            raise ValueError(f'Expected frames shaped {self._frame_shape} or batches of them, got {array.shape}')
+
+        if count:
+            try:
+                self._queue.put((memoryview(array).cast('B'), count), timeout=timeout)
+            except queue.Full:
+                raise TimeoutError(f'ffmpeg took no frame within {timeout} seconds') from None
+
+    def flush(self):
+        '''Wait until every queued frame has been written to ffmpeg.'''
+        self._queue.join()
+
+    def close(self):
+        '''Finish the stream and wait for ffmpeg to exit.'''
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._writer.join()
+            self._process.wait()
+            self._drain.join()
+
+        if self._process.returncode:
+            raise FFmpegError('ffmpeg', None, self._stderr.tail)
+
+    def abort(self):
+        '''Kill ffmpeg, dropping the queued frames.'''
+        self._process.kill()
+        try:
+            self.close()
+        except FFmpegError:
+            pass
+
+    def _stopped(self):
+        self.close()
+        raise BrokenPipeError(f'ffmpeg stopped reading frames after {self._frames} frames')
+
+    def _write_frames(self):
+        stdin = self._process.stdin
+
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    break
+                if not self._broken:
+                    data, count = item
+                    stdin.write(data)
+                    self._frames += count
+            except OSError:  # ffmpeg exited, keep taking frames so writers never block
+                self._broken = True
+            finally:
+                self._queue.task_done()
+
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+    def _parse_stats(self, line: str):
+        if line.startswith('frame='):
+            self._stats = dict(re.findall(r'(\w+)=\s*(\S+)', line))
+
+    def __enter__(self) -> FrameWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} frames={self._frames} shape={self._frame_shape} dtype={self._dtype}>'
+
+
+def _put(items: queue.Queue, item, stop: threading.Event) -> bool:
+    # Blocks while the queue is full, gives up once the consumer has stopped
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def _iter_queue(items: queue.Queue) -> Iterator:
+    while True:
+        item = items.get()
+        if item is None:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def _decode_frames(frames: Iterator[np.ndarray], items: queue.Queue, stop: threading.Event):
+    end = None
+    try:
+        for frame in frames:
+            if not _put(items, frame, stop):
+                return
+    except Exception as e:
+        end = e
+    finally:
+        frames.close()
+
+    _put(items, end, stop)
+
+
+def _process_frames(frames: Iterator[np.ndarray], func: Callable[[np.ndarray], np.ndarray],
+                    workers: int, queue_size: int) -> Iterator[np.ndarray]:
+    if not workers:
+        for frame in frames:
+            yield func(frame)
+        return
+
+    import pickle
+    from concurrent.futures import ProcessPoolExecutor
+
+    # Failing in the pool instead leaves it and the decoder waiting on each other
+    try:
+        pickle.dumps(func)
+    except Exception as e:
+        raise TypeError(f'{func!r} must be picklable to run in worker processes, '
+                        f'define it at module level') from e
+
+    executor = ProcessPoolExecutor(workers)
+    pending = collections.deque()
+    try:
+        for frame in frames:
+            pending.append(executor.submit(func, frame))
+            if len(pending) >= queue_size:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    else:
+        executor.shutdown()
+
+
+def process_video_frames(src, dst, func: Callable[[np.ndarray], np.ndarray], *, width=0, height=0,
+                         pixel_format=RGB24, batch_size=0, frame_rate: float = None, keep_audio: bool = None,
+                         queue_size=8, workers=0, enable_cuda=False, **output_kwargs) -> int:
+    '''Decode `src`, pass the frames through `func` and encode what it returns to `dst`.
+
+    `src` is a file or a `FilterableStream` reading one input, decoded as by
+    `iter_video_frames`. `func` takes a frame, or a batch with `batch_size`, and
+    returns one in the same pixel format, its size may differ. The frame rate
+    defaults to the probed source's. Returns the number of frames encoded.
+
+    The audio of the input is copied unless `keep_audio` is false. It is copied
+    as is, so by default only if `src` is not filtered, filters trimming the
+    video or changing its timing would put it out of sync. `keep_audio` with
+    a filtered `src` raises `ValueError`.
+
+    Decoding, `func` and encoding run concurrently, with at most `queue_size`
+    frames or batches waiting between them. With `workers`, `func` runs in a
+    pool of that many processes and must be picklable.'''
+    if not isinstance(src, FilterableStream):
+        src = input(src, enable_cuda=enable_cuda)
+
+    source = _get_input_node(src)
+    if keep_audio is None:
+        keep_audio = src.Node is source
+    elif keep_audio and src.Node is not source:
+        raise ValueError("Can't keep the audio of a filtered `src` in sync with its video, "
+                         "pass keep_audio=False and add the audio to the output")
+
+    if frame_rate is None:
+        frame_rate = FFprobe(source.source).video_frame_rate
+
+    frames = iter_video_frames(src, width=width, height=height, pixel_format=pixel_format,
+                               batch_size=batch_size)
+    items = queue.Queue(queue_size)
+    stop = threading.Event()
+    decoder = threading.Thread(target=_decode_frames, args=(frames, items, stop), daemon=True)
+    decoder.start()
+
+    writer = None
+    try:
+        for result in _process_frames(_iter_queue(items), func, workers, queue_size):
+            if writer is None:
+                height_, width_ = result.shape[-3:-1]
+                streams = [input(PIPE, format=RAW_VIDEO, pixel_format=pixel_format, width=width_,
+                                 height=height_, frame_rate=frame_rate, enable_cuda=False)]
+                if keep_audio:
+                    kwargs = {key: value for key, value in source._kwargs.items()
+                              if key not in {'hwaccel', 'vcodec'}}
+                    streams.append(InputNode(kwargs=kwargs).stream()['a?'])
+                    output_kwargs.setdefault('acodec', 'copy')
+                writer = FrameWriter(output(*streams, dst, **output_kwargs), queue_size=queue_size)
+
+            writer.write(result)
+
+        if writer is None:
+            return 0
+
+        writer.close()
+        return writer.frames
+    except BaseException:
+        if writer is not None:
+            writer.abort()
+        raise
+    finally:
+        stop.set()
+        decoder.join()
+
+
+# A shared frame ring starts with these int64 fields, followed by the sequence
+# number of the frame in each slot, the next sequence number each reader wants
+# and, 64-byte aligned, the frames
+_RING_PUBLISHED, _RING_STATE, _RING_SLOTS, _RING_READERS, _RING_HEIGHT, _RING_WIDTH, \
+    _RING_PIXEL_FORMAT, _RING_POLICY = range(8)
+_RING_FIELDS = 8
+_RING_RUNNING, _RING_FINISHED, _RING_FAILED = range(3)
+_RING_DETACHED = -1
+_ring_policies = ('block', 'drop')
+
+
+def _get_ring_offset(slots: int, readers: int) -> int:
+    return (_RING_FIELDS + slots + readers) * 8 + 63 & ~63
+
+
+def _map_ring(buffer, slots: int, readers: int, frame_shape: Tuple[int, ...], dtype) -> Tuple[np.ndarray, ...]:
+    import numpy as np
+
+    fields = np.ndarray((_RING_FIELDS + slots + readers,), np.int64, buffer)
+    frames = np.ndarray((slots, *frame_shape), dtype, buffer, _get_ring_offset(slots, readers))
+    return fields[:_RING_FIELDS], fields[_RING_FIELDS:-readers], fields[-readers:], frames
+
+
+class SharedFrameRing(object):
+    """Decodes a video once into a ring of `slots` frames in shared memory.
+
+    Up to `readers` processes attach to it by `name` with `SharedFrameReader`
+    and read the frames in place. With the 'block' policy decoding waits for the
+    slowest attached reader, so every reader sees every frame from when it
+    attached. With 'drop' it never waits, a reader falling more than `slots`
+    frames behind skips ahead.
+
+    `run` decodes, usually on a thread of the owning process, readers attached
+    before it see the first frame, `wait_attached` waits for them. Closing the
+    ring frees the shared memory."""
+
+    def __init__(self, src, *, width=0, height=0, pixel_format=RGB24, stride=1, slots=8, readers=1,
+                 policy='block', name: str = None, enable_cuda=False):
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        if policy not in _ring_policies:
+            raise ValueError(f'Unsupported policy {policy!r}, choose from {", ".join(_ring_policies)}')
+        if slots < 1 or readers < 1:
+            raise ValueError('A frame ring needs at least one slot and one reader')
+
+        self._stream, frame_shape, dtype = _get_rawvideo_output(src, width, height, pixel_format,
+                                                                stride, enable_cuda)
+        self._policy = policy
+        self._frame_size = int(np.prod(frame_shape)) * np.dtype(dtype).itemsize
+
+        size = _get_ring_offset(slots, readers) + slots * self._frame_size
+        self._memory = shared_memory.SharedMemory(name, create=True, size=size)
+        self._fields, self._sequences, self._cursors, self._frames = \
+            _map_ring(self._memory.buf, slots, readers, frame_shape, dtype)
+
+        self._fields[:] = (0, _RING_RUNNING, slots, readers, frame_shape[0], frame_shape[1],
+                           list(_pixel_formats).index(pixel_format), _ring_policies.index(policy))
+        self._sequences[:] = -1
+        self._cursors[:] = _RING_DETACHED  # until a reader claims its index
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def frames(self) -> int:
+        """Frames published so far."""
+        return int(self._fields[_RING_PUBLISHED])
+
+    @property
+    def attached(self) -> int:
+        """Readers attached at the moment."""
+        return int((self._cursors != _RING_DETACHED).sum())
+
+    def wait_attached(self, readers: int = None, timeout: float = None, poll=0.001):
+        '''Wait until `readers` readers, all of them by default, are attached,
+        e.g. before `run` for none of them to miss a frame. Raises `TimeoutError`
+        after `timeout` seconds.'''
+        readers = len(self._cursors) if readers is None else readers
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while self.attached < readers:
+            if deadline is not None and monotonic() > deadline:
+                raise TimeoutError(f'{self.attached} of {readers} readers attached within {timeout} seconds')
+            sleep(poll)
+
+    def run(self, timeout: float = None, poll=0.001) -> int:
+        '''Decode into the ring until the video ends, returns the number of frames.
+
+        With the 'block' policy, raises `TimeoutError` if readers hold on to
+        a slot for more than `timeout` seconds.'''
+        import numpy as np
+
+        slots = len(self._sequences)
+        process = self._stream.run_async(print_cmd=False)
+        stderr = StderrCapture(64)
+        drain = stderr.drain(process.stderr)
+
+        sequence = 0
+        try:
+            while True:
+                slot = sequence % slots
+                if self._policy == 'block' and sequence >= slots:
+                    self._wait_for_readers(sequence - slots, timeout, poll)
+
+                self._sequences[slot] = -1
+                filled = _read_into(process.stdout, memoryview(self._frames[slot].reshape(-1).view(np.uint8)))
+                if filled < self._frame_size:
+                    break
+
+                self._sequences[slot] = sequence
+                sequence += 1
+                self._fields[_RING_PUBLISHED] = sequence
+
+            process.wait()
+        except BaseException:
+            self._fields[_RING_STATE] = _RING_FAILED
+            raise
+        finally:
+            if process.poll() is None:  # stopped early
+                process.kill()
+            process.stdout.close()
+            process.wait()
+            drain.join()
+
+        if process.returncode:
+            self._fields[_RING_STATE] = _RING_FAILED
+            raise FFmpegError('ffmpeg', None, stderr.tail)
+
+        self._fields[_RING_STATE] = _RING_FINISHED
+        return sequence
+
+    def _wait_for_readers(self, sequence: int, timeout: float, poll: float):
+        # The slot of `sequence` is free once every attached reader has moved past it
+        deadline = None if timeout is None else monotonic() + timeout
+
+        while ((self._cursors != _RING_DETACHED) & (self._cursors <= sequence)).any():
+            if deadline is not None and monotonic() > deadline:
+                raise TimeoutError(f'Readers held frame {sequence} for more than {timeout} seconds')
+            sleep(poll)
+
+    def close(self):
+        '''Free the shared memory, readers still attached keep their mapping.'''
+        if self._memory is not None:
+            self._fields = self._sequences = self._cursors = self._frames = None
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def __enter__(self) -> SharedFrameRing:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} {self._memory.name if self._memory else "closed"} policy={self._policy}>'
+
+
+class SharedFrameReader(object):
+    """Reads the frames of a `SharedFrameRing` in another process.
+
+    `index` picks which of the ring's reader slots this reader claims, until
+    it is closed. It starts at the oldest frame still in the ring. Iterating
+    yields `(sequence, frame)` pairs, the frame is a view into shared memory
+    that stays valid until the next frame is requested, with the 'drop' policy
+    only while the reader keeps up. `dropped` counts the frames skipped.
+
+    Before Python 3.13, attach only from processes started by `multiprocessing`
+    in the process owning the ring, others remove the memory when they exit."""
+
+    def __init__(self, name: str, index=0, *, timeout: float = None, poll=0.001):
+        import numpy as np
+        from multiprocessing import shared_memory
+
+        if sys.version_info >= (3, 13):
+            self._memory = shared_memory.SharedMemory(name, track=False)
+        else:
+            self._memory = shared_memory.SharedMemory(name)
+
+        fields = np.ndarray((_RING_FIELDS,), np.int64, self._memory.buf)
+        slots, readers, height, width, pixel_format, policy = \
+            map(int, fields[_RING_SLOTS:_RING_POLICY + 1])
+        del fields
+
+        if not 0 <= index < readers:
+            self._memory.close()
+            raise ValueError(f'Reader index {index} out of range, the ring has {readers} readers')
+
+        dtype, channels = _pixel_formats[list(_pixel_formats)[pixel_format]]
+        self._fields, self._sequences, self._cursors, self._frames = \
+            _map_ring(self._memory.buf, slots, readers, (height, width, channels), dtype)
+
+        if self._cursors[index] != _RING_DETACHED:
+            self._fields = self._sequences = self._cursors = self._frames = None
+            self._memory.close()
+            raise ValueError(f'Reader index {index} is already attached')
+        self._cursors[index] = max(0, int(self._fields[_RING_PUBLISHED]) - slots)
+
+        self._index = index
+        self._policy = _ring_policies[policy]
+        self._timeout = timeout
+        self._poll = poll
+        self._dropped = 0
+
+    @property
+    def frame_shape(self) -> Tuple[int, int, int]:
+        return self._frames.shape[1:]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._frames.dtype
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def __iter__(self) -> Iterator[Tuple[int, np.ndarray]]:
+        slots = len(self._sequences)
+        sequence = int(self._cursors[self._index])
+        if self._policy == 'drop':
+            sequence = max(0, int(self._fields[_RING_PUBLISHED]) - slots)
+        self._cursors[self._index] = sequence
+
+        deadline = None
+        while True:
+            state = self._fields[_RING_STATE]
+            published = int(self._fields[_RING_PUBLISHED])
+
+            if sequence < published:
+                deadline = None
+                if published - sequence > slots:  # overtaken by the decoder
+                    self._dropped += published - slots - sequence
+                    sequence = published - slots
+
+                slot = sequence % slots
+                if self._sequences[slot] == sequence:
+                    yield sequence, self._frames[slot]
+                else:  # overwritten while looking at it
+                    self._dropped += 1
+
+                sequence += 1
+                self._cursors[self._index] = sequence
+            elif state == _RING_FINISHED:
+                return
+            elif state == _RING_FAILED:
+                raise FFmpegError('ffmpeg', None, b'Decoding into the shared frame ring failed')
+            else:
+                if deadline is None and self._timeout is not None:
+                    deadline = monotonic() + self._timeout
+                if deadline is not None and monotonic() > deadline:
+                    raise TimeoutError(f'No frame decoded within {self._timeout} seconds')
+                sleep(self._poll)
+
+    def close(self):
+        '''Detach from the ring, frames yielded before must no longer be used.'''
+        if self._memory is not None:
+            self._cursors[self._index] = _RING_DETACHED
+            self._fields = self._sequences = self._cursors = self._frames = None
+            self._memory.close()
+            self._memory = None
+
+    def __enter__(self) -> SharedFrameReader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __repr__(self):
+        return f'<{type(self).__name__} index={self._index} policy={self._policy} dropped={self._dropped}>'
+
+
 def read_frame_as_jpeg(src, frame=1) -> bytes:
     raw, _ = input(src, enable_cuda=False).select(f"gte(n, {frame})"). \
         output(PIPE, vframes=1, format='image2', vcodec='mjpeg', enable_cuda=False). \
@@ -0,0 +1,43 @@
+'''
+Date: 2026.10.18 22:58:31
+Description: Parsing what ffmpeg prints about its filters, run `python -m pytest tests`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 22:58:31
+'''
+from ffmpeg._capabilities import _parse_filter_options
+
+# Trimmed ``ffmpeg -h filter=scale`` of ffmpeg 7.0
+SCALE_HELP = '''\
+Filter scale
+  Scale the input video size and/or convert the image format.
+    Inputs:
+       #0: default (video)
+    Outputs:
+       #0: default (video)
+scale(2ref) AVOptions:
+   w                 <string>     ..FV.....T. Output video width
+   flags             <string>     ..FV....... Flags to pass to libswscale (default "")
+   eval              <int>        ..FV....... specify when to evaluate expressions (from 0 to 1) (default init)
+     init            0            ..FV....... eval expressions once during initialization
+
+SWScaler AVOptions:
+  -sws_flags         <flags>      E..V....... scaler flags (default bicubic)
+     bilinear                     E..V....... bilinear
+  -sws_dither        <int>        E..V....... set dithering algorithm (from 0 to 6) (default auto)
+  -alphablend        <int>        E..V....... mode for alpha -> non alpha (from 0 to 2) (default none)
+  -threads           <int>        E..V....... number of threads (from 0 to INT_MAX) (default 1)
+
+This filter has support for timeline through the 'enable' option.
+'''
+
+
+def test_filter_options_include_passed_on_classes():
+    options = _parse_filter_options(SCALE_HELP)
+    assert {'w', 'flags', 'eval', 'sws_flags', 'sws_dither', 'alphablend', 'enable'} <= options.keys()
+    assert 'init' not in options and 'bilinear' not in options
+
+
+def test_filter_options_include_generic_ones():
+    options = _parse_filter_options('Filter hflip\n  Horizontally flip the input video.\n')
+    assert {'threads', 'thread_type', 'extra_hw_frames'} <= options.keys()
+    assert 'enable' not in options
@@ -0,0 +1,56 @@
+'''
+Date: 2026.10.18 22:40:16
+Description: Rewriting passes, run `python -m pytest tests`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 22:40:16
+'''
+import pytest
+
+from ffmpeg import input, settings
+
+
+@pytest.fixture(autouse=True)
+def _settings(monkeypatch):
+    monkeypatch.setattr(settings, 'CUDA_ENABLE', False)
+    monkeypatch.setattr(settings, 'ELIMINATE_NO_OPS', True)
+
+
+def get_filters_spec(args):
+    return args[args.index('-filter_complex') + 1]
+
+
+@pytest.mark.parametrize('no_op, tag', [
+    (lambda source: source.filter('null'), '[0]'),
+    (lambda source: source.video.null(), '[0:v]'),
+    (lambda source: source.split()[0], '[0]'),
+])
+def test_no_op_between_input_and_output_is_kept(no_op, tag):
+    # its -map selects the streams written
+    args = no_op(input('in.mp4')).output('out.mp4').get_output_args()
+    assert get_filters_spec(args).startswith(tag)
+    assert '-map' in args
+
+
+def test_no_op_before_filter_is_removed():
+    args = input('in.mp4').null().hflip().output('out.mp4').get_output_args()
+    assert get_filters_spec(args) == '[0]hflip[tag0]'
+
+
+def probe_of(**stream):
+    return {'in.mp4': {'streams': [{'codec_type': 'video', 'width': 320, 'height': 240,
+                                    'start_time': '0.000000', **stream}]}}
+
+
+def test_scale_to_probed_size_is_removed():
+    stream = input('in.mp4').scale(320, 240).hflip().output('out.mp4')
+    assert get_filters_spec(stream.get_output_args(probes=probe_of())) == '[0]hflip[tag0]'
+
+
+@pytest.mark.parametrize('rotation', [
+    {'tags': {'rotate': '90'}},
+    {'side_data_list': [{'side_data_type': 'Display Matrix', 'rotation': -90}]},
+])
+def test_scale_of_rotated_input_is_kept(rotation):
+    # ffmpeg autorotates it, the frames are 240x320
+    stream = input('in.mp4').scale(320, 240).hflip().output('out.mp4')
+    assert get_filters_spec(stream.get_output_args(probes=probe_of(**rotation))) == '[0]scale=320:240,hflip[tag0]'
@@ -0,0 +1,69 @@
+'''
+Date: 2026.10.18 23:12:05
+Description: FFmpegProcess on real processes, run `python -m pytest tests`
+LastEditors: Rustle Karl
+LastEditTime: 2026.10.18 23:12:05
+'''
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from ffmpeg import nodes
+from ffmpeg.nodes import FFmpegProcess, write_filter_script
+
+
+def start(code: str, **kwargs) -> FFmpegProcess:
+    # Any program shows how the process is reaped, a Python one runs everywhere
+    return FFmpegProcess([sys.executable, '-c', code], **kwargs)
+
+
+@pytest.fixture(params=[True, False], ids=['wait4', 'popen'])
+def reaping(request, monkeypatch):
+    if request.param and not nodes._REAP_WITH_WAIT4:
+        pytest.skip('os.wait4 or the Popen internals are missing')
+    monkeypatch.setattr(nodes, '_REAP_WITH_WAIT4', request.param)
+    return request.param
+
+
+def test_wait(reaping):
+    process = start('import sys; sys.exit(3)')
+    assert process.wait(timeout=30) == 3
+    assert process.returncode == 3
+    assert (process.usage is not None) == reaping
+
+
+def test_poll(reaping):
+    process = start('import time; time.sleep(0.2)')
+    assert process.poll() is None
+
+    deadline = time.monotonic() + 30
+    while process.poll() is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert process.returncode == 0
+    assert (process.usage is not None) == reaping
+    assert process.wait() == 0
+
+
+def test_communicate_timeout(reaping):
+    process = start('import sys, time; sys.stdout.write(sys.stdin.read()); time.sleep(60)',
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    with pytest.raises(subprocess.TimeoutExpired):
+        process.communicate(b'frames', timeout=0.5)
+
+    process.kill()
+    stdout, _ = process.communicate(timeout=30)
+    assert stdout == b'frames'
+    assert process.returncode != 0
+    assert (process.usage is not None) == reaping
+
+
+def test_filter_script_removed_on_exit(reaping):
+    path = write_filter_script('null')
+    process = FFmpegProcess([sys.executable, '-c', 'pass', '-filter_complex_script', path])
+    assert process.wait(timeout=30) == 0
+    assert not os.path.exists(path)